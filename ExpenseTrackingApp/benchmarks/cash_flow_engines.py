@@ -0,0 +1,107 @@
+"""Compare the object and columnar cash-flow report engines.
+
+Synthetic transactions are generated in memory; no database is needed. The
+largest default size needs several gigabytes of RAM for the source objects.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Sequence
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from expense_tracking.reporting.cash_flow import (
+    ALLOWED_TRANSACTION_TYPES,
+    ReportTransaction,
+    build_cash_flow_report,
+)
+from expense_tracking.reporting.columnar import (
+    TransactionColumns,
+    build_cash_flow_report_columnar,
+)
+
+
+DEFAULT_SIZES = (10_000, 1_000_000, 10_000_000)
+PERIOD_START = date(2016, 1, 1)
+PERIOD_END = date(2025, 12, 31)
+
+
+def synthetic_transactions(count: int, *, seed: int = 0) -> list[ReportTransaction]:
+    generator = random.Random(seed)
+    days = (PERIOD_END - PERIOD_START).days + 1
+    return [
+        ReportTransaction(
+            id=index,
+            occurred_on=PERIOD_START + timedelta(days=generator.randrange(days)),
+            transaction_type=ALLOWED_TRANSACTION_TYPES[generator.randrange(3)],
+            amount=Decimal(generator.randrange(1, 500_000)).scaleb(-2),
+            description="Benchmark transaction",
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Transaction counts to benchmark (default: 10k, 1M and 10M).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    print(
+        f"{'rows':>11} {'object s':>10} {'to columns s':>13} "
+        f"{'columnar s':>11} {'speedup':>8}"
+    )
+    for size in args.sizes:
+        transactions = synthetic_transactions(size)
+        expected, object_seconds = timed(
+            build_cash_flow_report,
+            transactions,
+            PERIOD_START,
+            PERIOD_END,
+        )
+        columns, convert_seconds = timed(
+            TransactionColumns.from_transactions,
+            transactions,
+        )
+        actual, columnar_seconds = timed(
+            build_cash_flow_report_columnar,
+            columns,
+            PERIOD_START,
+            PERIOD_END,
+        )
+        if actual != expected:
+            print(f"Columnar report differs from the object report at {size} rows")
+            return 1
+        print(
+            f"{size:>11,} {object_seconds:>10.3f} {convert_seconds:>13.3f} "
+            f"{columnar_seconds:>11.3f} {object_seconds / columnar_seconds:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
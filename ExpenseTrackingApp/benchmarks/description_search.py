@@ -0,0 +1,125 @@
+"""Measure description search latency on a large synthetic transaction table.
+
+The benchmark writes synthetic rows into the selected database and deletes
+them again afterwards, so it should be pointed at a scratch database with
+every migration applied.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Sequence
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import psycopg
+
+from expense_tracking.search import DEFAULT_SEARCH_LIMIT, search_transactions
+
+
+MERCHANTS = (
+    "Costco Wholesale",
+    "Trader Joe's",
+    "Shell Oil",
+    "City Water Utility",
+    "Netflix subscription",
+    "Paycheck Acme Corp",
+    "Index fund purchase",
+    "Corner Bakery",
+    "Hardware Depot",
+    "Pharmacy refill",
+)
+DEFAULT_QUERIES = ("costco", "trader joe", "cosco", "bakery 4242")
+
+POPULATE_SQL = """
+INSERT INTO public.transactions (occurred_on, transaction_type, amount, description)
+SELECT
+    DATE '2000-01-01' + (n %% 9000),
+    (ARRAY['expense', 'income', 'investment'])[1 + n %% 3],
+    (n %% 10000 + 1) / 100.0,
+    merchants[1 + (n * 7919) %% cardinality(merchants)] || ' #' || n
+FROM generate_series(1, %(rows)s) AS n,
+     (SELECT %(merchants)s::text[] AS merchants) AS m
+"""
+
+
+def populate(database: str, rows: int) -> int:
+    """Insert ``rows`` synthetic transactions and return the id before them."""
+
+    with psycopg.connect(dbname=database) as connection:
+        before = connection.execute(
+            "SELECT coalesce(max(id), 0) FROM public.transactions"
+        ).fetchone()[0]
+        connection.execute(POPULATE_SQL, {"rows": rows, "merchants": list(MERCHANTS)})
+    with psycopg.connect(dbname=database, autocommit=True) as connection:
+        connection.execute("ANALYZE public.transactions")
+    return int(before)
+
+
+def delete_synthetic(database: str, before: int) -> None:
+    with psycopg.connect(dbname=database) as connection:
+        connection.execute("DELETE FROM public.transactions WHERE id > %s", (before,))
+
+
+def measure(query: str, *, database: str, repeats: int, limit: int) -> None:
+    search_transactions(query, limit=limit, database=database)
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        results = search_transactions(query, limit=limit, database=database)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, round(len(timings) * 0.95))]
+    print(
+        f"{query!r:<16} {len(results):>5} hits "
+        f"p50 {statistics.median(timings):>8.2f} ms  p95 {p95:>8.2f} ms"
+    )
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database",
+        required=True,
+        help="Scratch PostgreSQL database with the migrations applied.",
+    )
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=DEFAULT_SEARCH_LIMIT)
+    parser.add_argument("--queries", nargs="+", default=list(DEFAULT_QUERIES))
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="Leave the synthetic rows in place for repeated runs.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    started = time.perf_counter()
+    before = populate(args.database, args.rows)
+    print(f"inserted {args.rows:,} rows in {time.perf_counter() - started:.1f} s")
+    try:
+        for query in args.queries:
+            measure(
+                query,
+                database=args.database,
+                repeats=args.repeats,
+                limit=args.limit,
+            )
+    finally:
+        if not args.keep:
+            delete_synthetic(args.database, before)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
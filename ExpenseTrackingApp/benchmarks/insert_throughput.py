@@ -0,0 +1,113 @@
+"""Compare per-row and batched transaction insert throughput.
+
+The benchmark writes synthetic rows into the selected database and deletes
+them again afterwards, so it should be pointed at a scratch database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Sequence
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import psycopg
+
+from expense_tracking.models import (
+    ALLOWED_TRANSACTION_TYPES,
+    InsertedTransaction,
+    Transaction,
+)
+from expense_tracking.transactions import (
+    DEFAULT_BATCH_SIZE,
+    add_transaction,
+    add_transactions,
+)
+
+
+def synthetic_transactions(count: int) -> list[Transaction]:
+    start = date(2000, 1, 1)
+    return [
+        Transaction(
+            occurred_on=start + timedelta(days=index % 3650),
+            transaction_type=ALLOWED_TRANSACTION_TYPES[index % 3],
+            amount=Decimal(index % 10000 + 1).scaleb(-2),
+            description=f"Benchmark transaction {index}",
+        )
+        for index in range(count)
+    ]
+
+
+def delete_inserted(
+    database: str,
+    inserted: Sequence[InsertedTransaction],
+) -> None:
+    with psycopg.connect(dbname=database) as connection:
+        connection.execute(
+            "DELETE FROM public.transactions WHERE id = ANY(%s)",
+            ([transaction.id for transaction in inserted],),
+        )
+
+
+def measure(
+    label: str,
+    insert: Callable[[], Sequence[InsertedTransaction]],
+    *,
+    database: str,
+) -> float:
+    started = time.perf_counter()
+    inserted = insert()
+    elapsed = time.perf_counter() - started
+    delete_inserted(database, inserted)
+    rate = len(inserted) / elapsed if elapsed else float("inf")
+    print(f"{label:<12} {len(inserted):>8} rows {elapsed:>9.3f} s {rate:>12,.0f} rows/s")
+    return rate
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database",
+        required=True,
+        help="Scratch PostgreSQL database with the migrations applied.",
+    )
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    transactions = synthetic_transactions(args.rows)
+
+    per_row = measure(
+        "per-row",
+        lambda: [
+            add_transaction(transaction, args.database)
+            for transaction in transactions
+        ],
+        database=args.database,
+    )
+    batched = measure(
+        "batched",
+        lambda: add_transactions(
+            transactions,
+            args.database,
+            batch_size=args.batch_size,
+        ),
+        database=args.database,
+    )
+    print(f"speedup      {batched / per_row:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
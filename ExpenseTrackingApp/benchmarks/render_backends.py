@@ -0,0 +1,75 @@
+"""Compare Quarto and in-process Python report rendering times.
+
+Both backends read the same period from the selected database. Quarto must
+be installed for its timings; pass ``--backends python`` to skip it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Sequence
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from expense_tracking.config import REPORT_BACKENDS
+from expense_tracking.reports import ReportPeriod, generate_report
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database",
+        required=True,
+        help="PostgreSQL database with the migrations applied.",
+    )
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2026, 1, 1))
+    parser.add_argument("--end", type=date.fromisoformat, default=date(2026, 12, 31))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=REPORT_BACKENDS,
+        default=list(REPORT_BACKENDS),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    period = ReportPeriod.for_range(args.start, args.end)
+    medians: dict[str, float] = {}
+    with TemporaryDirectory() as temp_dir:
+        for backend in args.backends:
+            timings = []
+            for run in range(args.repeat):
+                output = Path(temp_dir) / f"{backend}-{run}.html"
+                started = time.perf_counter()
+                generate_report(
+                    period=period,
+                    database=args.database,
+                    output_path=output,
+                    backend=backend,
+                )
+                timings.append(time.perf_counter() - started)
+            medians[backend] = statistics.median(timings)
+            print(
+                f"{backend:<8} median {medians[backend]:>8.3f} s "
+                f"min {min(timings):>8.3f} s "
+                f"size {output.stat().st_size / 1_000_000:>6.2f} MB"
+            )
+    if len(medians) == 2:
+        print(f"speedup  {medians['quarto'] / medians['python']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+"""Measure per-type lookups on the report rendering path.
+
+The dashboard asks a report for every type's transactions and subtotal.
+This compares the partitions and subtotals the builders store on the
+report with scanning the full transaction tuple on every call, as reports
+did before partitioning.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Sequence
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.cash_flow_engines import (
+    PERIOD_END,
+    PERIOD_START,
+    synthetic_transactions,
+)
+from expense_tracking.reporting.cash_flow import (
+    ALLOWED_TRANSACTION_TYPES,
+    ZERO,
+    CashFlowReport,
+    ReportTransaction,
+    build_cash_flow_report,
+)
+
+
+def scanned_transactions_for(
+    report: CashFlowReport,
+    transaction_type: str,
+) -> tuple[ReportTransaction, ...]:
+    return tuple(
+        transaction
+        for transaction in report.transactions
+        if transaction.transaction_type == transaction_type
+    )
+
+
+def scanned_subtotal_for(report: CashFlowReport, transaction_type: str) -> Decimal:
+    return sum(
+        (
+            transaction.amount
+            for transaction in scanned_transactions_for(report, transaction_type)
+        ),
+        ZERO,
+    )
+
+
+def render_path(report: CashFlowReport, transactions_for, subtotal_for) -> float:
+    """Time the lookups made by one dashboard render."""
+
+    started = time.perf_counter()
+    for transaction_type in ALLOWED_TRANSACTION_TYPES:
+        transactions_for(report, transaction_type)
+        subtotal_for(report, transaction_type)
+    return time.perf_counter() - started
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    transactions = synthetic_transactions(args.rows)
+
+    started = time.perf_counter()
+    report = build_cash_flow_report(transactions, PERIOD_START, PERIOD_END)
+    build_seconds = time.perf_counter() - started
+
+    scanned = render_path(report, scanned_transactions_for, scanned_subtotal_for)
+    indexed = render_path(
+        report,
+        CashFlowReport.transactions_for,
+        CashFlowReport.subtotal_for,
+    )
+    print(f"rows                  {args.rows:>12,}")
+    print(f"build (incl. index)   {build_seconds:>12.3f} s")
+    print(f"render lookups, scan  {scanned:>12.6f} s")
+    print(f"render lookups, index {indexed:>12.6f} s")
+    print(f"saved per render      {scanned - indexed:>12.6f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
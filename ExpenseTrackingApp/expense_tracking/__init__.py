@@ -1,32 +1,90 @@
-"""Reusable services for the expense tracking application."""
-
-from expense_tracking.errors import (
-    DatabaseError,
-    ExpenseTrackingError,
-    QueryLoadError,
-    ReportGenerationError,
-    TransactionError,
-    ValidationError,
-)
-from expense_tracking.reports import ReportPeriod, generate_report
-from expense_tracking.transactions import (
-    ALLOWED_TRANSACTION_TYPES,
-    InsertedTransaction,
-    Transaction,
-    add_transaction,
-)
+"""Reusable services for the expense tracking application.
+
+Public names are imported on first use; see ``expense_tracking.lazy``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from expense_tracking.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from expense_tracking.browse import (
+        PageCursor,
+        TransactionFilter,
+        TransactionPage,
+        browse_transactions,
+    )
+    from expense_tracking.errors import (
+        DatabaseError,
+        ExpenseTrackingError,
+        QueryLoadError,
+        ReportGenerationError,
+        TransactionError,
+        ValidationError,
+    )
+    from expense_tracking.models import (
+        ALLOWED_TRANSACTION_TYPES,
+        InsertedTransaction,
+        Transaction,
+    )
+    from expense_tracking.reports import ReportPeriod, generate_report
+    from expense_tracking.search import search_transactions
+    from expense_tracking.transactions import (
+        add_transaction,
+        add_transaction_async,
+        add_transaction_stream,
+        add_transactions,
+        add_transactions_async,
+    )
+
+_EXPORTS = {
+    "ALLOWED_TRANSACTION_TYPES": "expense_tracking.models",
+    "DatabaseError": "expense_tracking.errors",
+    "ExpenseTrackingError": "expense_tracking.errors",
+    "InsertedTransaction": "expense_tracking.models",
+    "PageCursor": "expense_tracking.browse",
+    "QueryLoadError": "expense_tracking.errors",
+    "ReportGenerationError": "expense_tracking.errors",
+    "ReportPeriod": "expense_tracking.reports",
+    "Transaction": "expense_tracking.models",
+    "TransactionError": "expense_tracking.errors",
+    "TransactionFilter": "expense_tracking.browse",
+    "TransactionPage": "expense_tracking.browse",
+    "ValidationError": "expense_tracking.errors",
+    "add_transaction": "expense_tracking.transactions",
+    "add_transaction_async": "expense_tracking.transactions",
+    "add_transaction_stream": "expense_tracking.transactions",
+    "add_transactions": "expense_tracking.transactions",
+    "add_transactions_async": "expense_tracking.transactions",
+    "browse_transactions": "expense_tracking.browse",
+    "generate_report": "expense_tracking.reports",
+    "search_transactions": "expense_tracking.search",
+}
 
 __all__ = [
     "ALLOWED_TRANSACTION_TYPES",
     "DatabaseError",
     "ExpenseTrackingError",
     "InsertedTransaction",
+    "PageCursor",
     "QueryLoadError",
     "ReportGenerationError",
     "ReportPeriod",
     "Transaction",
     "TransactionError",
+    "TransactionFilter",
+    "TransactionPage",
     "ValidationError",
     "add_transaction",
+    "add_transaction_async",
+    "add_transaction_stream",
+    "add_transactions",
+    "add_transactions_async",
+    "browse_transactions",
     "generate_report",
+    "search_transactions",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
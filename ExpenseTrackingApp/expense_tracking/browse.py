@@ -0,0 +1,152 @@
+"""Keyset-paginated browsing of stored transactions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import psycopg
+
+from expense_tracking.config import (
+    TRANSACTION_PAGE_BY_TYPE_QUERY_PATH,
+    TRANSACTION_PAGE_QUERY_PATH,
+    load_query,
+    resolve_database,
+)
+from expense_tracking.errors import ValidationError
+from expense_tracking.models import (
+    MAX_AMOUNT,
+    InsertedTransaction,
+    validate_transaction_type,
+)
+from expense_tracking.pool import connection
+from expense_tracking.transactions import database_error
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_TRANSACTION_ID = 2**63 - 1
+
+
+@dataclass(frozen=True)
+class TransactionFilter:
+    """Server-side filters; ``None`` leaves a bound open."""
+
+    transaction_type: str | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+    min_amount: Decimal | None = None
+    max_amount: Decimal | None = None
+
+    def __post_init__(self) -> None:
+        if self.transaction_type is not None:
+            validate_transaction_type(self.transaction_type)
+        for value in (self.start_date, self.end_date):
+            if value is not None and not isinstance(value, date):
+                raise ValidationError("filter dates must be dates")
+        if (
+            self.start_date is not None
+            and self.end_date is not None
+            and self.end_date < self.start_date
+        ):
+            raise ValidationError("end date must be on or after start date")
+        for value in (self.min_amount, self.max_amount):
+            if value is not None and (
+                not isinstance(value, Decimal) or not value.is_finite() or value < 0
+            ):
+                raise ValidationError("amount filters must be non-negative decimals")
+        if (
+            self.min_amount is not None
+            and self.max_amount is not None
+            and self.max_amount < self.min_amount
+        ):
+            raise ValidationError("maximum amount must not be below minimum amount")
+
+    def query_parameters(self) -> dict[str, Any]:
+        parameters: dict[str, Any] = {
+            "start_date": self.start_date if self.start_date is not None else date.min,
+            "end_date": self.end_date if self.end_date is not None else date.max,
+            "min_amount": self.min_amount if self.min_amount is not None else Decimal(0),
+            "max_amount": self.max_amount if self.max_amount is not None else MAX_AMOUNT,
+        }
+        if self.transaction_type is not None:
+            parameters["transaction_type"] = self.transaction_type
+        return parameters
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Keyset position: the ``(occurred_on, id)`` of a page's last row."""
+
+    occurred_on: date
+    id: int
+
+
+@dataclass(frozen=True)
+class TransactionPage:
+    transactions: tuple[InsertedTransaction, ...]
+    next_cursor: PageCursor | None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def validate_page_size(page_size: int) -> int:
+    if isinstance(page_size, bool) or not isinstance(page_size, int):
+        raise ValidationError("page size must be an integer")
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValidationError(f"page size must be between 1 and {MAX_PAGE_SIZE}")
+    return page_size
+
+
+def browse_transactions(
+    filters: TransactionFilter | None = None,
+    *,
+    after: PageCursor | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    database: str | None = None,
+    query: str | None = None,
+) -> TransactionPage:
+    """Return one page of transactions, newest first, after ``after``.
+
+    Filtering and the keyset condition run in PostgreSQL. Only the page's
+    rows plus one lookahead row are transferred, and the cost does not grow
+    with how far the user has paged.
+    """
+
+    resolved_filters = filters if filters is not None else TransactionFilter()
+    resolved_page_size = validate_page_size(page_size)
+    resolved_database = resolve_database(database)
+    if query is not None:
+        page_query = query
+    elif resolved_filters.transaction_type is not None:
+        page_query = load_query(TRANSACTION_PAGE_BY_TYPE_QUERY_PATH)
+    else:
+        page_query = load_query(TRANSACTION_PAGE_QUERY_PATH)
+    parameters = {
+        **resolved_filters.query_parameters(),
+        "before_occurred_on": after.occurred_on if after is not None else date.max,
+        "before_id": after.id if after is not None else MAX_TRANSACTION_ID,
+        "limit": resolved_page_size + 1,
+    }
+
+    try:
+        with connection(resolved_database, read_only=True) as pooled:
+            with pooled.cursor() as cursor:
+                cursor.execute(page_query, parameters)
+                rows = cursor.fetchall()
+    except psycopg.Error as error:
+        raise database_error(error) from error
+
+    transactions = tuple(
+        InsertedTransaction.from_row(row) for row in rows[:resolved_page_size]
+    )
+    next_cursor = (
+        PageCursor(transactions[-1].occurred_on, transactions[-1].id)
+        if len(rows) > resolved_page_size
+        else None
+    )
+    return TransactionPage(transactions, next_cursor)
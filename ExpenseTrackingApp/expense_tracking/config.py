@@ -3,17 +3,60 @@
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
-from expense_tracking.errors import ValidationError
+from expense_tracking.errors import QueryLoadError, ValidationError
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_DATABASE = "expense_tracking_app"
+DEFAULT_BATCH_SIZE = 500
 INSERT_QUERY_PATH = PROJECT_ROOT / "queries" / "insert_transaction.sql"
+INSERT_ROWS_QUERY_PATH = PROJECT_ROOT / "queries" / "insert_transaction_rows.sql"
 REPORT_QUERY_PATH = PROJECT_ROOT / "queries" / "select_report_transactions.sql"
+MONTHLY_TOTALS_QUERY_PATH = PROJECT_ROOT / "queries" / "select_monthly_totals.sql"
+MONTHLY_ROLLUP_QUERY_PATH = PROJECT_ROOT / "queries" / "select_monthly_rollup.sql"
+DAILY_TOTALS_QUERY_PATH = PROJECT_ROOT / "queries" / "select_daily_totals.sql"
+DATA_VERSION_QUERY_PATH = PROJECT_ROOT / "queries" / "select_data_version.sql"
+TRANSACTION_PAGE_QUERY_PATH = PROJECT_ROOT / "queries" / "select_transaction_page.sql"
+TRANSACTION_PAGE_BY_TYPE_QUERY_PATH = (
+    PROJECT_ROOT / "queries" / "select_transaction_page_by_type.sql"
+)
+SEARCH_QUERY_PATH = PROJECT_ROOT / "queries" / "search_transactions.sql"
 REPORT_SOURCE = PROJECT_ROOT / "reports" / "cash_flow.qmd"
+HTML_REPORT_TEMPLATE = PROJECT_ROOT / "reports" / "cash_flow.html"
+REPORT_BACKENDS = ("quarto", "python")
+DEFAULT_BATCH_WORKERS = 4
+DEFAULT_REPORT_WORKERS = 2
+DEFAULT_JOB_RETENTION = 3600.0
 DEFAULT_REPORT_OUTPUT_DIR = PROJECT_ROOT / "reports" / "output"
+DEFAULT_REPORT_CACHE_DIR = PROJECT_ROOT / "reports" / "cache"
+DEFAULT_RENDER_SOCKET = PROJECT_ROOT / "reports" / "render.sock"
+DEFAULT_REPORT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_REPORT_OUTPUT_MAX_AGE = 7 * 24 * 3600.0
+DEFAULT_REPORT_OUTPUT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 5
+DEFAULT_POOL_MAX_IDLE = 300.0
+DEFAULT_POOL_TIMEOUT = 5.0
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    min_size: int
+    max_size: int
+    max_idle: float
+    timeout: float = DEFAULT_POOL_TIMEOUT
+
+
+def load_query(path: Path) -> str:
+    """Read a SQL file, reporting an unreadable file as ``QueryLoadError``."""
+
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError as error:
+        raise QueryLoadError(str(error)) from error
 
 
 def resolve_database(database: str | None = None) -> str:
@@ -24,3 +67,70 @@ def resolve_database(database: str | None = None) -> str:
     if not isinstance(resolved, str) or not resolved.strip():
         raise ValidationError("database must not be blank")
     return resolved.strip()
+
+
+def resolve_setting(
+    value: str | int | float | None,
+    environment_variable: str,
+    default: int | float,
+) -> str | int | float:
+    if value is not None:
+        return value
+    configured = os.environ.get(environment_variable)
+    return configured if configured is not None else default
+
+
+def resolve_pool_settings(
+    *,
+    min_size: int | None = None,
+    max_size: int | None = None,
+    max_idle: float | None = None,
+    timeout: float | None = None,
+) -> PoolSettings:
+    """Return explicit, environment-provided, or default pool settings."""
+
+    try:
+        resolved_min_size = int(
+            resolve_setting(min_size, "EXPENSE_POOL_MIN_SIZE", DEFAULT_POOL_MIN_SIZE)
+        )
+        resolved_max_size = int(
+            resolve_setting(max_size, "EXPENSE_POOL_MAX_SIZE", DEFAULT_POOL_MAX_SIZE)
+        )
+        resolved_max_idle = float(
+            resolve_setting(max_idle, "EXPENSE_POOL_MAX_IDLE", DEFAULT_POOL_MAX_IDLE)
+        )
+        resolved_timeout = float(
+            resolve_setting(timeout, "EXPENSE_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT)
+        )
+    except (TypeError, ValueError) as error:
+        raise ValidationError("pool settings must be numbers") from error
+    if resolved_min_size < 0:
+        raise ValidationError("pool minimum size must not be negative")
+    if resolved_max_size < 1 or resolved_max_size < resolved_min_size:
+        raise ValidationError(
+            "pool maximum size must be at least one and not below the minimum size"
+        )
+    if not resolved_max_idle > 0:
+        raise ValidationError("pool idle timeout must be greater than zero")
+    if not resolved_timeout > 0:
+        raise ValidationError("pool connection timeout must be greater than zero")
+    return PoolSettings(
+        min_size=resolved_min_size,
+        max_size=resolved_max_size,
+        max_idle=resolved_max_idle,
+        timeout=resolved_timeout,
+    )
+
+
+def resolve_report_workers(value: int | None = None) -> int:
+    """Return the explicit, environment-provided, or default report job cap."""
+
+    try:
+        workers = int(
+            resolve_setting(value, "EXPENSE_REPORT_WORKERS", DEFAULT_REPORT_WORKERS)
+        )
+    except (TypeError, ValueError) as error:
+        raise ValidationError("report worker count must be a whole number") from error
+    if workers < 1:
+        raise ValidationError("report worker count must be at least one")
+    return workers
@@ -0,0 +1,183 @@
+"""Bounded background execution for long-running report jobs."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable
+
+from expense_tracking.config import DEFAULT_JOB_RETENTION, resolve_report_workers
+
+
+@dataclass(frozen=True)
+class JobStatus:
+    """A snapshot of one submitted job.
+
+    ``state`` is ``queued``, ``running``, ``succeeded`` or ``failed``.
+    """
+
+    job_id: str
+    state: str
+    submitted_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    position: int = 0
+    result: Any = None
+    error: BaseException | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.state in ("succeeded", "failed")
+
+    @property
+    def elapsed(self) -> float:
+        start = self.started_at if self.started_at is not None else self.submitted_at
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return end - start
+
+
+class JobQueue:
+    """Run jobs on at most ``max_workers`` threads and track them by id.
+
+    Jobs beyond the cap wait in submission order. Finished jobs stay
+    queryable for ``retention`` seconds and are pruned on later submissions.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        retention: float = DEFAULT_JOB_RETENTION,
+    ) -> None:
+        self.max_workers = max_workers
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="report-job",
+        )
+        self._jobs: dict[str, JobStatus] = {}
+        self._futures: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, function: Callable[..., Any], /, **kwargs: Any) -> str:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._prune()
+            self._jobs[job_id] = JobStatus(
+                job_id=job_id,
+                state="queued",
+                submitted_at=time.time(),
+            )
+            self._futures[job_id] = self._executor.submit(
+                self._run,
+                job_id,
+                function,
+                kwargs,
+            )
+        return job_id
+
+    def _run(
+        self,
+        job_id: str,
+        function: Callable[..., Any],
+        kwargs: dict[str, Any],
+    ) -> None:
+        self._update(job_id, state="running", started_at=time.time())
+        try:
+            result = function(**kwargs)
+        except Exception as error:
+            self._update(
+                job_id,
+                state="failed",
+                finished_at=time.time(),
+                error=error,
+            )
+        else:
+            self._update(
+                job_id,
+                state="succeeded",
+                finished_at=time.time(),
+                result=result,
+            )
+
+    def _update(self, job_id: str, **changes: Any) -> None:
+        with self._lock:
+            current = self._jobs[job_id]
+            self._jobs[job_id] = replace(current, **changes)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+            del self._futures[job_id]
+
+    def status(self, job_id: str) -> JobStatus | None:
+        """Return the job's state and, while queued, how many jobs wait before it."""
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state != "queued":
+                return job
+            ahead = sum(
+                1
+                for other in self._jobs.values()
+                if other.state == "queued" and other.submitted_at < job.submitted_at
+            )
+        return replace(job, position=ahead + 1)
+
+    def oldest_running_start(self) -> float | None:
+        """Return when the longest-running job started, or ``None`` if idle."""
+
+        with self._lock:
+            return min(
+                (
+                    job.started_at
+                    for job in self._jobs.values()
+                    if job.state == "running" and job.started_at is not None
+                ),
+                default=None,
+            )
+
+    def wait(self, job_id: str, timeout: float | None = None) -> JobStatus | None:
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None:
+            future.result(timeout=timeout)
+        return self.status(job_id)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_report_queue: JobQueue | None = None
+_report_queue_lock = threading.Lock()
+
+
+def get_report_queue() -> JobQueue:
+    """Return the process-wide report queue shared by every Streamlit session."""
+
+    global _report_queue
+    with _report_queue_lock:
+        if _report_queue is None:
+            _report_queue = JobQueue(resolve_report_workers())
+        return _report_queue
+
+
+def close_report_queue() -> None:
+    global _report_queue
+    with _report_queue_lock:
+        queue, _report_queue = _report_queue, None
+    if queue is not None:
+        queue.shutdown()
+
+
+atexit.register(close_report_queue)
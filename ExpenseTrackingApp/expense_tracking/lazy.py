@@ -0,0 +1,38 @@
+"""Deferred package exports (PEP 562).
+
+Package ``__init__`` modules list their public names here instead of importing
+them, so importing a package, or a light submodule such as
+``expense_tracking.models``, does not load psycopg, pandas, plotly or
+Streamlit until a name that needs them is used.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable, Mapping
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, str],
+    namespace: dict[str, Any],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return a module ``__getattr__`` and ``__dir__`` for ``exports``.
+
+    ``exports`` maps each public name to the module that defines it. A name
+    is imported on first access and stored in ``namespace``, so later lookups
+    are ordinary module attributes.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
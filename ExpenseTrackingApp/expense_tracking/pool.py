@@ -0,0 +1,137 @@
+"""Process-wide PostgreSQL connection pools shared by every service."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator
+
+import psycopg
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+from expense_tracking.config import resolve_database, resolve_pool_settings
+
+
+READ_ONLY_OPTIONS = "-c default_transaction_read_only=on"
+
+_pools: dict[tuple[str, bool], ConnectionPool] = {}
+_async_pools: dict[tuple[str, bool], AsyncConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def connection_kwargs(database: str, *, read_only: bool) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {"dbname": database, "row_factory": dict_row}
+    if read_only:
+        kwargs["options"] = READ_ONLY_OPTIONS
+    return kwargs
+
+
+def pool_name(database: str, *, read_only: bool) -> str:
+    return f"{database}:{'read-only' if read_only else 'read-write'}"
+
+
+def get_pool(database: str | None = None, *, read_only: bool = False) -> ConnectionPool:
+    """Return the shared pool for a database, creating it on first use.
+
+    Read-write and read-only sessions use separate pools so a read-only
+    connection can never be handed to a writer.
+    """
+
+    resolved_database = resolve_database(database)
+    key = (resolved_database, read_only)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            settings = resolve_pool_settings()
+            pool = ConnectionPool(
+                kwargs=connection_kwargs(resolved_database, read_only=read_only),
+                min_size=settings.min_size,
+                max_size=settings.max_size,
+                max_idle=settings.max_idle,
+                timeout=settings.timeout,
+                name=pool_name(resolved_database, read_only=read_only),
+                open=True,
+            )
+            _pools[key] = pool
+    return pool
+
+
+@contextmanager
+def connection(
+    database: str | None = None,
+    *,
+    read_only: bool = False,
+) -> Iterator[psycopg.Connection[dict[str, Any]]]:
+    """Borrow a pooled connection; its transaction commits on a clean exit."""
+
+    with get_pool(database, read_only=read_only).connection() as pooled:
+        yield pooled
+
+
+def close_pools() -> None:
+    """Close every synchronous pool, for example before the process exits."""
+
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+async def get_async_pool(
+    database: str | None = None,
+    *,
+    read_only: bool = False,
+) -> AsyncConnectionPool:
+    """Return the shared asyncio pool for a database, opening it on first use.
+
+    Async pools belong to the event loop that first opens them; call
+    ``close_async_pools`` before that loop shuts down.
+    """
+
+    resolved_database = resolve_database(database)
+    key = (resolved_database, read_only)
+    with _pools_lock:
+        pool = _async_pools.get(key)
+        if pool is None:
+            settings = resolve_pool_settings()
+            pool = AsyncConnectionPool(
+                kwargs=connection_kwargs(resolved_database, read_only=read_only),
+                min_size=settings.min_size,
+                max_size=settings.max_size,
+                max_idle=settings.max_idle,
+                timeout=settings.timeout,
+                name=pool_name(resolved_database, read_only=read_only),
+                open=False,
+            )
+            _async_pools[key] = pool
+    await pool.open()
+    return pool
+
+
+@asynccontextmanager
+async def async_connection(
+    database: str | None = None,
+    *,
+    read_only: bool = False,
+) -> AsyncIterator[psycopg.AsyncConnection[dict[str, Any]]]:
+    """Borrow a pooled asyncio connection; it commits on a clean exit."""
+
+    pool = await get_async_pool(database, read_only=read_only)
+    async with pool.connection() as pooled:
+        yield pooled
+
+
+async def close_async_pools() -> None:
+    """Close every asyncio pool from the event loop that opened them."""
+
+    with _pools_lock:
+        pools = list(_async_pools.values())
+        _async_pools.clear()
+    for pool in pools:
+        await pool.close()
+
+
+atexit.register(close_pools)
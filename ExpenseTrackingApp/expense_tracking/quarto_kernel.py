@@ -0,0 +1,222 @@
+"""A Jupyter kernel kept alive across Quarto renders of the cash-flow report.
+
+``quarto convert`` turns ``cash_flow.qmd`` into a notebook once. Each render
+sets the report's ``EXPENSE_REPORT_*`` environment inside the live kernel,
+executes that notebook there and writes the executed copy, which
+``quarto render --no-execute`` turns into HTML without starting a kernel of
+its own. The Jupyter packages are imported only when the kernel starts, so
+processes that never render through it do not load them.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Any, Mapping
+
+from expense_tracking.config import REPORT_SOURCE
+from expense_tracking.errors import ReportGenerationError
+
+if TYPE_CHECKING:
+    from jupyter_client import KernelManager
+    from nbformat import NotebookNode
+
+
+ENVIRONMENT_PREFIX = "EXPENSE_REPORT_"
+INLINE_EXPRESSION = re.compile(r"`\{python\}\s+([^`]+?)\s*`")
+DEFAULT_KERNEL_TIMEOUT = 600
+WARM_UP_CODE = """\
+import expense_tracking.reporting.charts
+import expense_tracking.reporting.data
+import expense_tracking.reporting.tables
+"""
+
+
+def environment_code(environment: Mapping[str, str]) -> str:
+    """Return code that replaces the kernel's report environment with this one.
+
+    Variables an earlier render set but this one omits, such as the data
+    file, are removed, and the timing sink from an earlier render is closed.
+    """
+
+    report_environment = {
+        name: value
+        for name, value in environment.items()
+        if name.startswith(ENVIRONMENT_PREFIX)
+    }
+    return (
+        "import os\n"
+        "from expense_tracking.timing import emit_timings\n"
+        "for _name in list(os.environ):\n"
+        f"    if _name.startswith({ENVIRONMENT_PREFIX!r}):\n"
+        "        del os.environ[_name]\n"
+        f"os.environ.update({report_environment!r})\n"
+        "emit_timings(None)\n"
+    )
+
+
+def inline_expressions(notebook: NotebookNode) -> list[str]:
+    """Return the ``{python}`` inline expressions of every markdown cell."""
+
+    return [
+        expression
+        for cell in notebook.cells
+        if cell.cell_type == "markdown"
+        for expression in INLINE_EXPRESSION.findall(cell.source)
+    ]
+
+
+def inline_values_code(expressions: list[str]) -> str:
+    """Return a cell whose result is the JSON list of each expression's text."""
+
+    values = ", ".join(f"str({expression})" for expression in expressions)
+    return f"import json as _json\n_json.dumps([{values}])"
+
+
+def substitute_inline_values(notebook: NotebookNode, values: list[str]) -> None:
+    """Replace the inline expressions, in order, with their evaluated text."""
+
+    remaining = iter(values)
+    for cell in notebook.cells:
+        if cell.cell_type == "markdown":
+            cell.source = INLINE_EXPRESSION.sub(lambda _: next(remaining), cell.source)
+
+
+def cell_result(cell: NotebookNode) -> str:
+    """Return the string an executed cell evaluated to."""
+
+    for output in cell.get("outputs", []):
+        if output.get("output_type") == "execute_result":
+            return ast.literal_eval(output["data"]["text/plain"])
+    raise ReportGenerationError("The report kernel returned no inline values.")
+
+
+class WarmKernel:
+    """Execute the report notebook in one long-lived Jupyter kernel.
+
+    Renders are serialized because they share the kernel's globals. A kernel
+    that died is restarted before the next render.
+    """
+
+    def __init__(
+        self,
+        quarto: str,
+        *,
+        source: Path = REPORT_SOURCE,
+        environment: Mapping[str, str] | None = None,
+        timeout: int = DEFAULT_KERNEL_TIMEOUT,
+    ) -> None:
+        self.quarto = quarto
+        self.source = source
+        self.environment = dict(os.environ if environment is None else environment)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._manager: KernelManager | None = None
+        self._directory: TemporaryDirectory[str] | None = None
+        self._template: NotebookNode | None = None
+        self._template_mtime: int | None = None
+
+    def start(self) -> None:
+        """Start the kernel and import the reporting stack inside it."""
+
+        from jupyter_client import KernelManager
+        from nbformat.v4 import new_code_cell, new_notebook
+
+        self._directory = TemporaryDirectory(prefix="cash-flow-kernel-")
+        self._manager = KernelManager(kernel_name="python3")
+        self._manager.start_kernel(
+            cwd=str(self.source.parent),
+            env=self.environment,
+        )
+        self._run(new_notebook(cells=[new_code_cell(WARM_UP_CODE)]))
+
+    def shutdown(self) -> None:
+        if self._manager is not None:
+            self._manager.shutdown_kernel(now=True)
+            self._manager = None
+        if self._directory is not None:
+            self._directory.cleanup()
+            self._directory = None
+
+    def template(self) -> NotebookNode:
+        """Return the converted report notebook, converting again after edits."""
+
+        import nbformat
+
+        mtime = self.source.stat().st_mtime_ns
+        if self._template is None or self._template_mtime != mtime:
+            assert self._directory is not None
+            converted = Path(self._directory.name) / f"{self.source.stem}.ipynb"
+            try:
+                subprocess.run(
+                    [
+                        self.quarto,
+                        "convert",
+                        str(self.source),
+                        "--output",
+                        str(converted),
+                    ],
+                    check=True,
+                )
+            except subprocess.CalledProcessError as error:
+                raise ReportGenerationError(
+                    f"Quarto could not convert {self.source.name} "
+                    f"(status {error.returncode})."
+                ) from error
+            self._template = nbformat.read(converted, as_version=4)
+            self._template_mtime = mtime
+        return self._template
+
+    def execute(self, *, environment: Mapping[str, str], output_path: Path) -> None:
+        """Execute the report notebook for one render into ``output_path``."""
+
+        if self._manager is None:
+            raise ReportGenerationError("The report kernel has not been started.")
+
+        import nbformat
+        from nbformat.v4 import new_code_cell
+
+        with self._lock:
+            if not self._manager.is_alive():
+                self._manager.restart_kernel(now=True)
+            notebook = nbformat.from_dict(self.template())
+            expressions = inline_expressions(notebook)
+            first_code = next(
+                index
+                for index, cell in enumerate(notebook.cells)
+                if cell.cell_type == "code"
+            )
+            setup = new_code_cell(environment_code(environment))
+            values = new_code_cell(inline_values_code(expressions))
+            notebook.cells.insert(first_code, setup)
+            notebook.cells.append(values)
+            self._run(notebook)
+            notebook.cells.remove(setup)
+            notebook.cells.remove(values)
+            if expressions:
+                substitute_inline_values(notebook, json.loads(cell_result(values)))
+            nbformat.write(notebook, output_path)
+
+    def _run(self, notebook: NotebookNode) -> Any:
+        from nbclient import NotebookClient
+        from nbclient.exceptions import CellExecutionError, DeadKernelError
+
+        client = NotebookClient(
+            notebook,
+            km=self._manager,
+            timeout=self.timeout,
+            resources={"metadata": {"path": str(self.source.parent)}},
+        )
+        try:
+            return client.execute()
+        except (CellExecutionError, DeadKernelError, TimeoutError) as error:
+            raise ReportGenerationError(f"The report kernel failed: {error}") from error
+        finally:
+            if client.kc is not None:
+                client.kc.stop_channels()
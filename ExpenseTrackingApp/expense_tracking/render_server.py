@@ -0,0 +1,240 @@
+"""Long-lived local report rendering service listening on a Unix socket.
+
+The service imports the reporting stack and renders a throwaway report once
+at startup, so Plotly, ITables and pandas are already loaded when jobs
+arrive. Each connection carries one JSON request line and receives one JSON
+response line.
+
+Jobs render with the in-process ``python`` backend by default. A server
+started with a ``WarmKernel`` also accepts ``quarto`` jobs and executes them
+in that one long-lived Jupyter kernel, so only the first Quarto render pays
+kernel startup. Reports are only written inside the output directory the
+server was started with; a request for any other path is refused.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import socketserver
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Mapping
+
+from expense_tracking.config import DEFAULT_RENDER_SOCKET, DEFAULT_REPORT_OUTPUT_DIR
+from expense_tracking.errors import ExpenseTrackingError, ReportGenerationError
+from expense_tracking.quarto_kernel import WarmKernel
+from expense_tracking.report_cache import ReportCache
+from expense_tracking.reporting.cash_flow import build_summary_report
+from expense_tracking.reporting.html import render_cash_flow_html
+from expense_tracking.reports import ReportPeriod, generate_report
+
+
+DEFAULT_RENDER_TIMEOUT = 600.0
+
+
+def warm_up() -> None:
+    """Load every lazily imported rendering dependency before the first job."""
+
+    today = date.today()
+    render_cash_flow_html(
+        build_summary_report((), today, today),
+        period_label="warm-up",
+    )
+    render_cash_flow_html(
+        build_summary_report((), today, today),
+        period_label="warm-up",
+        summary_only=True,
+    )
+
+
+def render_request(
+    *,
+    period: ReportPeriod,
+    database: str | None,
+    output_path: Path | None,
+    summary_only: bool,
+    use_cache: bool,
+    force: bool,
+    backend: str = "python",
+) -> dict[str, Any]:
+    return {
+        "start_date": period.start_date.isoformat(),
+        "end_date": period.end_date.isoformat(),
+        "label": period.label,
+        "default_filename": period.default_filename,
+        "database": database,
+        "output_path": None if output_path is None else str(Path(output_path).resolve()),
+        "summary_only": summary_only,
+        "use_cache": use_cache,
+        "force": force,
+        "backend": backend,
+    }
+
+
+def confined_output_path(
+    output_path: str | None,
+    default_filename: str,
+    output_dir: Path,
+) -> Path:
+    """Resolve a requested output path, refusing anything outside ``output_dir``."""
+
+    root = output_dir.resolve()
+    target = (
+        root / default_filename if output_path is None else Path(output_path)
+    ).resolve()
+    if target == root or not target.is_relative_to(root):
+        raise ReportGenerationError(f"output path must be inside {root}")
+    return target
+
+
+def handle_request(
+    request: Mapping[str, Any],
+    *,
+    output_dir: Path = DEFAULT_REPORT_OUTPUT_DIR,
+    kernel: WarmKernel | None = None,
+) -> dict[str, Any]:
+    """Render one job and describe the outcome as a JSON-safe response."""
+
+    started = time.perf_counter()
+    try:
+        backend = request.get("backend", "python")
+        if backend == "quarto" and kernel is None:
+            raise ReportGenerationError(
+                "This render server has no Quarto kernel; start it with --quarto."
+            )
+        period = ReportPeriod(
+            start_date=date.fromisoformat(request["start_date"]),
+            end_date=date.fromisoformat(request["end_date"]),
+            label=request["label"],
+            default_filename=request["default_filename"],
+        )
+        output_path = confined_output_path(
+            request.get("output_path"),
+            period.default_filename,
+            output_dir,
+        )
+        result = generate_report(
+            period=period,
+            database=request.get("database"),
+            output_path=output_path,
+            summary_only=bool(request.get("summary_only", False)),
+            cache=ReportCache() if request.get("use_cache", True) else None,
+            force=bool(request.get("force", False)),
+            backend=backend,
+            kernel=kernel if backend == "quarto" else None,
+        )
+    except (ExpenseTrackingError, KeyError, TypeError, ValueError) as error:
+        message = f"missing field {error}" if isinstance(error, KeyError) else str(error)
+        return {"ok": False, "error": message}
+    return {
+        "ok": True,
+        "output_path": str(result),
+        "seconds": time.perf_counter() - started,
+    }
+
+
+class RenderRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            response = {"ok": False, "error": "request must be one line of JSON"}
+        else:
+            if isinstance(request, dict):
+                response = handle_request(
+                    request,
+                    output_dir=self.server.output_dir,
+                    kernel=self.server.kernel,
+                )
+            else:
+                response = {"ok": False, "error": "request must be a JSON object"}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class RenderServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    output_dir: Path = DEFAULT_REPORT_OUTPUT_DIR
+    kernel: WarmKernel | None = None
+
+
+def socket_in_use(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def create_server(
+    socket_path: Path = DEFAULT_RENDER_SOCKET,
+    *,
+    output_dir: Path = DEFAULT_REPORT_OUTPUT_DIR,
+    kernel: WarmKernel | None = None,
+) -> RenderServer:
+    """Warm the renderer and bind the service, replacing a stale socket file.
+
+    A ``kernel`` is started here and serves every ``quarto`` job.
+    """
+
+    if socket_path.exists():
+        if socket_in_use(socket_path):
+            raise ReportGenerationError(
+                f"A render server is already listening on {socket_path}."
+            )
+        socket_path.unlink()
+    warm_up()
+    if kernel is not None:
+        kernel.start()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    server = RenderServer(str(socket_path), RenderRequestHandler)
+    server.output_dir = output_dir
+    server.kernel = kernel
+    return server
+
+
+def request_render(
+    *,
+    period: ReportPeriod,
+    database: str | None = None,
+    output_path: Path | None = None,
+    summary_only: bool = False,
+    use_cache: bool = True,
+    force: bool = False,
+    backend: str = "python",
+    socket_path: Path = DEFAULT_RENDER_SOCKET,
+    timeout: float = DEFAULT_RENDER_TIMEOUT,
+) -> Path:
+    """Ask a running render server for a report and return its output path."""
+
+    request = render_request(
+        period=period,
+        database=database,
+        output_path=output_path,
+        summary_only=summary_only,
+        use_cache=use_cache,
+        force=force,
+        backend=backend,
+    )
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile("rb") as stream:
+                line = stream.readline()
+    except OSError as error:
+        raise ReportGenerationError(
+            f"Render server at {socket_path} is unavailable: {error}"
+        ) from error
+    try:
+        response = json.loads(line)
+    except json.JSONDecodeError as error:
+        raise ReportGenerationError(
+            "Render server closed the connection without a response."
+        ) from error
+    if not response.get("ok"):
+        raise ReportGenerationError(response.get("error", "Render server failed."))
+    return Path(response["output_path"])
@@ -0,0 +1,141 @@
+"""Content-addressed on-disk cache for rendered cash-flow reports."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from expense_tracking.config import (
+    DEFAULT_REPORT_CACHE_DIR,
+    DEFAULT_REPORT_CACHE_MAX_BYTES,
+    HTML_REPORT_TEMPLATE,
+    PROJECT_ROOT,
+    REPORT_SOURCE,
+)
+from expense_tracking.errors import ValidationError
+
+
+CACHE_FORMAT_VERSION = 3
+
+
+def template_files() -> list[Path]:
+    """Return every file whose contents affect the rendered report."""
+
+    return [
+        REPORT_SOURCE,
+        REPORT_SOURCE.parent / "_quarto.yml",
+        HTML_REPORT_TEMPLATE,
+        *sorted((PROJECT_ROOT / "expense_tracking" / "reporting").glob("*.py")),
+    ]
+
+
+def template_digest(paths: Iterable[Path] | None = None) -> str:
+    digest = hashlib.sha256()
+    for path in template_files() if paths is None else paths:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def report_cache_key(
+    *,
+    start_date: str,
+    end_date: str,
+    label: str,
+    database: str,
+    summary_only: bool,
+    backend: str,
+    template: str,
+    data_version: int,
+    asset_href: str | None = None,
+) -> str:
+    """Return the cache key for one rendering of one state of the data."""
+
+    payload = json.dumps(
+        {
+            "version": CACHE_FORMAT_VERSION,
+            "start_date": start_date,
+            "end_date": end_date,
+            "label": label,
+            "database": database,
+            "summary_only": summary_only,
+            "backend": backend,
+            "asset_href": asset_href,
+            "template": template,
+            "data_version": data_version,
+        },
+        default=str,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ReportCache:
+    """Rendered reports stored by key and evicted least recently used first.
+
+    A hit refreshes the file's modification time, which is the recency used
+    for eviction once the cached files exceed ``max_bytes``.
+    """
+
+    directory: Path = DEFAULT_REPORT_CACHE_DIR
+    max_bytes: int = DEFAULT_REPORT_CACHE_MAX_BYTES
+
+    def __post_init__(self) -> None:
+        if (
+            isinstance(self.max_bytes, bool)
+            or not isinstance(self.max_bytes, int)
+            or self.max_bytes < 1
+        ):
+            raise ValidationError("report cache size must be a positive integer")
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.html"
+
+    def get(self, key: str) -> Path | None:
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, source: Path) -> Path:
+        """Copy a rendered report into the cache and evict old entries."""
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        staging_path = self.directory / f".{key}.{uuid.uuid4().hex}.tmp"
+        try:
+            shutil.copyfile(source, staging_path)
+            staging_path.replace(path)
+        finally:
+            staging_path.unlink(missing_ok=True)
+        self.evict(keep=path)
+        return path
+
+    def evict(self, *, keep: Path | None = None) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob("*.html"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
@@ -1,21 +1,69 @@
-"""Cash-flow reporting for the expense tracking application."""
-
-from expense_tracking.reporting.cash_flow import (
-    ALLOWED_TRANSACTION_TYPES,
-    CashFlowReport,
-    CashFlowSummary,
-    MonthlySummary,
-    ReportTransaction,
-    build_cash_flow_report,
-)
-from expense_tracking.reporting.data import load_transactions
+"""Cash-flow reporting for the expense tracking application.
+
+Public names are imported on first use; see ``expense_tracking.lazy``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from expense_tracking.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from expense_tracking.reporting.cash_flow import (
+        ALLOWED_TRANSACTION_TYPES,
+        CashFlowReport,
+        CashFlowSummary,
+        MonthlySummary,
+        ReportTransaction,
+        apply_transaction_changes,
+        build_cash_flow_report,
+        build_cash_flow_reports,
+        build_summary_report,
+    )
+    from expense_tracking.reporting.data import (
+        iter_transactions,
+        load_daily_ledger,
+        load_monthly_summaries,
+        load_transactions,
+        load_transactions_async,
+    )
+    from expense_tracking.reporting.ledger import DailyLedgerIndex
+
+_EXPORTS = {
+    "ALLOWED_TRANSACTION_TYPES": "expense_tracking.reporting.cash_flow",
+    "CashFlowReport": "expense_tracking.reporting.cash_flow",
+    "CashFlowSummary": "expense_tracking.reporting.cash_flow",
+    "DailyLedgerIndex": "expense_tracking.reporting.ledger",
+    "MonthlySummary": "expense_tracking.reporting.cash_flow",
+    "ReportTransaction": "expense_tracking.reporting.cash_flow",
+    "apply_transaction_changes": "expense_tracking.reporting.cash_flow",
+    "build_cash_flow_report": "expense_tracking.reporting.cash_flow",
+    "build_cash_flow_reports": "expense_tracking.reporting.cash_flow",
+    "build_summary_report": "expense_tracking.reporting.cash_flow",
+    "iter_transactions": "expense_tracking.reporting.data",
+    "load_daily_ledger": "expense_tracking.reporting.data",
+    "load_monthly_summaries": "expense_tracking.reporting.data",
+    "load_transactions": "expense_tracking.reporting.data",
+    "load_transactions_async": "expense_tracking.reporting.data",
+}
 
 __all__ = [
     "ALLOWED_TRANSACTION_TYPES",
     "CashFlowReport",
     "CashFlowSummary",
+    "DailyLedgerIndex",
     "MonthlySummary",
     "ReportTransaction",
+    "apply_transaction_changes",
     "build_cash_flow_report",
+    "build_cash_flow_reports",
+    "build_summary_report",
+    "iter_transactions",
+    "load_daily_ledger",
+    "load_monthly_summaries",
     "load_transactions",
+    "load_transactions_async",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
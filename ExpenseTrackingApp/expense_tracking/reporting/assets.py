@@ -0,0 +1,118 @@
+"""Shared, content-hashed script and style bundles for HTML reports."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import shutil
+import uuid
+from pathlib import Path
+
+from itables import options
+from plotly.offline import get_plotlyjs
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the optional brotli package
+    brotli = None
+
+
+ASSET_DIRECTORY_NAME = "assets"
+DT_BUNDLE_NAME = "dt_bundle.js"
+
+
+def shared_dt_url(asset_href: str) -> str:
+    """Return the module URL itables' connected mode imports DataTables from.
+
+    Module specifiers must be absolute or start with ``./``, so a relative
+    asset directory is anchored to the page.
+    """
+
+    base = asset_href.rstrip("/")
+    if not base.startswith(("/", "./", "../")) and "://" not in base:
+        base = f"./{base}"
+    return f"{base}/{DT_BUNDLE_NAME}"
+
+
+def asset_files() -> dict[str, bytes]:
+    return {
+        "plotly.min.js": get_plotlyjs().encode("utf-8"),
+        DT_BUNDLE_NAME: Path(options.dt_bundle).read_bytes(),
+        "dt_bundle.css": Path(options.dt_bundle).with_suffix(".css").read_bytes(),
+    }
+
+
+def asset_version(files: dict[str, bytes]) -> str:
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(files[name])
+    return digest.hexdigest()[:16]
+
+
+def compression_suffixes() -> tuple[str, ...]:
+    return (".gz", ".br") if brotli is not None else (".gz",)
+
+
+def write_precompressed(path: Path) -> list[Path]:
+    """Write ``.gz`` and, when brotli is installed, ``.br`` siblings of a file."""
+
+    content = path.read_bytes()
+    compressors = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressors[".br"] = brotli.compress
+    written = []
+    for suffix, compress in compressors.items():
+        target = path.with_name(path.name + suffix)
+        staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}{suffix}.tmp")
+        try:
+            staging.write_bytes(compress(content))
+            staging.replace(target)
+        finally:
+            staging.unlink(missing_ok=True)
+        written.append(target)
+    return written
+
+
+def remove_precompressed(path: Path) -> None:
+    """Remove compressed siblings that would no longer match ``path``."""
+
+    for suffix in (".gz", ".br"):
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def write_shared_assets(report_dir: Path, *, precompress: bool = False) -> str:
+    """Write the report bundles once and return their href relative to ``report_dir``.
+
+    Bundles live in ``assets/<content hash>/`` next to the reports, so a
+    library upgrade creates a new directory instead of changing files that
+    browsers may have cached. An existing directory is reused as is.
+    """
+
+    files = asset_files()
+    version = asset_version(files)
+    asset_root = report_dir / ASSET_DIRECTORY_NAME
+    target = asset_root / version
+    if not target.is_dir():
+        staging = asset_root / f".{version}.{uuid.uuid4().hex}.tmp"
+        staging.mkdir(parents=True)
+        try:
+            for name, content in files.items():
+                (staging / name).write_bytes(content)
+            try:
+                staging.rename(target)
+            except OSError:
+                if not target.is_dir():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    if precompress:
+        for name in files:
+            path = target / name
+            if not all(
+                path.with_name(path.name + suffix).is_file()
+                for suffix in compression_suffixes()
+            ):
+                write_precompressed(path)
+    return f"{ASSET_DIRECTORY_NAME}/{version}"
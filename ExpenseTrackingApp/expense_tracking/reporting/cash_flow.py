@@ -2,15 +2,62 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from dataclasses import dataclass
-from datetime import date
+from dataclasses import dataclass, field, replace
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import Iterable
+from typing import Iterable, Mapping, Protocol, Sequence
+
+from expense_tracking.timing import timed
 
 
 ALLOWED_TRANSACTION_TYPES = ("income", "expense", "investment")
 ZERO = Decimal("0.00")
+SUMMARY_FIELDS = {
+    "income": "income",
+    "expense": "expenses",
+    "investment": "investments",
+}
+TYPE_INDEX = {
+    transaction_type: index
+    for index, transaction_type in enumerate(ALLOWED_TRANSACTION_TYPES)
+}
+
+
+class DateRange(Protocol):
+    """Anything with an inclusive date range, such as a ``ReportPeriod``."""
+
+    @property
+    def start_date(self) -> date: ...
+
+    @property
+    def end_date(self) -> date: ...
+
+
+def summary_field(transaction_type: str) -> str:
+    try:
+        return SUMMARY_FIELDS[transaction_type]
+    except KeyError:
+        raise ValueError(f"invalid transaction type: {transaction_type!r}") from None
+
+
+def type_index(transaction_type: str) -> int:
+    try:
+        return TYPE_INDEX[transaction_type]
+    except KeyError:
+        raise ValueError(f"invalid transaction type: {transaction_type!r}") from None
+
+
+def cents_from_amount(amount: Decimal) -> int:
+    cents = amount.scaleb(2)
+    if cents != cents.to_integral_value():
+        raise ValueError("transaction amounts must have at most two decimal places")
+    return int(cents)
+
+
+def amount_from_cents(cents: int) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
 
 
 @dataclass(frozen=True)
@@ -45,6 +92,24 @@ class MonthlySummary:
     def net_cash_flow(self) -> Decimal:
         return self.income - self.expenses - self.investments
 
+    def adjusted(self, transaction_type: str, amount: Decimal) -> "MonthlySummary":
+        """Return a copy with a signed amount added to one transaction type."""
+
+        field = summary_field(transaction_type)
+        return replace(self, **{field: getattr(self, field) + amount})
+
+    def merge(self, other: "MonthlySummary") -> "MonthlySummary":
+        """Combine two partial summaries of the same month."""
+
+        if other.month != self.month:
+            raise ValueError("only summaries of the same month can be merged")
+        return MonthlySummary(
+            month=self.month,
+            income=self.income + other.income,
+            expenses=self.expenses + other.expenses,
+            investments=self.investments + other.investments,
+        )
+
 
 @dataclass(frozen=True)
 class CashFlowSummary:
@@ -64,32 +129,101 @@ class CashFlowSummary:
     def net_cash_flow(self) -> Decimal:
         return self.income - self.expenses - self.investments
 
+    def adjusted(self, transaction_type: str, amount: Decimal) -> "CashFlowSummary":
+        """Return a copy with a signed amount added to one transaction type."""
+
+        field = summary_field(transaction_type)
+        return replace(self, **{field: getattr(self, field) + amount})
+
+    def merge(self, other: "CashFlowSummary") -> "CashFlowSummary":
+        """Combine summaries of two adjacent periods into one spanning both."""
+
+        first, second = sorted((self, other), key=lambda summary: summary.start_date)
+        if second.start_date != first.end_date + timedelta(days=1):
+            raise ValueError("only summaries of adjacent periods can be merged")
+        return CashFlowSummary(
+            start_date=first.start_date,
+            end_date=second.end_date,
+            income=first.income + second.income,
+            expenses=first.expenses + second.expenses,
+            investments=first.investments + second.investments,
+        )
+
+
+@dataclass(frozen=True)
+class TypePartition:
+    """The transactions of one type in a report, and their total."""
+
+    transactions: tuple[ReportTransaction, ...] = ()
+    subtotal: Decimal = ZERO
+
+
+EMPTY_PARTITIONS = tuple(TypePartition() for _ in ALLOWED_TRANSACTION_TYPES)
+
+
+def partition_by_type(
+    transactions: Iterable[ReportTransaction],
+) -> tuple[TypePartition, ...]:
+    """Split transactions by type, in ``ALLOWED_TRANSACTION_TYPES`` order."""
+
+    grouped: list[list[ReportTransaction]] = [[] for _ in ALLOWED_TRANSACTION_TYPES]
+    for transaction in transactions:
+        grouped[type_index(transaction.transaction_type)].append(transaction)
+    return tuple(
+        TypePartition(
+            transactions=tuple(items),
+            subtotal=sum((item.amount for item in items), ZERO),
+        )
+        for items in grouped
+    )
+
 
 @dataclass(frozen=True)
 class CashFlowReport:
-    """Calculated report data, independent of its output format."""
+    """Calculated report data, independent of its output format.
+
+    The builders split transactions by type while they read them and pass
+    the partitions and the set of report ids in, so per-type lookups and
+    subtotals are stored values that always agree, and duplicate ids are
+    found without a scan. A report constructed without them derives both
+    from ``transactions`` once.
+    """
 
     summary: CashFlowSummary
     monthly: tuple[MonthlySummary, ...]
     transactions: tuple[ReportTransaction, ...]
+    partitions: tuple[TypePartition, ...] | None = field(
+        default=None,
+        compare=False,
+        repr=False,
+    )
+    transaction_ids: frozenset[int] | None = field(
+        default=None,
+        compare=False,
+        repr=False,
+    )
+
+    def __post_init__(self) -> None:
+        if self.partitions is None:
+            object.__setattr__(
+                self,
+                "partitions",
+                partition_by_type(self.transactions),
+            )
+        elif len(self.partitions) != len(ALLOWED_TRANSACTION_TYPES):
+            raise ValueError("a report needs one partition per transaction type")
+        if self.transaction_ids is None:
+            object.__setattr__(
+                self,
+                "transaction_ids",
+                frozenset(transaction.id for transaction in self.transactions),
+            )
 
     def transactions_for(self, transaction_type: str) -> tuple[ReportTransaction, ...]:
-        if transaction_type not in ALLOWED_TRANSACTION_TYPES:
-            raise ValueError(f"invalid transaction type: {transaction_type!r}")
-        return tuple(
-            transaction
-            for transaction in self.transactions
-            if transaction.transaction_type == transaction_type
-        )
+        return self.partitions[type_index(transaction_type)].transactions
 
     def subtotal_for(self, transaction_type: str) -> Decimal:
-        return sum(
-            (
-                transaction.amount
-                for transaction in self.transactions_for(transaction_type)
-            ),
-            ZERO,
-        )
+        return self.partitions[type_index(transaction_type)].subtotal
 
 
 def first_of_month(value: date) -> date:
@@ -102,25 +236,45 @@ def next_month(value: date) -> date:
     return date(value.year, value.month + 1, 1)
 
 
+def build_monthly_summaries(
+    monthly_totals: Mapping[date, Mapping[str, Decimal]],
+    start_date: date,
+    end_date: date,
+) -> tuple[MonthlySummary, ...]:
+    """Return one summary per calendar month in the range, zero-filling gaps."""
+
+    monthly: list[MonthlySummary] = []
+    month = first_of_month(start_date)
+    final_month = first_of_month(end_date)
+    while month <= final_month:
+        month_totals = monthly_totals.get(month, {})
+        monthly.append(
+            MonthlySummary(
+                month=month,
+                income=month_totals.get("income", ZERO),
+                expenses=month_totals.get("expense", ZERO),
+                investments=month_totals.get("investment", ZERO),
+            )
+        )
+        month = next_month(month)
+    return tuple(monthly)
+
+
+def sort_key(transaction: ReportTransaction) -> tuple[date, int]:
+    return (transaction.occurred_on, transaction.id)
+
+
+@timed("cash_flow.build_report")
 def build_cash_flow_report(
     transactions: Iterable[ReportTransaction],
     start_date: date,
     end_date: date,
 ) -> CashFlowReport:
-    """Build a report for an inclusive date range."""
+    """Build a report for an inclusive date range in a single pass."""
 
     if end_date < start_date:
         raise ValueError("end date must be on or after start date")
 
-    selected = sorted(
-        (
-            transaction
-            for transaction in transactions
-            if start_date <= transaction.occurred_on <= end_date
-        ),
-        key=lambda transaction: (transaction.occurred_on, transaction.id),
-    )
-
     totals = {transaction_type: ZERO for transaction_type in ALLOWED_TRANSACTION_TYPES}
     monthly_totals: dict[date, dict[str, Decimal]] = defaultdict(
         lambda: {
@@ -129,26 +283,31 @@ def build_cash_flow_report(
         }
     )
 
-    for transaction in selected:
+    # Consume the input once, so a streamed source is never buffered twice.
+    # Database results already arrive ordered and skip the sort entirely.
+    selected: list[ReportTransaction] = []
+    by_type: dict[str, list[ReportTransaction]] = {
+        transaction_type: [] for transaction_type in ALLOWED_TRANSACTION_TYPES
+    }
+    previous_key: tuple[date, int] | None = None
+    in_order = True
+    for transaction in transactions:
+        if not start_date <= transaction.occurred_on <= end_date:
+            continue
+        key = sort_key(transaction)
+        if previous_key is not None and key < previous_key:
+            in_order = False
+        previous_key = key
+        selected.append(transaction)
+        by_type[transaction.transaction_type].append(transaction)
         totals[transaction.transaction_type] += transaction.amount
         monthly_totals[first_of_month(transaction.occurred_on)][
             transaction.transaction_type
         ] += transaction.amount
-
-    monthly: list[MonthlySummary] = []
-    month = first_of_month(start_date)
-    final_month = first_of_month(end_date)
-    while month <= final_month:
-        month_totals = monthly_totals[month]
-        monthly.append(
-            MonthlySummary(
-                month=month,
-                income=month_totals["income"],
-                expenses=month_totals["expense"],
-                investments=month_totals["investment"],
-            )
-        )
-        month = next_month(month)
+    if not in_order:
+        selected.sort(key=sort_key)
+        for items in by_type.values():
+            items.sort(key=sort_key)
 
     return CashFlowReport(
         summary=CashFlowSummary(
@@ -158,6 +317,254 @@ def build_cash_flow_report(
             expenses=totals["expense"],
             investments=totals["investment"],
         ),
-        monthly=tuple(monthly),
+        monthly=build_monthly_summaries(monthly_totals, start_date, end_date),
         transactions=tuple(selected),
+        partitions=tuple(
+            TypePartition(
+                transactions=tuple(by_type[transaction_type]),
+                subtotal=totals[transaction_type],
+            )
+            for transaction_type in ALLOWED_TRANSACTION_TYPES
+        ),
+        transaction_ids=frozenset(transaction.id for transaction in selected),
+    )
+
+
+def occurred_on(transaction: ReportTransaction) -> date:
+    return transaction.occurred_on
+
+
+@timed("cash_flow.build_reports")
+def build_cash_flow_reports(
+    transactions: Iterable[ReportTransaction],
+    periods: Sequence[DateRange],
+) -> tuple[CashFlowReport, ...]:
+    """Build one report per period from a single pass over the transactions.
+
+    Transactions are bucketed by month once. Each period takes its complete
+    months from prefix sums over those buckets and sums only the partial
+    months at its edges directly. Report transactions are slices of one
+    shared, sorted tuple, and periods selecting the same transactions share
+    the same slice, type partitions and id set.
+    """
+
+    for period in periods:
+        if period.end_date < period.start_date:
+            raise ValueError("end date must be on or after start date")
+
+    ordered: list[ReportTransaction] = []
+    buckets: dict[date, dict[str, Decimal]] = defaultdict(
+        lambda: {
+            transaction_type: ZERO
+            for transaction_type in ALLOWED_TRANSACTION_TYPES
+        }
+    )
+    previous_key: tuple[date, int] | None = None
+    in_order = True
+    for transaction in transactions:
+        key = sort_key(transaction)
+        if previous_key is not None and key < previous_key:
+            in_order = False
+        previous_key = key
+        ordered.append(transaction)
+        buckets[first_of_month(transaction.occurred_on)][
+            transaction.transaction_type
+        ] += transaction.amount
+    if not in_order:
+        ordered.sort(key=sort_key)
+    shared = tuple(ordered)
+    del ordered
+
+    months = sorted(buckets)
+    prefix = {transaction_type: [ZERO] for transaction_type in ALLOWED_TRANSACTION_TYPES}
+    for month in months:
+        for transaction_type, running in prefix.items():
+            running.append(running[-1] + buckets[month][transaction_type])
+
+    slices: dict[
+        tuple[int, int],
+        tuple[tuple[ReportTransaction, ...], tuple[TypePartition, ...], frozenset[int]],
+    ] = {}
+    reports: list[CashFlowReport] = []
+    for period in periods:
+        start_date = period.start_date
+        end_date = period.end_date
+        first = bisect_left(shared, start_date, key=occurred_on)
+        last = bisect_right(shared, end_date, key=occurred_on)
+        if (first, last) not in slices:
+            selected = shared[first:last]
+            slices[(first, last)] = (
+                selected,
+                partition_by_type(selected),
+                frozenset(transaction.id for transaction in selected),
+            )
+        selected, partitions, transaction_ids = slices[(first, last)]
+
+        totals = {transaction_type: ZERO for transaction_type in ALLOWED_TRANSACTION_TYPES}
+        monthly_totals: dict[date, Mapping[str, Decimal]] = {}
+        complete_start = start_date if start_date.day == 1 else next_month(start_date)
+        complete_end = first_of_month(end_date + timedelta(days=1))
+        if complete_start <= complete_end:
+            low = bisect_left(months, complete_start)
+            high = bisect_left(months, complete_end)
+            for month in months[low:high]:
+                monthly_totals[month] = buckets[month]
+            for transaction_type, running in prefix.items():
+                totals[transaction_type] += running[high] - running[low]
+            edges = [
+                (start_date, complete_start - timedelta(days=1)),
+                (complete_end, end_date),
+            ]
+        else:
+            edges = [(start_date, end_date)]
+
+        for edge_start, edge_end in edges:
+            partial: dict[date, dict[str, Decimal]] = defaultdict(
+                lambda: {
+                    transaction_type: ZERO
+                    for transaction_type in ALLOWED_TRANSACTION_TYPES
+                }
+            )
+            for transaction in shared[
+                bisect_left(shared, edge_start, key=occurred_on):
+                bisect_right(shared, edge_end, key=occurred_on)
+            ]:
+                partial[first_of_month(transaction.occurred_on)][
+                    transaction.transaction_type
+                ] += transaction.amount
+                totals[transaction.transaction_type] += transaction.amount
+            monthly_totals.update(partial)
+
+        reports.append(
+            CashFlowReport(
+                summary=CashFlowSummary(
+                    start_date=start_date,
+                    end_date=end_date,
+                    income=totals["income"],
+                    expenses=totals["expense"],
+                    investments=totals["investment"],
+                ),
+                monthly=build_monthly_summaries(monthly_totals, start_date, end_date),
+                transactions=selected,
+                partitions=partitions,
+                transaction_ids=transaction_ids,
+            )
+        )
+    return tuple(reports)
+
+
+@timed("cash_flow.build_summary_report")
+def build_summary_report(
+    monthly: Iterable[MonthlySummary],
+    start_date: date,
+    end_date: date,
+) -> CashFlowReport:
+    """Build a report from monthly totals alone, without transaction rows."""
+
+    if end_date < start_date:
+        raise ValueError("end date must be on or after start date")
+    summaries = tuple(monthly)
+    return CashFlowReport(
+        summary=CashFlowSummary(
+            start_date=start_date,
+            end_date=end_date,
+            income=sum((item.income for item in summaries), ZERO),
+            expenses=sum((item.expenses for item in summaries), ZERO),
+            investments=sum((item.investments for item in summaries), ZERO),
+        ),
+        monthly=summaries,
+        transactions=(),
+        partitions=EMPTY_PARTITIONS,
+        transaction_ids=frozenset(),
+    )
+
+
+def apply_transaction_changes(
+    report: CashFlowReport,
+    *,
+    inserted: Iterable[ReportTransaction] = (),
+    updated: Iterable[tuple[ReportTransaction, ReportTransaction]] = (),
+    deleted: Iterable[ReportTransaction] = (),
+) -> CashFlowReport:
+    """Return ``report`` with transaction changes applied, without rebuilding it.
+
+    ``updated`` holds ``(previous, current)`` pairs. Changes are located by
+    binary search on the sorted transactions and their type's partition, and
+    only the affected totals are adjusted; changes outside the report period
+    are ignored. An added transaction whose id is already in the report's id
+    index is rejected whatever its date, so a mis-dated duplicate cannot be
+    counted twice. No transaction is visited that is not being changed.
+    """
+
+    start_date = report.summary.start_date
+    end_date = report.summary.end_date
+    changes = tuple(updated)
+    removals = [*deleted, *(previous for previous, _ in changes)]
+    additions = [*inserted, *(current for _, current in changes)]
+
+    ordered = list(report.transactions)
+    removed_ids: set[int] = set()
+    added_ids: set[int] = set()
+    changed: dict[int, list[ReportTransaction]] = {}
+    deltas: dict[tuple[date, str], Decimal] = defaultdict(lambda: ZERO)
+
+    def partition_items(transaction: ReportTransaction) -> list[ReportTransaction]:
+        index = type_index(transaction.transaction_type)
+        if index not in changed:
+            changed[index] = list(report.partitions[index].transactions)
+        return changed[index]
+
+    for transaction in removals:
+        if not start_date <= transaction.occurred_on <= end_date:
+            continue
+        index = bisect_left(ordered, sort_key(transaction), key=sort_key)
+        if index == len(ordered) or ordered[index] != transaction:
+            raise ValueError(f"transaction {transaction.id} is not part of the report")
+        del ordered[index]
+        items = partition_items(transaction)
+        del items[bisect_left(items, sort_key(transaction), key=sort_key)]
+        removed_ids.add(transaction.id)
+        deltas[
+            (first_of_month(transaction.occurred_on), transaction.transaction_type)
+        ] -= transaction.amount
+    for transaction in additions:
+        if not start_date <= transaction.occurred_on <= end_date:
+            continue
+        if transaction.id in added_ids or (
+            transaction.id in report.transaction_ids
+            and transaction.id not in removed_ids
+        ):
+            raise ValueError(f"transaction {transaction.id} is already in the report")
+        key = sort_key(transaction)
+        ordered.insert(bisect_left(ordered, key, key=sort_key), transaction)
+        items = partition_items(transaction)
+        items.insert(bisect_left(items, key, key=sort_key), transaction)
+        added_ids.add(transaction.id)
+        deltas[
+            (first_of_month(transaction.occurred_on), transaction.transaction_type)
+        ] += transaction.amount
+
+    summary = report.summary
+    monthly = {item.month: item for item in report.monthly}
+    partitions = list(report.partitions)
+    for index, items in changed.items():
+        partitions[index] = TypePartition(
+            transactions=tuple(items),
+            subtotal=partitions[index].subtotal,
+        )
+    for (month, transaction_type), amount in deltas.items():
+        summary = summary.adjusted(transaction_type, amount)
+        monthly[month] = monthly[month].adjusted(transaction_type, amount)
+        index = type_index(transaction_type)
+        partitions[index] = replace(
+            partitions[index],
+            subtotal=partitions[index].subtotal + amount,
+        )
+
+    return CashFlowReport(
+        summary=summary,
+        monthly=tuple(monthly.values()),
+        transactions=tuple(ordered),
+        partitions=tuple(partitions),
+        transaction_ids=report.transaction_ids.difference(removed_ids).union(added_ids),
     )
@@ -5,6 +5,7 @@ from __future__ import annotations
 from plotly import graph_objects as go
 
 from expense_tracking.reporting.cash_flow import CashFlowReport
+from expense_tracking.timing import timed
 
 
 INCOME_COLOR = "#198754"
@@ -15,6 +16,7 @@ NEGATIVE_NET_COLOR = "#dc3545"
 NEUTRAL_NET_COLOR = "#6c757d"
 
 
+@timed("charts.waterfall")
 def create_cash_flow_waterfall(report: CashFlowReport) -> go.Figure:
     summary = report.summary
     net_color = (
@@ -55,6 +57,7 @@ def create_cash_flow_waterfall(report: CashFlowReport) -> go.Figure:
     return figure
 
 
+@timed("charts.monthly_net_cash_flow")
 def create_monthly_net_cash_flow_chart(report: CashFlowReport) -> go.Figure:
     """Render one signed, color-coded net-cash-flow bar per month."""
 
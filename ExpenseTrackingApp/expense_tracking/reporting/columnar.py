@@ -0,0 +1,185 @@
+"""Columnar NumPy engine for cash-flow report calculations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from expense_tracking.reporting.cash_flow import (
+    ALLOWED_TRANSACTION_TYPES,
+    CashFlowReport,
+    CashFlowSummary,
+    MonthlySummary,
+    ReportTransaction,
+    TypePartition,
+    amount_from_cents,
+    cents_from_amount,
+    first_of_month,
+    next_month,
+)
+
+
+TYPE_CODES = {
+    transaction_type: code
+    for code, transaction_type in enumerate(ALLOWED_TRANSACTION_TYPES)
+}
+INT64_MAX = np.iinfo(np.int64).max
+
+
+@dataclass(frozen=True)
+class TransactionColumns:
+    """Transactions stored as aligned NumPy columns.
+
+    ``occurred_on`` holds ``datetime64[D]`` dates, ``type_codes`` the index of
+    each type in ``ALLOWED_TRANSACTION_TYPES`` and ``amount_cents`` exact
+    integer cents. ``transactions`` keeps the source objects so that reports
+    can still list them.
+    """
+
+    ids: np.ndarray
+    occurred_on: np.ndarray
+    type_codes: np.ndarray
+    amount_cents: np.ndarray
+    transactions: Sequence[ReportTransaction]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "ids", np.asarray(self.ids, dtype=np.int64))
+        object.__setattr__(
+            self,
+            "occurred_on",
+            np.asarray(self.occurred_on, dtype="datetime64[D]"),
+        )
+        object.__setattr__(
+            self,
+            "type_codes",
+            np.asarray(self.type_codes, dtype=np.int8),
+        )
+        object.__setattr__(
+            self,
+            "amount_cents",
+            np.asarray(self.amount_cents, dtype=np.int64),
+        )
+        length = len(self.transactions)
+        for column in (self.ids, self.occurred_on, self.type_codes, self.amount_cents):
+            if column.ndim != 1 or len(column) != length:
+                raise ValueError("transaction columns must be aligned one-dimensional arrays")
+        if length and (
+            self.type_codes.min() < 0
+            or self.type_codes.max() >= len(ALLOWED_TRANSACTION_TYPES)
+        ):
+            raise ValueError("transaction type codes are out of range")
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: Iterable[ReportTransaction],
+    ) -> "TransactionColumns":
+        source = tuple(transactions)
+        return cls(
+            ids=np.fromiter(
+                (transaction.id for transaction in source),
+                dtype=np.int64,
+                count=len(source),
+            ),
+            occurred_on=np.array(
+                [transaction.occurred_on for transaction in source],
+                dtype="datetime64[D]",
+            ),
+            type_codes=np.fromiter(
+                (TYPE_CODES[transaction.transaction_type] for transaction in source),
+                dtype=np.int8,
+                count=len(source),
+            ),
+            amount_cents=np.fromiter(
+                (cents_from_amount(transaction.amount) for transaction in source),
+                dtype=np.int64,
+                count=len(source),
+            ),
+            transactions=source,
+        )
+
+
+def month_starts(start_date: date, end_date: date) -> list[date]:
+    """Return every month start in the range plus the following month start."""
+
+    months = [first_of_month(start_date)]
+    while months[-1] <= first_of_month(end_date):
+        months.append(next_month(months[-1]))
+    return months
+
+
+def build_cash_flow_report_columnar(
+    columns: TransactionColumns,
+    start_date: date,
+    end_date: date,
+) -> CashFlowReport:
+    """Build the same report as ``build_cash_flow_report`` from NumPy columns.
+
+    Totals are exact: per-type running sums of integer cents are taken over
+    the date-sorted selection and sliced at month boundaries found with
+    ``searchsorted``.
+    """
+
+    if end_date < start_date:
+        raise ValueError("end date must be on or after start date")
+
+    selected = np.flatnonzero(
+        (columns.occurred_on >= np.datetime64(start_date, "D"))
+        & (columns.occurred_on <= np.datetime64(end_date, "D"))
+    )
+    order = selected[
+        np.lexsort((columns.ids[selected], columns.occurred_on[selected]))
+    ]
+    dates = columns.occurred_on[order]
+    codes = columns.type_codes[order]
+    cents = columns.amount_cents[order]
+    if len(cents) and int(np.abs(cents).max()) > INT64_MAX // len(cents):
+        raise ValueError("transaction amounts are too large for the columnar engine")
+
+    months = month_starts(start_date, end_date)
+    boundaries = np.searchsorted(dates, np.array(months, dtype="datetime64[D]"))
+
+    monthly_cents: dict[str, np.ndarray] = {}
+    totals: dict[str, Decimal] = {}
+    for transaction_type, code in TYPE_CODES.items():
+        running = np.zeros(len(cents) + 1, dtype=np.int64)
+        np.cumsum(np.where(codes == code, cents, 0), out=running[1:])
+        at_boundaries = running[boundaries]
+        monthly_cents[transaction_type] = at_boundaries[1:] - at_boundaries[:-1]
+        totals[transaction_type] = amount_from_cents(running[-1])
+
+    monthly = tuple(
+        MonthlySummary(
+            month=month,
+            income=amount_from_cents(monthly_cents["income"][index]),
+            expenses=amount_from_cents(monthly_cents["expense"][index]),
+            investments=amount_from_cents(monthly_cents["investment"][index]),
+        )
+        for index, month in enumerate(months[:-1])
+    )
+    source = columns.transactions
+    return CashFlowReport(
+        summary=CashFlowSummary(
+            start_date=start_date,
+            end_date=end_date,
+            income=totals["income"],
+            expenses=totals["expense"],
+            investments=totals["investment"],
+        ),
+        monthly=monthly,
+        transactions=tuple(source[index] for index in order.tolist()),
+        partitions=tuple(
+            TypePartition(
+                transactions=tuple(
+                    source[index] for index in order[codes == code].tolist()
+                ),
+                subtotal=totals[transaction_type],
+            )
+            for transaction_type, code in TYPE_CODES.items()
+        ),
+        transaction_ids=frozenset(columns.ids[order].tolist()),
+    )
@@ -2,20 +2,43 @@
 
 from __future__ import annotations
 
-from datetime import date
+import pickle
+from collections import defaultdict
+from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Iterator, Mapping
 
-import psycopg
-from psycopg.rows import dict_row
+from expense_tracking.config import (
+    DAILY_TOTALS_QUERY_PATH,
+    DATA_VERSION_QUERY_PATH,
+    MONTHLY_ROLLUP_QUERY_PATH,
+    MONTHLY_TOTALS_QUERY_PATH,
+    REPORT_QUERY_PATH,
+    load_query,
+)
+from expense_tracking.pool import async_connection, connection
+from expense_tracking.reporting.cash_flow import (
+    CashFlowReport,
+    MonthlySummary,
+    ReportTransaction,
+    build_cash_flow_report,
+    build_monthly_summaries,
+    build_summary_report,
+)
+from expense_tracking.reporting.ledger import DailyLedgerIndex
+from expense_tracking.timing import timed
 
-from expense_tracking.config import REPORT_QUERY_PATH
-from expense_tracking.reporting.cash_flow import ReportTransaction
+
+DEFAULT_ITERSIZE = 2000
 
 
 def load_report_query(path: Path = REPORT_QUERY_PATH) -> str:
-    return path.read_text(encoding="utf-8")
+    return load_query(path)
+
+
+def load_monthly_totals_query(path: Path = MONTHLY_TOTALS_QUERY_PATH) -> str:
+    return load_query(path)
 
 
 def transaction_from_row(row: Mapping[str, Any]) -> ReportTransaction:
@@ -28,6 +51,47 @@ def transaction_from_row(row: Mapping[str, Any]) -> ReportTransaction:
     )
 
 
+def report_parameters(
+    *,
+    start_date: date,
+    end_date_exclusive: date,
+) -> dict[str, date]:
+    if end_date_exclusive <= start_date:
+        raise ValueError("exclusive end date must be after start date")
+    return {
+        "start_date": start_date,
+        "end_date_exclusive": end_date_exclusive,
+    }
+
+
+def rollup_parameters(
+    *,
+    start_date: date,
+    end_date_exclusive: date,
+) -> dict[str, date]:
+    """Split a half-open range into partial edges and whole months between.
+
+    ``full_start`` and ``full_end`` bound the complete months. When the range
+    holds no complete month both equal ``end_date_exclusive``, so the leading
+    edge covers the whole range and the trailing edge is empty.
+    """
+
+    parameters = report_parameters(
+        start_date=start_date,
+        end_date_exclusive=end_date_exclusive,
+    )
+    full_start = (
+        start_date
+        if start_date.day == 1
+        else (start_date.replace(day=28) + timedelta(days=4)).replace(day=1)
+    )
+    full_end = end_date_exclusive.replace(day=1)
+    if full_start >= full_end:
+        full_start = full_end = end_date_exclusive
+    return {**parameters, "full_start": full_start, "full_end": full_end}
+
+
+@timed("data.load_transactions")
 def load_transactions(
     *,
     start_date: date,
@@ -37,22 +101,237 @@ def load_transactions(
 ) -> tuple[ReportTransaction, ...]:
     """Load transactions for a half-open date range using a read-only session."""
 
-    if end_date_exclusive <= start_date:
-        raise ValueError("exclusive end date must be after start date")
+    parameters = report_parameters(
+        start_date=start_date,
+        end_date_exclusive=end_date_exclusive,
+    )
+    report_query = query if query is not None else load_report_query()
+
+    with connection(database, read_only=True) as pooled:
+        with pooled.cursor() as cursor:
+            cursor.execute(report_query, parameters)
+            rows = cursor.fetchall()
+
+    return tuple(transaction_from_row(row) for row in rows)
+
+
+def iter_transactions(
+    *,
+    start_date: date,
+    end_date_exclusive: date,
+    database: str,
+    query: str | None = None,
+    itersize: int = DEFAULT_ITERSIZE,
+) -> Iterator[ReportTransaction]:
+    """Stream transactions for a half-open date range from a server-side cursor.
 
+    Rows are fetched ``itersize`` at a time and converted one by one, so
+    neither the raw rows nor the converted transactions are held in memory
+    together. The pooled connection is returned once the iterator is
+    exhausted or closed.
+    """
+
+    parameters = report_parameters(
+        start_date=start_date,
+        end_date_exclusive=end_date_exclusive,
+    )
+    if isinstance(itersize, bool) or not isinstance(itersize, int) or itersize < 1:
+        raise ValueError("itersize must be a positive integer")
     report_query = query if query is not None else load_report_query()
-    parameters = {
-        "start_date": start_date,
-        "end_date_exclusive": end_date_exclusive,
-    }
+    return stream_transactions(report_query, parameters, database, itersize)
 
-    with psycopg.connect(
-        dbname=database,
-        row_factory=dict_row,
-        options="-c default_transaction_read_only=on",
-    ) as connection:
-        with connection.cursor() as cursor:
+
+def stream_transactions(
+    report_query: str,
+    parameters: Mapping[str, Any],
+    database: str,
+    itersize: int,
+) -> Iterator[ReportTransaction]:
+    with connection(database, read_only=True) as pooled:
+        with pooled.cursor(name="report_transactions") as cursor:
+            cursor.itersize = itersize
             cursor.execute(report_query, parameters)
+            for row in cursor:
+                yield transaction_from_row(row)
+
+
+def monthly_summaries_from_rows(
+    rows: Iterable[Mapping[str, Any]],
+    start_date: date,
+    end_date: date,
+) -> tuple[MonthlySummary, ...]:
+    monthly_totals: dict[date, dict[str, Decimal]] = defaultdict(dict)
+    for row in rows:
+        monthly_totals[row["month"]][str(row["transaction_type"])] = Decimal(
+            row["amount"]
+        )
+    return build_monthly_summaries(monthly_totals, start_date, end_date)
+
+
+@timed("data.load_monthly_summaries")
+def load_monthly_summaries(
+    *,
+    start_date: date,
+    end_date_exclusive: date,
+    database: str,
+    query: str | None = None,
+    use_rollup: bool = False,
+) -> tuple[MonthlySummary, ...]:
+    """Load per-month totals aggregated by PostgreSQL for a half-open range.
+
+    At most one row per month and transaction type crosses the connection;
+    months without transactions are zero-filled. With ``use_rollup``, complete
+    months are read from the trigger-maintained rollup table, so the cost
+    depends on the number of months rather than the number of transactions.
+    """
+
+    parameters = (
+        rollup_parameters(start_date=start_date, end_date_exclusive=end_date_exclusive)
+        if use_rollup
+        else report_parameters(
+            start_date=start_date,
+            end_date_exclusive=end_date_exclusive,
+        )
+    )
+    if query is not None:
+        totals_query = query
+    elif use_rollup:
+        totals_query = load_monthly_totals_query(MONTHLY_ROLLUP_QUERY_PATH)
+    else:
+        totals_query = load_monthly_totals_query()
+
+    with connection(database, read_only=True) as pooled:
+        with pooled.cursor() as cursor:
+            cursor.execute(totals_query, parameters)
             rows = cursor.fetchall()
 
+    return monthly_summaries_from_rows(
+        rows,
+        start_date,
+        end_date_exclusive - timedelta(days=1),
+    )
+
+
+@timed("data.load_cash_flow_report")
+def load_cash_flow_report(
+    *,
+    start_date: date,
+    end_date: date,
+    database: str,
+    summary_only: bool = False,
+) -> CashFlowReport:
+    """Load and build the report for an inclusive range, as every renderer does.
+
+    Summary-only reports come from the monthly rollup and list no
+    transactions; full reports stream their transactions.
+    """
+
+    end_date_exclusive = end_date + timedelta(days=1)
+    if summary_only:
+        monthly = load_monthly_summaries(
+            start_date=start_date,
+            end_date_exclusive=end_date_exclusive,
+            database=database,
+            use_rollup=True,
+        )
+        return build_summary_report(monthly, start_date, end_date)
+    transactions = iter_transactions(
+        start_date=start_date,
+        end_date_exclusive=end_date_exclusive,
+        database=database,
+    )
+    return build_cash_flow_report(transactions, start_date, end_date)
+
+
+def write_report_data(report: CashFlowReport, path: Path) -> None:
+    """Save a built report for a renderer running in another process."""
+
+    path.write_bytes(pickle.dumps(report, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def read_report_data(path: Path) -> CashFlowReport:
+    """Load a report saved by ``write_report_data``; only read trusted files."""
+
+    report = pickle.loads(path.read_bytes())
+    if not isinstance(report, CashFlowReport):
+        raise ValueError(f"{path} does not contain a cash-flow report")
+    return report
+
+
+@timed("data.load_daily_ledger")
+def load_daily_ledger(
+    *,
+    start_date: date,
+    end_date_exclusive: date,
+    database: str,
+    query: str | None = None,
+) -> DailyLedgerIndex:
+    """Load per-day totals aggregated by PostgreSQL into a ``DailyLedgerIndex``.
+
+    At most one row per day and transaction type crosses the connection, and
+    any sub-range of the half-open range can then be summarized in memory.
+    """
+
+    parameters = report_parameters(
+        start_date=start_date,
+        end_date_exclusive=end_date_exclusive,
+    )
+    totals_query = query if query is not None else load_query(DAILY_TOTALS_QUERY_PATH)
+
+    with connection(database, read_only=True) as pooled:
+        with pooled.cursor() as cursor:
+            cursor.execute(totals_query, parameters)
+            rows = cursor.fetchall()
+
+    daily_totals: dict[date, dict[str, Decimal]] = defaultdict(dict)
+    for row in rows:
+        daily_totals[row["occurred_on"]][str(row["transaction_type"])] = Decimal(
+            row["amount"]
+        )
+    return DailyLedgerIndex.from_daily_totals(
+        daily_totals,
+        start_date,
+        end_date_exclusive - timedelta(days=1),
+    )
+
+
+async def load_transactions_async(
+    *,
+    start_date: date,
+    end_date_exclusive: date,
+    database: str,
+    query: str | None = None,
+) -> tuple[ReportTransaction, ...]:
+    """Asyncio counterpart of ``load_transactions``."""
+
+    parameters = report_parameters(
+        start_date=start_date,
+        end_date_exclusive=end_date_exclusive,
+    )
+    report_query = query if query is not None else load_report_query()
+
+    async with async_connection(database, read_only=True) as pooled:
+        async with pooled.cursor() as cursor:
+            await cursor.execute(report_query, parameters)
+            rows = await cursor.fetchall()
+
     return tuple(transaction_from_row(row) for row in rows)
+
+
+def load_data_version(database: str, query: str | None = None) -> int:
+    """Return the counter every committed write to the transactions advances.
+
+    Migration ``004`` maintains it with a trigger that advances it once per
+    writing transaction, so it is a read of 16 rows however many
+    transactions exist.
+    """
+
+    version_query = (
+        query if query is not None else load_query(DATA_VERSION_QUERY_PATH)
+    )
+    with connection(database, read_only=True) as pooled:
+        with pooled.cursor() as cursor:
+            cursor.execute(version_query)
+            row = cursor.fetchone()
+
+    return int(row["version"]) if row is not None else 0
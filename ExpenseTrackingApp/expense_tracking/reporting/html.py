@@ -0,0 +1,161 @@
+"""In-process HTML rendering of the cash-flow dashboard, without Quarto."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from html import escape
+from pathlib import Path
+from string import Template
+
+from expense_tracking.config import HTML_REPORT_TEMPLATE
+from expense_tracking.reporting.assets import shared_dt_url
+from expense_tracking.reporting.cash_flow import ALLOWED_TRANSACTION_TYPES, CashFlowReport
+from expense_tracking.reporting.charts import (
+    create_cash_flow_waterfall,
+    create_monthly_net_cash_flow_chart,
+)
+from expense_tracking.reporting.tables import (
+    empty_table_message,
+    transaction_table_assets_html,
+    transaction_table_html,
+)
+from expense_tracking.timing import span, timed
+
+
+TAB_TITLES = {
+    "income": "Income",
+    "expense": "Expenses",
+    "investment": "Investments",
+}
+
+
+def load_html_template(path: Path = HTML_REPORT_TEMPLATE) -> Template:
+    return Template(path.read_text(encoding="utf-8"))
+
+
+def shared_asset_tags(asset_href: str) -> str:
+    """Return the head tag that loads the shared Plotly.js bundle.
+
+    Tables import the shared DataTables bundle themselves through itables'
+    connected mode, so it needs no tag here.
+    """
+
+    base = asset_href.rstrip("/")
+    return f'<script src="{escape(base)}/plotly.min.js"></script>'
+
+
+def value_box(title: str, amount: Decimal, color: str) -> str:
+    return (
+        f'<div class="valuebox {color}">'
+        f'<div class="title">{escape(title)}</div>'
+        f'<div class="value">${amount:,.2f}</div>'
+        "</div>"
+    )
+
+
+def value_boxes_html(report: CashFlowReport) -> str:
+    summary = report.summary
+    return "\n".join(
+        [
+            value_box("Income", summary.income, "success"),
+            value_box("Expenses", summary.expenses, "danger"),
+            value_box("Investments", summary.investments, "primary"),
+            value_box(
+                "Net Cash Flow",
+                summary.net_cash_flow,
+                "success" if summary.net_cash_flow >= 0 else "danger",
+            ),
+        ]
+    )
+
+
+def transaction_tabs_html(
+    report: CashFlowReport,
+    *,
+    summary_only: bool,
+    dt_url: str | None = None,
+) -> str:
+    inputs = []
+    labels = []
+    panels = []
+    for index, transaction_type in enumerate(ALLOWED_TRANSACTION_TYPES):
+        checked = " checked" if index == 0 else ""
+        inputs.append(
+            f'<input type="radio" name="transaction-tabs" '
+            f'id="tab-{transaction_type}"{checked}>'
+        )
+        labels.append(
+            f'<label for="tab-{transaction_type}">'
+            f"{TAB_TITLES[transaction_type]}</label>"
+        )
+        if summary_only:
+            content = "<p>Transactions are omitted from summary-only reports.</p>"
+        else:
+            table = transaction_table_html(report, transaction_type, dt_url=dt_url)
+            content = (
+                table
+                if table is not None
+                else f"<p>{escape(empty_table_message(transaction_type))}</p>"
+            )
+        panels.append(
+            f'<div class="panel body" id="panel-{transaction_type}">{content}</div>'
+        )
+    return "\n".join([*inputs, *labels, *panels])
+
+
+@timed("html.render")
+def render_cash_flow_html(
+    report: CashFlowReport,
+    *,
+    period_label: str,
+    summary_only: bool = False,
+    template: Template | None = None,
+    asset_href: str | None = None,
+) -> str:
+    """Render the dashboard ``cash_flow.qmd`` produces as one page.
+
+    By default Plotly.js is inlined once with the first chart and the
+    DataTables bundle once in the page head, so the page needs no network
+    access. With ``asset_href``, both are loaded from the shared bundle
+    directory written by ``write_shared_assets`` and the page holds only
+    markup and data. The tables then use itables' connected mode, which
+    imports DataTables as an ES module, so such pages must be served over
+    HTTP rather than opened from disk.
+    """
+
+    page = template if template is not None else load_html_template()
+    figure_options = {"full_html": False, "config": {"responsive": True}}
+    if asset_href is not None:
+        head_assets = shared_asset_tags(asset_href)
+    elif summary_only:
+        head_assets = ""
+    else:
+        head_assets = transaction_table_assets_html()
+    waterfall = create_cash_flow_waterfall(report)
+    monthly_chart = create_monthly_net_cash_flow_chart(report)
+    with span("html.figures"):
+        waterfall_html = waterfall.to_html(
+            include_plotlyjs=asset_href is None,
+            **figure_options,
+        )
+        monthly_chart_html = monthly_chart.to_html(
+            include_plotlyjs=False,
+            **figure_options,
+        )
+    return page.substitute(
+        period_label=escape(period_label),
+        transaction_count=(
+            "Summary only"
+            if summary_only
+            else f"{len(report.transactions)} transactions"
+        ),
+        head_assets=head_assets,
+        value_boxes=value_boxes_html(report),
+        waterfall=waterfall_html,
+        monthly_chart=monthly_chart_html,
+        transaction_tabs=transaction_tabs_html(
+            report,
+            summary_only=summary_only,
+            dt_url=shared_dt_url(asset_href) if asset_href is not None else None,
+        ),
+    )
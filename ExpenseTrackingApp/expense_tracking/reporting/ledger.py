@@ -0,0 +1,148 @@
+"""Per-day cash-flow totals indexed for fast arbitrary range summaries."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Mapping
+
+from expense_tracking.reporting.cash_flow import (
+    ALLOWED_TRANSACTION_TYPES,
+    CashFlowSummary,
+    ReportTransaction,
+    ZERO,
+    amount_from_cents,
+    cents_from_amount,
+)
+
+
+class DailyLedgerIndex:
+    """Integer-cent totals per day and transaction type over a fixed date range.
+
+    Each transaction type keeps a Fenwick tree indexed by day, so both
+    ``summary`` for any inclusive sub-range and ``adjust`` for a single day
+    take O(log days). Changes dated outside the indexed range are ignored,
+    matching ``apply_transaction_changes``.
+    """
+
+    __slots__ = ("start_date", "end_date", "_trees")
+
+    def __init__(self, start_date: date, end_date: date) -> None:
+        if end_date < start_date:
+            raise ValueError("end date must be on or after start date")
+        self.start_date = start_date
+        self.end_date = end_date
+        days = (end_date - start_date).days + 1
+        self._trees = {
+            transaction_type: [0] * (days + 1)
+            for transaction_type in ALLOWED_TRANSACTION_TYPES
+        }
+
+    @classmethod
+    def from_daily_totals(
+        cls,
+        daily_totals: Mapping[date, Mapping[str, Decimal]],
+        start_date: date,
+        end_date: date,
+    ) -> "DailyLedgerIndex":
+        """Build an index in O(days) from per-day totals by transaction type."""
+
+        index = cls(start_date, end_date)
+        for day, totals in daily_totals.items():
+            position = index._position(day)
+            if position is None:
+                continue
+            for transaction_type, amount in totals.items():
+                if transaction_type not in index._trees:
+                    raise ValueError(f"invalid transaction type: {transaction_type!r}")
+                index._trees[transaction_type][position] += cents_from_amount(amount)
+        for tree in index._trees.values():
+            for position in range(1, len(tree)):
+                parent = position + (position & -position)
+                if parent < len(tree):
+                    tree[parent] += tree[position]
+        return index
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: Iterable[ReportTransaction],
+        start_date: date,
+        end_date: date,
+    ) -> "DailyLedgerIndex":
+        daily_totals: dict[date, dict[str, Decimal]] = {}
+        for transaction in transactions:
+            totals = daily_totals.setdefault(transaction.occurred_on, {})
+            totals[transaction.transaction_type] = (
+                totals.get(transaction.transaction_type, ZERO)
+                + transaction.amount
+            )
+        return cls.from_daily_totals(daily_totals, start_date, end_date)
+
+    def _position(self, day: date) -> int | None:
+        if not self.start_date <= day <= self.end_date:
+            return None
+        return (day - self.start_date).days + 1
+
+    def _prefix(self, transaction_type: str, position: int) -> int:
+        tree = self._trees[transaction_type]
+        total = 0
+        while position > 0:
+            total += tree[position]
+            position -= position & -position
+        return total
+
+    def adjust(self, occurred_on: date, transaction_type: str, amount: Decimal) -> None:
+        """Add a signed amount to one day's total for a transaction type."""
+
+        if transaction_type not in self._trees:
+            raise ValueError(f"invalid transaction type: {transaction_type!r}")
+        cents = cents_from_amount(amount)
+        position = self._position(occurred_on)
+        if position is None:
+            return
+        tree = self._trees[transaction_type]
+        while position < len(tree):
+            tree[position] += cents
+            position += position & -position
+
+    def add(self, transaction: ReportTransaction) -> None:
+        self.adjust(
+            transaction.occurred_on,
+            transaction.transaction_type,
+            transaction.amount,
+        )
+
+    def remove(self, transaction: ReportTransaction) -> None:
+        self.adjust(
+            transaction.occurred_on,
+            transaction.transaction_type,
+            -transaction.amount,
+        )
+
+    def summary(self, start_date: date, end_date: date) -> CashFlowSummary:
+        """Return totals for an inclusive range inside the indexed range."""
+
+        if end_date < start_date:
+            raise ValueError("end date must be on or after start date")
+        if start_date < self.start_date or end_date > self.end_date:
+            raise ValueError(
+                f"range must be within {self.start_date.isoformat()} "
+                f"to {self.end_date.isoformat()}"
+            )
+        first = (start_date - self.start_date).days
+        last = (end_date - self.start_date).days + 1
+        totals = {
+            transaction_type: amount_from_cents(
+                self._prefix(transaction_type, last)
+                - self._prefix(transaction_type, first)
+            )
+            for transaction_type in ALLOWED_TRANSACTION_TYPES
+        }
+        return CashFlowSummary(
+            start_date=start_date,
+            end_date=end_date,
+            income=totals["income"],
+            expenses=totals["expense"],
+            investments=totals["investment"],
+        )
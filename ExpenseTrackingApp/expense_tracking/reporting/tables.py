@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import pandas as pd
-from itables import JavascriptFunction, init_notebook_mode, show
+from itables import (
+    JavascriptFunction,
+    init_notebook_mode,
+    options,
+    show,
+    to_html_datatable,
+)
+from itables.javascript import generate_init_offline_itables_html
 
 from expense_tracking.reporting.cash_flow import CashFlowReport
+from expense_tracking.timing import timed
 
 
 CURRENCY_RENDERER = JavascriptFunction(
@@ -23,12 +33,20 @@ CURRENCY_RENDERER = JavascriptFunction(
 )
 
 
+@timed("tables.assets")
 def initialize_transaction_tables() -> None:
     """Embed the DataTables assets required by offline report tables."""
 
     init_notebook_mode(all_interactive=False, connected=False)
 
 
+@timed("tables.assets")
+def transaction_table_assets_html() -> str:
+    """Return the inline DataTables bundle for tables rendered outside Jupyter."""
+
+    return generate_init_offline_itables_html(options.dt_bundle)
+
+
 def transactions_frame(
     report: CashFlowReport,
     transaction_type: str,
@@ -44,30 +62,70 @@ def transactions_frame(
     return pd.DataFrame(rows, columns=["Date", "Description", "Amount"])
 
 
-def show_transaction_table(
+def transaction_table_options(
     report: CashFlowReport,
     transaction_type: str,
-) -> None:
-    frame = transactions_frame(report, transaction_type)
-    if frame.empty:
-        print(f"No {transaction_type} transactions occurred in this period.")
-        return
+    *,
+    dt_url: str | None = None,
+) -> dict[str, Any]:
+    """Return the table options; ``dt_url`` loads DataTables in connected mode."""
 
-    show(
-        frame,
-        caption=(
+    table_options = {
+        "caption": (
             f"{transaction_type.title()} subtotal: "
             f"${report.subtotal_for(transaction_type):,.2f}"
         ),
-        connected=False,
-        pageLength=10,
-        lengthMenu=[10, 25, 50, -1],
-        scrollX=True,
-        column_filters="header",
-        maxBytes=0,
-        columnDefs=[
+        "connected": False,
+        "pageLength": 10,
+        "lengthMenu": [10, 25, 50, -1],
+        "scrollX": True,
+        "column_filters": "header",
+        "maxBytes": 0,
+        "columnDefs": [
             {"targets": 0, "type": "date"},
             {"targets": 2, "render": CURRENCY_RENDERER, "className": "dt-body-right"},
         ],
-        order=[[0, "asc"]],
+        "order": [[0, "asc"]],
+    }
+    if dt_url is not None:
+        table_options.update(connected=True, dt_url=dt_url)
+    return table_options
+
+
+def empty_table_message(transaction_type: str) -> str:
+    return f"No {transaction_type} transactions occurred in this period."
+
+
+@timed("tables.transaction_table")
+def show_transaction_table(
+    report: CashFlowReport,
+    transaction_type: str,
+) -> None:
+    frame = transactions_frame(report, transaction_type)
+    if frame.empty:
+        print(empty_table_message(transaction_type))
+        return
+
+    show(frame, **transaction_table_options(report, transaction_type))
+
+
+@timed("tables.transaction_table")
+def transaction_table_html(
+    report: CashFlowReport,
+    transaction_type: str,
+    *,
+    dt_url: str | None = None,
+) -> str | None:
+    """Return one interactive table as HTML, or ``None`` when it is empty.
+
+    The table needs ``transaction_table_assets_html`` once earlier on the page,
+    unless ``dt_url`` names a DataTables bundle for it to import.
+    """
+
+    frame = transactions_frame(report, transaction_type)
+    if frame.empty:
+        return None
+    return to_html_datatable(
+        frame,
+        **transaction_table_options(report, transaction_type, dt_url=dt_url),
     )
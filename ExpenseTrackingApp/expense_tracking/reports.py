@@ -5,18 +5,67 @@ from __future__ import annotations
 import os
 import shutil
 import subprocess
+import tempfile
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass
 from datetime import date, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
+
+import psycopg
 
 from expense_tracking.config import (
+    DEFAULT_BATCH_WORKERS,
     DEFAULT_REPORT_OUTPUT_DIR,
+    DEFAULT_REPORT_OUTPUT_MAX_AGE,
+    DEFAULT_REPORT_OUTPUT_MAX_BYTES,
     PROJECT_ROOT,
+    REPORT_BACKENDS,
     REPORT_SOURCE,
     resolve_database,
 )
-from expense_tracking.errors import ReportGenerationError, ValidationError
+from expense_tracking.errors import (
+    ExpenseTrackingError,
+    ReportGenerationError,
+    ValidationError,
+)
+from expense_tracking.report_cache import (
+    ReportCache,
+    report_cache_key,
+    template_digest,
+)
+from expense_tracking.reporting.assets import (
+    remove_precompressed,
+    write_precompressed,
+    write_shared_assets,
+)
+from expense_tracking.reporting.cash_flow import (
+    CashFlowReport,
+    build_cash_flow_reports,
+)
+from expense_tracking.reporting.data import (
+    load_cash_flow_report,
+    load_data_version,
+    load_transactions,
+    write_report_data,
+)
+from expense_tracking.reporting.html import render_cash_flow_html
+from expense_tracking.timing import (
+    adopt_spans,
+    read_spans,
+    span,
+    timed,
+    timings_enabled,
+)
+
+if TYPE_CHECKING:
+    from expense_tracking.quarto_kernel import WarmKernel
+
+
+STAGING_PREFIX = "cash-flow-render-"
 
 
 @dataclass(frozen=True)
@@ -87,13 +136,21 @@ class ReportPeriod:
         )
 
 
-def build_quarto_command(*, output_filename: str, quarto: str) -> list[str]:
+def build_quarto_command(
+    *,
+    output_filename: str,
+    quarto: str,
+    source: Path = REPORT_SOURCE,
+    execute: bool = True,
+) -> list[str]:
+    """Return the render command; ``execute=False`` renders an executed notebook."""
+
+    execution = ["--execute", "--execute-daemon-restart"] if execute else ["--no-execute"]
     return [
         quarto,
         "render",
-        str(REPORT_SOURCE),
-        "--execute",
-        "--execute-daemon-restart",
+        str(source),
+        *execution,
         "--no-cache",
         "--output",
         output_filename,
@@ -102,68 +159,335 @@ def build_quarto_command(*, output_filename: str, quarto: str) -> list[str]:
     ]
 
 
-def build_render_environment(*, period: ReportPeriod, database: str) -> dict[str, str]:
+def build_python_environment() -> dict[str, str]:
+    """Return this process's environment with the project on ``PYTHONPATH``."""
+
     environment = os.environ.copy()
     existing_pythonpath = environment.get("PYTHONPATH")
+    environment["PYTHONPATH"] = (
+        f"{PROJECT_ROOT}{os.pathsep}{existing_pythonpath}"
+        if existing_pythonpath
+        else str(PROJECT_ROOT)
+    )
+    return environment
+
+
+def build_render_environment(
+    *,
+    period: ReportPeriod,
+    database: str,
+    summary_only: bool = False,
+    data_file: Path | None = None,
+    timings_file: Path | None = None,
+) -> dict[str, str]:
+    environment = build_python_environment()
     environment.update(
         {
             "EXPENSE_REPORT_START_DATE": period.start_date.isoformat(),
             "EXPENSE_REPORT_END_DATE": period.end_date.isoformat(),
             "EXPENSE_REPORT_DATABASE": database,
             "EXPENSE_REPORT_PERIOD_LABEL": period.label,
-            "PYTHONPATH": (
-                f"{PROJECT_ROOT}{os.pathsep}{existing_pythonpath}"
-                if existing_pythonpath
-                else str(PROJECT_ROOT)
-            ),
+            "EXPENSE_REPORT_SUMMARY_ONLY": "1" if summary_only else "0",
         }
     )
+    if data_file is not None:
+        environment["EXPENSE_REPORT_DATA_FILE"] = str(data_file)
+    if timings_file is not None:
+        environment["EXPENSE_REPORT_TIMINGS_FILE"] = str(timings_file)
     return environment
 
 
+def create_workspace(directory: Path) -> None:
+    """Copy the Quarto project into ``directory`` for an isolated render."""
+
+    directory.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(REPORT_SOURCE, directory / REPORT_SOURCE.name)
+    shutil.copy2(REPORT_SOURCE.parent / "_quarto.yml", directory / "_quarto.yml")
+
+
+@timed("report.data_version")
+def cache_key_for(
+    *,
+    period: ReportPeriod,
+    database: str,
+    summary_only: bool,
+    backend: str,
+    asset_href: str | None = None,
+) -> str:
+    try:
+        data_version = load_data_version(database)
+        template = template_digest()
+    except psycopg.Error as error:
+        raise ReportGenerationError(
+            f"Report data version could not be read: {error}"
+        ) from error
+    except OSError as error:
+        raise ReportGenerationError(str(error)) from error
+    return report_cache_key(
+        start_date=period.start_date.isoformat(),
+        end_date=period.end_date.isoformat(),
+        label=period.label,
+        database=database,
+        summary_only=summary_only,
+        backend=backend,
+        template=template,
+        data_version=data_version,
+        asset_href=asset_href,
+    )
+
+
+def copy_cached_report(cached_path: Path, output_path: Path) -> None:
+    staging_path = output_path.parent / f".{output_path.name}.{uuid.uuid4().hex}.tmp"
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached_path, staging_path)
+        staging_path.replace(output_path)
+    except OSError as error:
+        raise ReportGenerationError(str(error)) from error
+    finally:
+        staging_path.unlink(missing_ok=True)
+
+
+@timed("report.python_render")
+def render_python_report(
+    *,
+    period: ReportPeriod,
+    database: str,
+    summary_only: bool,
+    output_path: Path,
+    report: CashFlowReport | None = None,
+    asset_href: str | None = None,
+) -> None:
+    if report is None:
+        try:
+            report = load_cash_flow_report(
+                start_date=period.start_date,
+                end_date=period.end_date,
+                database=database,
+                summary_only=summary_only,
+            )
+        except psycopg.Error as error:
+            raise ReportGenerationError(
+                f"Report data could not be loaded: {error}"
+            ) from error
+    output_path.write_text(
+        render_cash_flow_html(
+            report,
+            period_label=period.label,
+            summary_only=summary_only,
+            asset_href=asset_href,
+        ),
+        encoding="utf-8",
+    )
+
+
+def update_precompressed(path: Path, precompress: bool) -> None:
+    try:
+        if precompress:
+            write_precompressed(path)
+        else:
+            remove_precompressed(path)
+    except OSError as error:
+        raise ReportGenerationError(str(error)) from error
+
+
+def prune_report_outputs(
+    directory: Path = DEFAULT_REPORT_OUTPUT_DIR,
+    *,
+    max_age: float = DEFAULT_REPORT_OUTPUT_MAX_AGE,
+    max_bytes: int = DEFAULT_REPORT_OUTPUT_MAX_BYTES,
+    keep: Path | None = None,
+    running_since: float | None = None,
+) -> list[Path]:
+    """Delete generated reports older than ``max_age`` seconds, then the
+    least recently written ones until the rest fit in ``max_bytes``.
+
+    Only top-level ``*.html`` files and their compressed siblings are
+    removed; shared asset bundles and in-flight Quarto staging files are
+    left alone. Reports written at or after ``running_since``, the start of
+    the oldest job still running, may belong to another session and are
+    only removed once they expire. Returns the deleted reports.
+    """
+
+    cutoff = time.time() - max_age
+    entries: list[tuple[float, int, Path]] = []
+    for path in directory.glob("*.html"):
+        if path.name.startswith(STAGING_PREFIX):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    removed = []
+    total = sum(size for _, size, _ in entries)
+    for modified, size, path in sorted(entries):
+        if path == keep:
+            continue
+        if modified >= cutoff and (
+            total <= max_bytes
+            or (running_since is not None and modified >= running_since)
+        ):
+            break
+        path.unlink(missing_ok=True)
+        remove_precompressed(path)
+        removed.append(path)
+        total -= size
+    return removed
+
+
+@timed("report.generate")
 def generate_report(
     *,
     period: ReportPeriod,
     database: str | None = None,
     output_path: Path | None = None,
     quarto: str | None = None,
+    summary_only: bool = False,
+    cache: ReportCache | None = None,
+    force: bool = False,
+    backend: str = "quarto",
+    workspace: Path | None = None,
+    report: CashFlowReport | None = None,
+    shared_assets: bool = False,
+    precompress: bool = False,
+    kernel: WarmKernel | None = None,
 ) -> Path:
-    """Generate a self-contained report and return its absolute output path."""
+    """Generate a self-contained report and return its absolute output path.
+
+    A summary-only report is built from per-month totals aggregated in
+    PostgreSQL and never transfers individual transactions. With a
+    ``cache``, a report whose period, database, template and data version
+    match an earlier render is copied from the cache instead of rendered;
+    ``force`` renders anyway and refreshes the cached copy.
+
+    The ``python`` backend builds the same dashboard inside this process
+    instead of starting Quarto and a Jupyter kernel. A ``workspace`` created
+    by ``create_workspace`` isolates the render from other jobs, and a
+    prebuilt ``report`` is rendered without reading the database again. A
+    started ``kernel`` executes the Quarto document in its long-lived
+    Jupyter kernel, and Quarto then renders the executed notebook without
+    starting one.
+
+    With ``shared_assets`` the python backend writes Plotly.js and DataTables
+    once to a content-hashed ``assets`` directory beside the output and the
+    report only references them. ``precompress`` adds ``.gz`` (and ``.br``
+    when brotli is installed) siblings for static file servers.
+    """
 
     if not isinstance(period, ReportPeriod):
         raise ValidationError("period must be a ReportPeriod")
+    if backend not in REPORT_BACKENDS:
+        raise ValidationError(
+            f"report backend must be one of: {', '.join(REPORT_BACKENDS)}"
+        )
+    if shared_assets and backend != "python":
+        raise ValidationError("shared assets require the python backend")
+    if kernel is not None and backend != "quarto":
+        raise ValidationError("a warm kernel requires the quarto backend")
     resolved_database = resolve_database(database)
     resolved_output = Path(
         output_path
         if output_path is not None
         else DEFAULT_REPORT_OUTPUT_DIR / period.default_filename
     ).resolve()
-    resolved_quarto = quarto if quarto is not None else shutil.which("quarto")
-    if resolved_quarto is None:
-        raise ReportGenerationError(
-            "Quarto is not installed or is not available on PATH."
+
+    asset_href = None
+    if shared_assets:
+        try:
+            with span("report.shared_assets"):
+                asset_href = write_shared_assets(
+                    resolved_output.parent,
+                    precompress=precompress,
+                )
+        except OSError as error:
+            raise ReportGenerationError(str(error)) from error
+
+    cache_key = None
+    if cache is not None:
+        cache_key = cache_key_for(
+            period=period,
+            database=resolved_database,
+            summary_only=summary_only,
+            backend=backend,
+            asset_href=asset_href,
         )
+        cached_path = None if force else cache.get(cache_key)
+        if cached_path is not None:
+            with span("report.cache_copy"):
+                copy_cached_report(cached_path, resolved_output)
+            update_precompressed(resolved_output, precompress)
+            return resolved_output
+
+    resolved_quarto = None
+    if backend == "quarto":
+        resolved_quarto = quarto if quarto is not None else shutil.which("quarto")
+        if resolved_quarto is None:
+            raise ReportGenerationError(
+                "Quarto is not installed or is not available on PATH."
+            )
 
-    staging_name = f"cash-flow-render-{uuid.uuid4().hex}.html"
-    staging_path = DEFAULT_REPORT_OUTPUT_DIR / staging_name
-    command = build_quarto_command(
-        output_filename=staging_name,
-        quarto=resolved_quarto,
+    project_dir = workspace if workspace is not None else REPORT_SOURCE.parent
+    staging_name = f"{STAGING_PREFIX}{uuid.uuid4().hex}.html"
+    staging_dir = project_dir / "output"
+    staging_path = staging_dir / staging_name
+    data_file = project_dir / f"cash-flow-data-{uuid.uuid4().hex}.pickle"
+    notebook_file = project_dir / f"cash-flow-notebook-{uuid.uuid4().hex}.ipynb"
+    timings_file = (
+        project_dir / f"cash-flow-timings-{uuid.uuid4().hex}.jsonl"
+        if timings_enabled()
+        else None
     )
     try:
         resolved_output.parent.mkdir(parents=True, exist_ok=True)
-        DEFAULT_REPORT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        subprocess.run(
-            command,
-            cwd=REPORT_SOURCE.parent,
-            env=build_render_environment(
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        if resolved_quarto is None:
+            render_python_report(
                 period=period,
                 database=resolved_database,
-            ),
-            check=True,
-        )
+                summary_only=summary_only,
+                output_path=staging_path,
+                report=report,
+                asset_href=asset_href,
+            )
+        else:
+            if report is not None:
+                write_report_data(report, data_file)
+            environment = build_render_environment(
+                period=period,
+                database=resolved_database,
+                summary_only=summary_only,
+                data_file=data_file if report is not None else None,
+                timings_file=timings_file,
+            )
+            source = project_dir / REPORT_SOURCE.name
+            with span("report.quarto"):
+                if kernel is not None:
+                    with span("report.kernel"):
+                        kernel.execute(
+                            environment=environment,
+                            output_path=notebook_file,
+                        )
+                    source = notebook_file
+                subprocess.run(
+                    build_quarto_command(
+                        output_filename=staging_name,
+                        quarto=resolved_quarto,
+                        source=source,
+                        execute=kernel is None,
+                    ),
+                    cwd=project_dir,
+                    env=environment,
+                    check=True,
+                )
+                if timings_file is not None and timings_file.is_file():
+                    adopt_spans(read_spans(timings_file))
         if not staging_path.is_file():
             raise RuntimeError(f"Quarto did not create {staging_path}")
+        if cache is not None and cache_key is not None:
+            with span("report.cache_store"):
+                cache.put(cache_key, staging_path)
         staging_path.replace(resolved_output)
     except subprocess.CalledProcessError as error:
         raise ReportGenerationError(
@@ -175,7 +499,162 @@ def generate_report(
         try:
             if staging_path.is_file():
                 staging_path.unlink()
+            data_file.unlink(missing_ok=True)
+            notebook_file.unlink(missing_ok=True)
+            if timings_file is not None:
+                timings_file.unlink(missing_ok=True)
         except OSError as error:
             raise ReportGenerationError(str(error)) from error
 
+    update_precompressed(resolved_output, precompress)
     return resolved_output
+
+
+@dataclass(frozen=True)
+class ReportJobResult:
+    """Outcome of one report in a batch."""
+
+    period: ReportPeriod
+    output_path: Path | None
+    seconds: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def overlapping_groups(periods: Sequence[ReportPeriod]) -> list[list[ReportPeriod]]:
+    """Group periods whose date ranges overlap or touch, in start order."""
+
+    groups: list[list[ReportPeriod]] = []
+    group_end: date | None = None
+    for period in sorted(periods, key=lambda item: (item.start_date, item.end_date)):
+        if group_end is not None and period.start_date <= group_end + timedelta(days=1):
+            groups[-1].append(period)
+            group_end = max(group_end, period.end_date)
+        else:
+            groups.append([period])
+            group_end = period.end_date
+    return groups
+
+
+@timed("report.prefetch")
+def prefetch_reports(
+    periods: Sequence[ReportPeriod],
+    database: str,
+) -> tuple[dict[ReportPeriod, CashFlowReport], dict[ReportPeriod, str]]:
+    """Build every period's report with one query per group of overlapping periods."""
+
+    reports: dict[ReportPeriod, CashFlowReport] = {}
+    errors: dict[ReportPeriod, str] = {}
+    for group in overlapping_groups(periods):
+        try:
+            transactions = load_transactions(
+                start_date=min(period.start_date for period in group),
+                end_date_exclusive=max(period.end_date_exclusive for period in group),
+                database=database,
+            )
+        except psycopg.Error as error:
+            for period in group:
+                errors[period] = f"Report data could not be loaded: {error}"
+            continue
+        reports.update(zip(group, build_cash_flow_reports(transactions, group)))
+    return reports, errors
+
+
+def generate_reports(
+    periods: Sequence[ReportPeriod],
+    *,
+    database: str | None = None,
+    output_dir: Path | None = None,
+    quarto: str | None = None,
+    summary_only: bool = False,
+    cache: ReportCache | None = None,
+    force: bool = False,
+    backend: str = "quarto",
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    shared_assets: bool = False,
+    precompress: bool = False,
+) -> tuple[ReportJobResult, ...]:
+    """Render many periods concurrently and return one result per period.
+
+    Each job renders in its own temporary copy of the Quarto project, so jobs
+    never share staging files. Full reports for overlapping periods are
+    built from one database read per group; summary-only reports read their
+    own monthly totals. A failed job is recorded in its result and does not
+    stop the others.
+    """
+
+    if (
+        isinstance(max_workers, bool)
+        or not isinstance(max_workers, int)
+        or max_workers < 1
+    ):
+        raise ValidationError("max_workers must be a positive integer")
+    if backend not in REPORT_BACKENDS:
+        raise ValidationError(
+            f"report backend must be one of: {', '.join(REPORT_BACKENDS)}"
+        )
+    if shared_assets and backend != "python":
+        raise ValidationError("shared assets require the python backend")
+    if not all(isinstance(period, ReportPeriod) for period in periods):
+        raise ValidationError("periods must be ReportPeriod values")
+    resolved_database = resolve_database(database)
+    resolved_output_dir = Path(
+        output_dir if output_dir is not None else DEFAULT_REPORT_OUTPUT_DIR
+    ).resolve()
+    try:
+        resolved_output_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as error:
+        raise ReportGenerationError(str(error)) from error
+
+    unique_periods = list(dict.fromkeys(periods))
+    reports: dict[ReportPeriod, CashFlowReport] = {}
+    errors: dict[ReportPeriod, str] = {}
+    if not summary_only:
+        reports, errors = prefetch_reports(unique_periods, resolved_database)
+
+    def run(period: ReportPeriod) -> ReportJobResult:
+        started = time.perf_counter()
+        if period in errors:
+            return ReportJobResult(period, None, 0.0, errors[period])
+        try:
+            with tempfile.TemporaryDirectory(
+                prefix=".cash-flow-job-",
+                dir=resolved_output_dir,
+            ) as workspace:
+                create_workspace(Path(workspace))
+                output_path = generate_report(
+                    period=period,
+                    database=resolved_database,
+                    output_path=resolved_output_dir / period.default_filename,
+                    quarto=quarto,
+                    summary_only=summary_only,
+                    cache=cache,
+                    force=force,
+                    backend=backend,
+                    workspace=Path(workspace),
+                    report=reports.get(period),
+                    shared_assets=shared_assets,
+                    precompress=precompress,
+                )
+        except (ExpenseTrackingError, OSError) as error:
+            return ReportJobResult(
+                period,
+                None,
+                time.perf_counter() - started,
+                str(error),
+            )
+        return ReportJobResult(period, output_path, time.perf_counter() - started)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(copy_context().run, run, period)
+            for period in unique_periods
+        ]
+        results = {
+            period: future.result()
+            for period, future in zip(unique_periods, futures)
+        }
+    return tuple(results[period] for period in periods)
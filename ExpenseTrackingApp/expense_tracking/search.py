@@ -0,0 +1,91 @@
+"""Ranked search of transaction descriptions."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import psycopg
+
+from expense_tracking.config import SEARCH_QUERY_PATH, load_query, resolve_database
+from expense_tracking.errors import ValidationError
+from expense_tracking.pool import connection
+from expense_tracking.reporting.cash_flow import ReportTransaction
+from expense_tracking.reporting.data import transaction_from_row
+from expense_tracking.transactions import database_error
+
+if TYPE_CHECKING:
+    from expense_tracking.reports import ReportPeriod
+
+
+DEFAULT_SEARCH_LIMIT = 50
+MAX_SEARCH_LIMIT = 500
+MAX_SEARCH_QUERY_LENGTH = 200
+
+
+def validate_search_query(query: str) -> str:
+    if not isinstance(query, str) or not query.strip():
+        raise ValidationError("search text must not be blank")
+    text = " ".join(query.split())
+    if len(text) > MAX_SEARCH_QUERY_LENGTH:
+        raise ValidationError(
+            f"search text must be at most {MAX_SEARCH_QUERY_LENGTH} characters"
+        )
+    return text
+
+
+def validate_search_limit(limit: int) -> int:
+    if isinstance(limit, bool) or not isinstance(limit, int):
+        raise ValidationError("search limit must be an integer")
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        raise ValidationError(f"search limit must be between 1 and {MAX_SEARCH_LIMIT}")
+    return limit
+
+
+def like_pattern(text: str) -> str:
+    """Return an ``ILIKE`` pattern matching ``text`` anywhere, taken literally."""
+
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search_transactions(
+    query: str,
+    period: ReportPeriod | None = None,
+    *,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    database: str | None = None,
+    sql: str | None = None,
+) -> tuple[ReportTransaction, ...]:
+    """Return transactions whose description matches ``query``, best first.
+
+    A description matches when it contains ``query`` case-insensitively or
+    when one of its words is a close trigram match, which tolerates small
+    typos. Results are ranked by word similarity, then newest first. The
+    trigram index from migration ``006`` answers both conditions and returns
+    matches in ranking order, so only ``limit`` of them are read; queries
+    shorter than three characters produce no trigrams and fall back to
+    scanning the date range.
+    """
+
+    text = validate_search_query(query)
+    resolved_limit = validate_search_limit(limit)
+    resolved_database = resolve_database(database)
+    search_query = sql if sql is not None else load_query(SEARCH_QUERY_PATH)
+    parameters = {
+        "query": text,
+        "pattern": like_pattern(text),
+        "start_date": period.start_date if period is not None else date.min,
+        "end_date": period.end_date if period is not None else date.max,
+        "limit": resolved_limit,
+    }
+
+    try:
+        with connection(resolved_database, read_only=True) as pooled:
+            with pooled.cursor() as cursor:
+                cursor.execute(search_query, parameters)
+                rows = cursor.fetchall()
+    except psycopg.Error as error:
+        raise database_error(error) from error
+
+    return tuple(transaction_from_row(row) for row in rows)
@@ -0,0 +1,224 @@
+"""Lightweight named timing spans for finding where report time goes.
+
+Spans cost one context-variable lookup unless a recorder is active. Inside
+``record_timings`` every completed span is collected with its parent's name
+and nesting depth; ``emit_timings`` additionally appends each span as a JSON
+line to a file, which is how a Quarto kernel hands its spans back to the
+process that started it.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Any, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class Span:
+    name: str
+    seconds: float
+    parent: str | None = None
+    depth: int = 0
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+
+@dataclass(frozen=True)
+class PhaseTiming:
+    """Every span with one name, aggregated."""
+
+    name: str
+    calls: int
+    seconds: float
+    parent: str | None = None
+    depth: int = 0
+
+
+_recorded: ContextVar[list[Span] | None] = ContextVar("recorded_spans", default=None)
+_current: ContextVar[tuple[str, int] | None] = ContextVar("current_span", default=None)
+_sink: Path | None = None
+_sink_lock = threading.Lock()
+
+
+def timings_enabled() -> bool:
+    return _recorded.get() is not None or _sink is not None
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the enclosed block as ``name`` when timings are being recorded."""
+
+    if not timings_enabled():
+        yield
+        return
+    parent = _current.get()
+    depth = 0 if parent is None else parent[1] + 1
+    token = _current.set((name, depth))
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        _current.reset(token)
+        record_span(
+            Span(
+                name=name,
+                seconds=elapsed,
+                parent=None if parent is None else parent[0],
+                depth=depth,
+            )
+        )
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorate a function so each call is recorded as a ``name`` span."""
+
+    def decorate(function: F) -> F:
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def record_span(recorded: Span) -> None:
+    spans = _recorded.get()
+    if spans is not None:
+        spans.append(recorded)
+    sink = _sink
+    if sink is not None:
+        with _sink_lock, sink.open("a", encoding="utf-8") as stream:
+            stream.write(recorded.to_json() + "\n")
+
+
+@contextmanager
+def record_timings(spans: list[Span] | None = None) -> Iterator[list[Span]]:
+    """Collect the spans completed inside the block, in completion order.
+
+    Worker threads only report into the list when they run in a copy of
+    the caller's context, as ``generate_reports`` does.
+    """
+
+    collected = spans if spans is not None else []
+    token = _recorded.set(collected)
+    try:
+        yield collected
+    finally:
+        _recorded.reset(token)
+
+
+def emit_timings(path: Path | None) -> None:
+    """Append every later span in this process to ``path`` as JSON lines."""
+
+    global _sink
+    _sink = path
+
+
+def read_spans(path: Path) -> list[Span]:
+    """Read the spans ``emit_timings`` wrote to ``path``."""
+
+    return [
+        Span(**json.loads(line))
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+
+
+def adopt_spans(spans: Iterable[Span]) -> None:
+    """Record spans timed elsewhere, such as in a Quarto kernel, as children
+    of the current span.
+    """
+
+    current = _current.get()
+    for recorded in spans:
+        if current is None:
+            record_span(recorded)
+            continue
+        record_span(
+            Span(
+                name=recorded.name,
+                seconds=recorded.seconds,
+                parent=recorded.parent if recorded.parent is not None else current[0],
+                depth=recorded.depth + current[1] + 1,
+            )
+        )
+
+
+def summarize_spans(spans: Iterable[Span]) -> list[PhaseTiming]:
+    """Aggregate spans by name and order them as a tree, slowest first.
+
+    A phase sits under the parent it was first recorded with; phases whose
+    parent was never recorded are treated as outermost.
+    """
+
+    calls: dict[str, int] = {}
+    seconds: dict[str, float] = {}
+    parents: dict[str, str | None] = {}
+    for recorded in spans:
+        calls[recorded.name] = calls.get(recorded.name, 0) + 1
+        seconds[recorded.name] = seconds.get(recorded.name, 0.0) + recorded.seconds
+        parents.setdefault(recorded.name, recorded.parent)
+
+    children: dict[str | None, list[str]] = {}
+    for name, parent in parents.items():
+        if parent not in parents or parent == name:
+            parent = None
+        children.setdefault(parent, []).append(name)
+
+    phases: list[PhaseTiming] = []
+
+    def visit(parent: str | None, depth: int) -> None:
+        for name in sorted(children.get(parent, ()), key=lambda item: -seconds[item]):
+            if any(phase.name == name for phase in phases):
+                continue
+            phases.append(
+                PhaseTiming(
+                    name=name,
+                    calls=calls[name],
+                    seconds=seconds[name],
+                    parent=parent,
+                    depth=depth,
+                )
+            )
+            visit(name, depth + 1)
+
+    visit(None, 0)
+    return phases
+
+
+def format_phase_table(spans: Iterable[Span]) -> str:
+    """Return a plain-text phase breakdown with each phase's share of the
+    outermost phases' total time.
+    """
+
+    phases = summarize_spans(spans)
+    total = sum(phase.seconds for phase in phases if phase.depth == 0)
+    name_width = max(
+        [len("Phase"), *(len(phase.name) + 2 * phase.depth for phase in phases)]
+    )
+    lines = [
+        f"{'Phase':<{name_width}}  {'Calls':>5}  {'Seconds':>9}  {'Share':>6}",
+    ]
+    for phase in phases:
+        share = phase.seconds / total if total else 0.0
+        label = "  " * phase.depth + phase.name
+        lines.append(
+            f"{label:<{name_width}}  {phase.calls:>5}  "
+            f"{phase.seconds:>9.3f}  {share:>6.1%}"
+        )
+    return "\n".join(lines)
@@ -2,135 +2,56 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime
-from decimal import Decimal, DecimalException, InvalidOperation
+from itertools import islice
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 import psycopg
-from psycopg.rows import dict_row
 
-from expense_tracking.config import INSERT_QUERY_PATH, resolve_database
+from expense_tracking.config import (
+    DEFAULT_BATCH_SIZE,
+    INSERT_QUERY_PATH,
+    INSERT_ROWS_QUERY_PATH,
+    load_query,
+    resolve_database,
+)
 from expense_tracking.errors import (
     DatabaseError,
-    QueryLoadError,
     TransactionError,
     ValidationError,
 )
+from expense_tracking.models import InsertedTransaction, Transaction
+from expense_tracking.pool import async_connection, connection
 
 
-ALLOWED_TRANSACTION_TYPES = ("expense", "income", "investment")
-CENT = Decimal("0.01")
-MAX_AMOUNT = Decimal("9999999999.99")
+def load_insert_query(path: Path = INSERT_QUERY_PATH) -> str:
+    return load_query(path)
 
 
-def validate_amount(amount: Decimal) -> Decimal:
-    if not isinstance(amount, Decimal):
-        raise ValidationError("amount must be a decimal number")
-    if not amount.is_finite():
-        raise ValidationError("amount must be a finite decimal number")
-    if amount <= 0:
-        raise ValidationError("amount must be greater than zero")
-    if amount > MAX_AMOUNT:
-        raise ValidationError(
-            f"amount must not exceed {format(MAX_AMOUNT, '.2f')}"
-        )
+def database_error(error: psycopg.Error) -> DatabaseError:
+    """Return a concise application error for a PostgreSQL failure."""
 
-    try:
-        normalized = amount.quantize(CENT)
-    except InvalidOperation as error:
-        raise ValidationError("amount must have at most two decimal places") from error
-    if normalized != amount:
-        raise ValidationError("amount must have at most two decimal places")
-    return normalized
-
-
-def validate_description(description: str) -> str:
-    if not isinstance(description, str) or not description.strip():
-        raise ValidationError("description must not be blank")
-    return description.strip()
-
-
-def validate_transaction_type(transaction_type: str) -> str:
-    if transaction_type not in ALLOWED_TRANSACTION_TYPES:
-        allowed = ", ".join(ALLOWED_TRANSACTION_TYPES)
-        raise ValidationError(f"transaction type must be one of: {allowed}")
-    return transaction_type
-
-
-@dataclass(frozen=True)
-class Transaction:
-    occurred_on: date
-    transaction_type: str
-    amount: Decimal
-    description: str
-
-    def __post_init__(self) -> None:
-        if not isinstance(self.occurred_on, date):
-            raise ValidationError("transaction date must be a date")
-        object.__setattr__(
-            self,
-            "transaction_type",
-            validate_transaction_type(self.transaction_type),
-        )
-        object.__setattr__(self, "amount", validate_amount(self.amount))
-        object.__setattr__(
-            self,
-            "description",
-            validate_description(self.description),
-        )
-
-    def query_parameters(self) -> dict[str, Any]:
-        return {
-            "occurred_on": self.occurred_on,
-            "transaction_type": self.transaction_type,
-            "amount": self.amount,
-            "description": self.description,
-        }
-
-
-@dataclass(frozen=True)
-class InsertedTransaction:
-    id: int
-    occurred_on: date
-    transaction_type: str
-    amount: Decimal
-    description: str
-    created_at: datetime
-
-    @classmethod
-    def from_row(cls, row: Mapping[str, Any]) -> "InsertedTransaction":
-        try:
-            return cls(
-                id=int(row["id"]),
-                occurred_on=row["occurred_on"],
-                transaction_type=str(row["transaction_type"]),
-                amount=Decimal(row["amount"]),
-                description=str(row["description"]),
-                created_at=row["created_at"],
-            )
-        except (KeyError, TypeError, ValueError, DecimalException) as error:
-            raise TransactionError(
-                "the database returned an invalid transaction"
-            ) from error
-
-    def as_mapping(self) -> dict[str, Any]:
-        return {
-            "id": self.id,
-            "occurred_on": self.occurred_on,
-            "transaction_type": self.transaction_type,
-            "amount": self.amount,
-            "description": self.description,
-            "created_at": self.created_at,
-        }
+    message = str(error).splitlines()[0] if str(error) else error.__class__.__name__
+    return DatabaseError(message)
 
 
-def load_insert_query(path: Path = INSERT_QUERY_PATH) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except OSError as error:
-        raise QueryLoadError(str(error)) from error
+def validate_batch_size(batch_size: int) -> int:
+    if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+        raise ValidationError("batch size must be an integer")
+    if batch_size < 1:
+        raise ValidationError("batch size must be greater than zero")
+    return batch_size
+
+
+def next_batch(
+    transactions: Iterable[Any],
+    batch_size: int,
+) -> list[Transaction]:
+    batch = list(islice(transactions, batch_size))
+    for transaction in batch:
+        if not isinstance(transaction, Transaction):
+            raise ValidationError("transactions must contain only Transaction values")
+    return batch
 
 
 def add_transaction(
@@ -147,17 +68,163 @@ def add_transaction(
     insert_query = query if query is not None else load_insert_query()
 
     try:
-        with psycopg.connect(
-            dbname=resolved_database,
-            row_factory=dict_row,
-        ) as connection:
-            with connection.cursor() as cursor:
+        with connection(resolved_database) as pooled:
+            with pooled.cursor() as cursor:
                 cursor.execute(insert_query, transaction.query_parameters())
                 inserted = cursor.fetchone()
     except psycopg.Error as error:
-        message = str(error).splitlines()[0] if str(error) else error.__class__.__name__
-        raise DatabaseError(message) from error
+        raise database_error(error) from error
 
     if inserted is None:
         raise TransactionError("the database did not return the inserted transaction")
     return InsertedTransaction.from_row(inserted)
+
+
+def add_transactions(
+    transactions: Iterable[Transaction],
+    database: str | None = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    query: str | None = None,
+) -> tuple[InsertedTransaction, ...]:
+    """Insert transactions atomically over one pooled connection, in input order.
+
+    Each batch is sent with a pipelined ``executemany`` so the whole batch
+    costs a single network round trip. Either every transaction is stored or,
+    if any row is rejected, none are.
+    """
+
+    resolved_batch_size = validate_batch_size(batch_size)
+    resolved_database = resolve_database(database)
+    pending = iter(transactions)
+    batch = next_batch(pending, resolved_batch_size)
+    if not batch:
+        return ()
+    insert_query = query if query is not None else load_insert_query()
+
+    rows: list[Mapping[str, Any] | None] = []
+    try:
+        with connection(resolved_database) as pooled:
+            with pooled.cursor() as cursor:
+                while batch:
+                    cursor.executemany(
+                        insert_query,
+                        [transaction.query_parameters() for transaction in batch],
+                        returning=True,
+                    )
+                    for _ in batch:
+                        rows.append(cursor.fetchone())
+                        cursor.nextset()
+                    batch = next_batch(pending, resolved_batch_size)
+    except psycopg.Error as error:
+        raise database_error(error) from error
+
+    if any(row is None for row in rows):
+        raise TransactionError("the database did not return every inserted transaction")
+    return tuple(InsertedTransaction.from_row(row) for row in rows)
+
+
+def add_transaction_stream(
+    transactions: Iterable[Transaction],
+    database: str | None = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    query: str | None = None,
+) -> int:
+    """Insert a stream of transactions atomically and return how many were stored.
+
+    Like ``add_transactions``, batches are pipelined over one pooled
+    connection and committed together, so either every transaction is stored
+    or none are. Nothing is returned per row, so memory stays bounded by one
+    batch however long the input is.
+    """
+
+    resolved_batch_size = validate_batch_size(batch_size)
+    resolved_database = resolve_database(database)
+    pending = iter(transactions)
+    batch = next_batch(pending, resolved_batch_size)
+    if not batch:
+        return 0
+    insert_query = (
+        query if query is not None else load_insert_query(INSERT_ROWS_QUERY_PATH)
+    )
+
+    inserted = 0
+    try:
+        with connection(resolved_database) as pooled:
+            with pooled.cursor() as cursor:
+                while batch:
+                    cursor.executemany(
+                        insert_query,
+                        [transaction.query_parameters() for transaction in batch],
+                    )
+                    inserted += len(batch)
+                    batch = next_batch(pending, resolved_batch_size)
+    except psycopg.Error as error:
+        raise database_error(error) from error
+    return inserted
+
+
+async def add_transaction_async(
+    transaction: Transaction,
+    database: str | None = None,
+    *,
+    query: str | None = None,
+) -> InsertedTransaction:
+    """Asyncio counterpart of ``add_transaction`` using a pooled connection."""
+
+    if not isinstance(transaction, Transaction):
+        raise ValidationError("transaction must be a Transaction")
+    resolved_database = resolve_database(database)
+    insert_query = query if query is not None else load_insert_query()
+
+    try:
+        async with async_connection(resolved_database) as pooled:
+            async with pooled.cursor() as cursor:
+                await cursor.execute(insert_query, transaction.query_parameters())
+                inserted = await cursor.fetchone()
+    except psycopg.Error as error:
+        raise database_error(error) from error
+
+    if inserted is None:
+        raise TransactionError("the database did not return the inserted transaction")
+    return InsertedTransaction.from_row(inserted)
+
+
+async def add_transactions_async(
+    transactions: Iterable[Transaction],
+    database: str | None = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    query: str | None = None,
+) -> tuple[InsertedTransaction, ...]:
+    """Asyncio counterpart of ``add_transactions`` using a pooled connection."""
+
+    resolved_batch_size = validate_batch_size(batch_size)
+    resolved_database = resolve_database(database)
+    pending = iter(transactions)
+    batch = next_batch(pending, resolved_batch_size)
+    if not batch:
+        return ()
+    insert_query = query if query is not None else load_insert_query()
+
+    rows: list[Mapping[str, Any] | None] = []
+    try:
+        async with async_connection(resolved_database) as pooled:
+            async with pooled.cursor() as cursor:
+                while batch:
+                    await cursor.executemany(
+                        insert_query,
+                        [transaction.query_parameters() for transaction in batch],
+                        returning=True,
+                    )
+                    for _ in batch:
+                        rows.append(await cursor.fetchone())
+                        cursor.nextset()
+                    batch = next_batch(pending, resolved_batch_size)
+    except psycopg.Error as error:
+        raise database_error(error) from error
+
+    if any(row is None for row in rows):
+        raise TransactionError("the database did not return every inserted transaction")
+    return tuple(InsertedTransaction.from_row(row) for row in rows)
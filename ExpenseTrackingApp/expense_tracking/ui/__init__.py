@@ -1,6 +1,32 @@
-"""Streamlit pages for the local expense tracker."""
+"""Streamlit pages for the local expense tracker.
 
-from expense_tracking.ui.reports import render_report_page
-from expense_tracking.ui.transactions import render_add_transaction_page
+Public names are imported on first use; see ``expense_tracking.lazy``.
+"""
 
-__all__ = ["render_add_transaction_page", "render_report_page"]
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from expense_tracking.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from expense_tracking.ui.browser import render_transaction_browser_page
+    from expense_tracking.ui.bulk_entry import render_bulk_entry_page
+    from expense_tracking.ui.reports import render_report_page
+    from expense_tracking.ui.transactions import render_add_transaction_page
+
+_EXPORTS = {
+    "render_add_transaction_page": "expense_tracking.ui.transactions",
+    "render_bulk_entry_page": "expense_tracking.ui.bulk_entry",
+    "render_report_page": "expense_tracking.ui.reports",
+    "render_transaction_browser_page": "expense_tracking.ui.browser",
+}
+
+__all__ = [
+    "render_add_transaction_page",
+    "render_bulk_entry_page",
+    "render_report_page",
+    "render_transaction_browser_page",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, globals())
@@ -0,0 +1,134 @@
+"""Streamlit page for paging through stored transactions."""
+
+from __future__ import annotations
+
+from decimal import Decimal, InvalidOperation
+from typing import Sequence
+
+import pandas as pd
+import streamlit as st
+
+from expense_tracking.browse import (
+    DEFAULT_PAGE_SIZE,
+    PageCursor,
+    TransactionFilter,
+    browse_transactions,
+)
+from expense_tracking.errors import ExpenseTrackingError, ValidationError
+from expense_tracking.models import ALLOWED_TRANSACTION_TYPES, InsertedTransaction
+from expense_tracking.ui.transactions import TRANSACTION_TYPE_LABELS
+
+
+PAGE_SIZES = (25, DEFAULT_PAGE_SIZE, 100)
+ALL_TYPES = "all"
+
+
+def parse_amount_filter(value: str, label: str) -> Decimal | None:
+    if not value.strip():
+        return None
+    try:
+        return Decimal(value.strip())
+    except InvalidOperation as error:
+        raise ValidationError(f"{label} must be a valid decimal number") from error
+
+
+def transactions_frame(transactions: Sequence[InsertedTransaction]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "ID": transaction.id,
+                "Date": transaction.occurred_on,
+                "Type": TRANSACTION_TYPE_LABELS[transaction.transaction_type],
+                "Amount": f"${transaction.amount:,.2f}",
+                "Description": transaction.description,
+            }
+            for transaction in transactions
+        ],
+        columns=["ID", "Date", "Type", "Amount", "Description"],
+    )
+
+
+def show_newer_page() -> None:
+    st.session_state["browse_cursors"].pop()
+
+
+def show_older_page(cursor: PageCursor) -> None:
+    st.session_state["browse_cursors"].append(cursor)
+
+
+def render_transaction_browser_page() -> None:
+    """Render filters and one keyset-paginated page of transactions."""
+
+    st.title("Browse Transactions")
+    st.caption("Newest first. Filters run in the database; one page is loaded at a time.")
+
+    with st.form("browse_filters_form"):
+        left, right = st.columns(2)
+        with left:
+            transaction_type = st.selectbox(
+                "Type",
+                (ALL_TYPES, *ALLOWED_TRANSACTION_TYPES),
+                format_func=lambda value: (
+                    "All types" if value == ALL_TYPES else TRANSACTION_TYPE_LABELS[value]
+                ),
+            )
+            start_date = st.date_input("From", value=None)
+            min_amount = st.text_input("Minimum amount", placeholder="0.00")
+        with right:
+            page_size = st.selectbox(
+                "Rows per page",
+                PAGE_SIZES,
+                index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE),
+            )
+            end_date = st.date_input("To", value=None)
+            max_amount = st.text_input("Maximum amount", placeholder="No limit")
+        st.form_submit_button("Apply filters", use_container_width=True)
+
+    try:
+        filters = TransactionFilter(
+            transaction_type=None if transaction_type == ALL_TYPES else transaction_type,
+            start_date=start_date,
+            end_date=end_date,
+            min_amount=parse_amount_filter(min_amount, "minimum amount"),
+            max_amount=parse_amount_filter(max_amount, "maximum amount"),
+        )
+    except ExpenseTrackingError as error:
+        st.error(str(error))
+        return
+
+    view = (filters, page_size)
+    if st.session_state.get("browse_view") != view:
+        st.session_state["browse_view"] = view
+        st.session_state["browse_cursors"] = [None]
+    cursors = st.session_state["browse_cursors"]
+
+    try:
+        page = browse_transactions(filters, after=cursors[-1], page_size=page_size)
+    except ExpenseTrackingError as error:
+        st.error(str(error))
+        return
+
+    if page.transactions:
+        st.dataframe(
+            transactions_frame(page.transactions),
+            hide_index=True,
+            use_container_width=True,
+        )
+    else:
+        st.info("No transactions match these filters.")
+
+    newer, position, older = st.columns(3)
+    newer.button(
+        "Newer",
+        disabled=len(cursors) == 1,
+        on_click=show_newer_page,
+        use_container_width=True,
+    )
+    position.caption(f"Page {len(cursors)}")
+    older.button(
+        "Older",
+        disabled=not page.has_more,
+        on_click=show_older_page,
+        args=(page.next_cursor,),
+        use_container_width=True,
+    )
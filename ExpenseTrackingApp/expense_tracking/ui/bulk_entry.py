@@ -0,0 +1,161 @@
+"""Streamlit page for entering many transactions in one editable grid."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Iterable, Mapping, Sequence
+
+import pandas as pd
+import streamlit as st
+
+from expense_tracking.errors import ExpenseTrackingError, ValidationError
+from expense_tracking.models import ALLOWED_TRANSACTION_TYPES, Transaction
+from expense_tracking.transactions import add_transactions
+from expense_tracking.ui.transactions import parse_gui_amount
+
+
+ENTRY_COLUMNS = ("Date", "Type", "Amount", "Description")
+GRID_COLUMNS = (*ENTRY_COLUMNS, "Error")
+
+
+@dataclass(frozen=True)
+class BulkRow:
+    """One non-blank grid row and the outcome of validating it."""
+
+    values: dict[str, Any]
+    transaction: Transaction | None = None
+    error: str | None = None
+
+
+def is_blank(value: Any) -> bool:
+    if isinstance(value, str):
+        return not value.strip()
+    return value is None or bool(pd.isna(value))
+
+
+def parse_grid_date(value: Any) -> date:
+    if is_blank(value):
+        raise ValidationError("date is required")
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value.strip())
+        except ValueError as error:
+            raise ValidationError("date must use YYYY-MM-DD") from error
+    raise ValidationError("transaction date must be a date")
+
+
+def validate_bulk_rows(rows: Iterable[Mapping[str, Any]]) -> list[BulkRow]:
+    """Validate every grid row, skipping rows with no amount or description."""
+
+    results = []
+    for row in rows:
+        values = {column: row.get(column) for column in ENTRY_COLUMNS}
+        if is_blank(values["Amount"]) and is_blank(values["Description"]):
+            continue
+        try:
+            transaction = Transaction(
+                occurred_on=parse_grid_date(values["Date"]),
+                transaction_type=(
+                    "" if is_blank(values["Type"]) else str(values["Type"])
+                ),
+                amount=parse_gui_amount(
+                    "" if is_blank(values["Amount"]) else str(values["Amount"])
+                ),
+                description=(
+                    "" if is_blank(values["Description"]) else str(values["Description"])
+                ),
+            )
+        except ValidationError as error:
+            results.append(BulkRow(values, error=str(error)))
+        else:
+            results.append(BulkRow(values, transaction=transaction))
+    return results
+
+
+def bulk_entry_frame(rows: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+    frame = pd.DataFrame(list(rows), columns=list(GRID_COLUMNS))
+    return frame.astype({"Date": "object", "Amount": "object", "Error": "object"})
+
+
+def render_bulk_entry_page() -> None:
+    """Render the grid and add every valid row in one database transaction."""
+
+    st.title("Bulk Entry")
+    st.caption(
+        "Add rows to the grid, then submit them together. Rows with errors stay "
+        "in the grid for correction; blank rows are ignored."
+    )
+
+    outcome = st.session_state.pop("bulk_entry_outcome", None)
+    if outcome is not None:
+        added, rejected = outcome
+        if added:
+            st.success(f"Added {added} transaction{'s' if added != 1 else ''}.")
+        if rejected:
+            st.error(
+                f"{rejected} row{'s' if rejected != 1 else ''} could not be added; "
+                "see the Error column."
+            )
+
+    grid_version = st.session_state.get("bulk_entry_version", 0)
+    with st.form("bulk_entry_form"):
+        edited = st.data_editor(
+            bulk_entry_frame(st.session_state.get("bulk_entry_rows", [])),
+            key=f"bulk_entry_grid_{grid_version}",
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Date": st.column_config.DateColumn(
+                    "Date",
+                    default=date.today(),
+                    format="YYYY-MM-DD",
+                ),
+                "Type": st.column_config.SelectboxColumn(
+                    "Type",
+                    options=ALLOWED_TRANSACTION_TYPES,
+                    default=ALLOWED_TRANSACTION_TYPES[0],
+                ),
+                "Amount": st.column_config.TextColumn("Amount"),
+                "Description": st.column_config.TextColumn("Description"),
+                "Error": st.column_config.TextColumn("Error", disabled=True),
+            },
+        )
+        submitted = st.form_submit_button(
+            "Add valid rows",
+            type="primary",
+            use_container_width=True,
+        )
+
+    if not submitted:
+        return
+
+    results = validate_bulk_rows(edited.to_dict("records"))
+    if not results:
+        st.warning("Enter at least one transaction.")
+        return
+    valid = [row.transaction for row in results if row.transaction is not None]
+    rejected = [row for row in results if row.error is not None]
+
+    added = 0
+    if valid:
+        try:
+            added = len(add_transactions(valid))
+        except ExpenseTrackingError as error:
+            st.error(f"Nothing was added: {error}")
+            return
+        except Exception:
+            st.error("Nothing was added because of an unexpected error.")
+            return
+
+    st.session_state["bulk_entry_rows"] = [
+        {**row.values, "Error": row.error} for row in rejected
+    ]
+    st.session_state["bulk_entry_version"] = grid_version + 1
+    st.session_state["bulk_entry_outcome"] = (added, len(rejected))
+    st.rerun()
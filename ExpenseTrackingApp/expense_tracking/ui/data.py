@@ -0,0 +1,64 @@
+"""Report data cached across Streamlit reruns and sessions.
+
+Cached entries are keyed by the transaction data version from migration
+``004``. The version advances in the same database transaction as every
+insert, update or delete, so an entry is reused until new rows are
+committed and is never served after that. There is no time-based expiry.
+Pools need no Streamlit cache because ``expense_tracking.pool`` already
+keeps one per database for the whole process.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import psycopg
+import streamlit as st
+
+from expense_tracking.config import resolve_database
+from expense_tracking.reporting.cash_flow import CashFlowReport
+from expense_tracking.reporting.data import load_cash_flow_report, load_data_version
+from expense_tracking.transactions import database_error
+
+
+CACHED_REPORT_ENTRIES = 32
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHED_REPORT_ENTRIES)
+def cached_cash_flow_report(
+    start_date: date,
+    end_date: date,
+    database: str,
+    summary_only: bool,
+    data_version: int,
+) -> CashFlowReport:
+    """Load one period's report; ``data_version`` only keys the cache."""
+
+    return load_cash_flow_report(
+        start_date=start_date,
+        end_date=end_date,
+        database=database,
+        summary_only=summary_only,
+    )
+
+
+def period_report(
+    start_date: date,
+    end_date: date,
+    *,
+    database: str | None = None,
+    summary_only: bool = False,
+) -> CashFlowReport:
+    """Return the period's report, reading PostgreSQL only after a write."""
+
+    resolved_database = resolve_database(database)
+    try:
+        return cached_cash_flow_report(
+            start_date,
+            end_date,
+            resolved_database,
+            summary_only,
+            load_data_version(resolved_database),
+        )
+    except psycopg.Error as error:
+        raise database_error(error) from error
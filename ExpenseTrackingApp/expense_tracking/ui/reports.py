@@ -4,17 +4,29 @@ from __future__ import annotations
 
 import calendar
 from datetime import date
+from html import escape
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import streamlit as st
 
 from expense_tracking.errors import ExpenseTrackingError
-from expense_tracking.reports import ReportPeriod, generate_report
+from expense_tracking.jobs import JobStatus, get_report_queue
+from expense_tracking.report_cache import ReportCache
+from expense_tracking.reports import (
+    ReportPeriod,
+    generate_report,
+    prune_report_outputs,
+)
+from expense_tracking.ui.data import period_report
 
 
 REPORT_MODES = ("Month", "Year", "Custom range")
 MONTH_NAMES = tuple(calendar.month_name[1:])
+REPORT_POLL_INTERVAL = 1.0
+UNEXPECTED_REPORT_ERROR = (
+    "The report could not be generated because of an unexpected error."
+)
 
 
 def build_gui_report_period(
@@ -41,14 +53,120 @@ def build_gui_report_period(
 
 
 def load_report_download(output_path: Path) -> dict[str, Any]:
-    """Read a generated report into session-safe download data."""
+    """Return a reference to a generated report for later download.
 
+    Only the name and path are kept in session state; the bytes are read
+    from disk when the user clicks the download button.
+    """
+
+    output_path = Path(output_path).resolve()
+    output_path.stat()
     return {
         "filename": output_path.name,
-        "data": output_path.read_bytes(),
+        "path": str(output_path),
     }
 
 
+def report_download_data(download: dict[str, Any]) -> Callable[[], bytes]:
+    """Return a callable that reads the report when the download is clicked.
+
+    The file may be pruned or removed between rendering the button and the
+    click, so a read failure downloads a short page explaining it instead
+    of raising inside Streamlit's media handler.
+    """
+
+    path = Path(download["path"])
+
+    def read_report() -> bytes:
+        try:
+            return path.read_bytes()
+        except OSError:
+            message = (
+                f"{download['filename']} is no longer available. "
+                "Generate the report again to download it."
+            )
+            return (
+                "<!doctype html><title>Report unavailable</title>"
+                f"<p>{escape(message)}</p>"
+            ).encode("utf-8")
+
+    return read_report
+
+
+def report_error_message(error: BaseException | None) -> str:
+    if isinstance(error, (ExpenseTrackingError, OSError, ValueError)):
+        return str(error)
+    return UNEXPECTED_REPORT_ERROR
+
+
+def finish_report_job(job: JobStatus) -> None:
+    """Move a finished job's outcome into session state for the next run."""
+
+    st.session_state.pop("report_job_id", None)
+    if job.state == "failed":
+        st.session_state["report_message"] = ("error", report_error_message(job.error))
+        return
+    try:
+        download = load_report_download(job.result)
+    except OSError as error:
+        st.session_state["report_message"] = ("error", str(error))
+        return
+    st.session_state["latest_report_download"] = download
+    try:
+        prune_report_outputs(
+            keep=Path(download["path"]),
+            running_since=get_report_queue().oldest_running_start(),
+        )
+    except OSError:
+        pass
+    st.session_state["report_message"] = (
+        "success",
+        f"Report ready: {download['filename']}",
+    )
+
+
+def show_period_preview(period: ReportPeriod) -> None:
+    """Show the period's totals from the data-version-keyed report cache.
+
+    Reruns that follow no committed write reuse the cached summary instead
+    of querying PostgreSQL again.
+    """
+
+    try:
+        report = period_report(
+            period.start_date,
+            period.end_date,
+            summary_only=True,
+        )
+    except ExpenseTrackingError as error:
+        st.caption(f"Preview unavailable: {error}")
+        return
+    summary = report.summary
+    st.subheader(period.label)
+    income, expenses, investments, net = st.columns(4)
+    income.metric("Income", f"${summary.income:,.2f}")
+    expenses.metric("Expenses", f"${summary.expenses:,.2f}")
+    investments.metric("Investments", f"${summary.investments:,.2f}")
+    net.metric("Net cash flow", f"${summary.net_cash_flow:,.2f}")
+
+
+@st.fragment(run_every=REPORT_POLL_INTERVAL)
+def show_report_job(job_id: str) -> None:
+    """Poll the background job without blocking the rest of the page."""
+
+    job = get_report_queue().status(job_id)
+    if job is None:
+        st.session_state.pop("report_job_id", None)
+        return
+    if job.done:
+        finish_report_job(job)
+        st.rerun()
+    if job.state == "queued":
+        st.info(f"Report queued at position {job.position}…")
+    else:
+        st.info(f"Generating report… {job.elapsed:.0f} s elapsed")
+
+
 def render_report_page() -> None:
     """Render report period controls and an HTML download action."""
 
@@ -112,33 +230,52 @@ def render_report_page() -> None:
             use_container_width=True,
         )
 
+    period: ReportPeriod | None = None
+    period_error = None
+    try:
+        period = build_gui_report_period(
+            mode,
+            year=year,
+            month=month,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    except (ExpenseTrackingError, ValueError) as error:
+        period_error = str(error)
+
     if submitted:
-        try:
-            period = build_gui_report_period(
-                mode,
-                year=year,
-                month=month,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            with st.spinner("Generating report…"):
-                output_path = generate_report(period=period)
-                download = load_report_download(output_path)
-        except (ExpenseTrackingError, OSError, ValueError) as error:
-            st.error(str(error))
-        except Exception:
-            st.error(
-                "The report could not be generated because of an unexpected error."
-            )
+        if period is None:
+            st.error(period_error)
         else:
-            st.session_state["latest_report_download"] = download
-            st.success(f"Report ready: {download['filename']}")
+            st.session_state["report_job_id"] = get_report_queue().submit(
+                generate_report,
+                period=period,
+                cache=ReportCache(),
+            )
+
+    if period is not None:
+        show_period_preview(period)
+
+    message = st.session_state.pop("report_message", None)
+    if message is not None:
+        kind, text = message
+        (st.success if kind == "success" else st.error)(text)
+
+    job_id = st.session_state.get("report_job_id")
+    if job_id is not None:
+        show_report_job(job_id)
 
     latest_report = st.session_state.get("latest_report_download")
-    if latest_report is not None:
+    if latest_report is not None and not Path(latest_report["path"]).is_file():
+        del st.session_state["latest_report_download"]
+        st.warning(
+            f"{latest_report['filename']} has been cleaned up. "
+            "Generate the report again to download it."
+        )
+    elif latest_report is not None:
         st.download_button(
             "Download report",
-            data=latest_report["data"],
+            data=report_download_data(latest_report),
             file_name=latest_report["filename"],
             mime="text/html",
             type="primary",
@@ -8,12 +8,12 @@ from decimal import Decimal, InvalidOperation
 import streamlit as st
 
 from expense_tracking.errors import ExpenseTrackingError, ValidationError
-from expense_tracking.transactions import (
+from expense_tracking.models import (
     ALLOWED_TRANSACTION_TYPES,
     Transaction,
-    add_transaction,
     validate_amount,
 )
+from expense_tracking.transactions import add_transaction
 
 
 TRANSACTION_TYPE_LABELS = {
@@ -0,0 +1,137 @@
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+-- Block concurrent writers until the triggers exist and the backfill is done,
+-- so no transaction row can be missed or counted twice.
+LOCK TABLE public.transactions IN SHARE ROW EXCLUSIVE MODE;
+
+CREATE TABLE IF NOT EXISTS public.transaction_monthly_totals (
+    month date NOT NULL,
+    transaction_type text NOT NULL,
+    amount numeric NOT NULL,
+    transaction_count bigint NOT NULL,
+
+    CONSTRAINT transaction_monthly_totals_pkey
+        PRIMARY KEY (month, transaction_type),
+    CONSTRAINT transaction_monthly_totals_month_check
+        CHECK (month = date_trunc('month', month)::date),
+    CONSTRAINT transaction_monthly_totals_count_check
+        CHECK (transaction_count > 0)
+);
+
+CREATE OR REPLACE FUNCTION public.adjust_transaction_monthly_total(
+    target_month date,
+    target_type text,
+    amount_delta numeric,
+    count_delta bigint
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF count_delta > 0 THEN
+        INSERT INTO public.transaction_monthly_totals AS totals (
+            month,
+            transaction_type,
+            amount,
+            transaction_count
+        )
+        VALUES (target_month, target_type, amount_delta, count_delta)
+        ON CONFLICT (month, transaction_type) DO UPDATE
+        SET
+            amount = totals.amount + excluded.amount,
+            transaction_count = totals.transaction_count + excluded.transaction_count;
+    ELSE
+        UPDATE public.transaction_monthly_totals
+        SET
+            amount = amount + amount_delta,
+            transaction_count = transaction_count + count_delta
+        WHERE month = target_month
+          AND transaction_type = target_type
+          AND transaction_count + count_delta > 0;
+
+        IF NOT FOUND THEN
+            DELETE FROM public.transaction_monthly_totals
+            WHERE month = target_month
+              AND transaction_type = target_type;
+        END IF;
+    END IF;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.maintain_transaction_monthly_totals()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM public.adjust_transaction_monthly_total(
+            date_trunc('month', OLD.occurred_on)::date,
+            OLD.transaction_type,
+            -OLD.amount,
+            -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM public.adjust_transaction_monthly_total(
+            date_trunc('month', NEW.occurred_on)::date,
+            NEW.transaction_type,
+            NEW.amount,
+            1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.clear_transaction_monthly_totals()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    TRUNCATE public.transaction_monthly_totals;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS transactions_monthly_totals_row_trigger
+    ON public.transactions;
+
+CREATE TRIGGER transactions_monthly_totals_row_trigger
+    AFTER INSERT
+        OR UPDATE OF occurred_on, transaction_type, amount
+        OR DELETE
+    ON public.transactions
+    FOR EACH ROW
+    EXECUTE FUNCTION public.maintain_transaction_monthly_totals();
+
+DROP TRIGGER IF EXISTS transactions_monthly_totals_truncate_trigger
+    ON public.transactions;
+
+CREATE TRIGGER transactions_monthly_totals_truncate_trigger
+    AFTER TRUNCATE
+    ON public.transactions
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.clear_transaction_monthly_totals();
+
+-- Backfill: rebuild the rollup from the transaction rows.
+DELETE FROM public.transaction_monthly_totals;
+
+INSERT INTO public.transaction_monthly_totals (
+    month,
+    transaction_type,
+    amount,
+    transaction_count
+)
+SELECT
+    date_trunc('month', occurred_on)::date,
+    transaction_type,
+    sum(amount),
+    count(*)
+FROM public.transactions
+GROUP BY
+    date_trunc('month', occurred_on)::date,
+    transaction_type;
+
+COMMIT;
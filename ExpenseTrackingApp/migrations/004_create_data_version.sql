@@ -0,0 +1,59 @@
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+-- A counter that changes in the same transaction as every write to
+-- public.transactions. Readers compare its total with the value their cached
+-- data was built from. It is stored in rows rather than a sequence so that a
+-- rolled-back write does not advance it and readers never see a value for
+-- data that is not yet committed.
+--
+-- The total is spread over 16 slots and each writing transaction updates the
+-- slot chosen by its transaction id, so concurrent writers only wait for each
+-- other when they land on the same slot instead of queueing on one row.
+CREATE TABLE IF NOT EXISTS public.transaction_data_version (
+    slot smallint NOT NULL,
+    version bigint NOT NULL DEFAULT 0,
+    last_transaction_id bigint,
+
+    CONSTRAINT transaction_data_version_pkey PRIMARY KEY (slot),
+    CONSTRAINT transaction_data_version_slot_check CHECK (slot BETWEEN 0 AND 15)
+);
+
+INSERT INTO public.transaction_data_version (slot, version)
+SELECT slot, 0
+FROM generate_series(0, 15) AS slot
+ON CONFLICT (slot) DO NOTHING;
+
+-- Only the first write statement of a transaction advances the version: later
+-- statements find their own transaction id already recorded in the slot and
+-- update nothing. Pipelined batches run one INSERT per row, so this is what
+-- makes a bulk insert advance the version once.
+CREATE OR REPLACE FUNCTION public.bump_transaction_data_version()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    current_transaction_id bigint := txid_current();
+BEGIN
+    UPDATE public.transaction_data_version
+    SET version = version + 1,
+        last_transaction_id = current_transaction_id
+    WHERE slot = current_transaction_id % 16
+      AND last_transaction_id IS DISTINCT FROM current_transaction_id;
+    RETURN NULL;
+END;
+$$;
+
+-- Statement-level, so TRUNCATE is covered too; the function above coalesces
+-- the statements of one transaction into a single increment.
+DROP TRIGGER IF EXISTS transactions_data_version_trigger
+    ON public.transactions;
+
+CREATE TRIGGER transactions_data_version_trigger
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE
+    ON public.transactions
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.bump_transaction_data_version();
+
+COMMIT;
@@ -0,0 +1,19 @@
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+-- The transaction browser pages newest first on (occurred_on, id). Each
+-- index below ends in id, so a page is a bounded backward index scan that
+-- starts at the previous page's last row instead of skipping an OFFSET.
+CREATE INDEX IF NOT EXISTS transactions_occurred_on_id_idx
+    ON public.transactions (occurred_on, id);
+
+CREATE INDEX IF NOT EXISTS transactions_type_occurred_on_id_idx
+    ON public.transactions (transaction_type, occurred_on, id);
+
+-- Both indexes from migration 001 are prefixes of the ones above and serve
+-- no query the new indexes cannot.
+DROP INDEX IF EXISTS public.transactions_occurred_on_idx;
+DROP INDEX IF EXISTS public.transactions_type_occurred_on_idx;
+
+COMMIT;
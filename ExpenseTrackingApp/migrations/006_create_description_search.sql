@@ -0,0 +1,17 @@
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+-- Description search matches substrings ("costco" in "COSTCO WHOLESALE #412")
+-- and tolerates small typos, which a trigram index serves directly. Stemmed
+-- full-text search would add a stored tsvector column to every row without
+-- helping short merchant-style descriptions.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- GiST rather than GIN: besides the ILIKE and <% filters it can return rows
+-- in <<-> (word-similarity distance) order, so a ranked search reads only
+-- the best LIMIT matches instead of sorting every match.
+CREATE INDEX IF NOT EXISTS transactions_description_trgm_idx
+    ON public.transactions USING gist (description gist_trgm_ops);
+
+COMMIT;
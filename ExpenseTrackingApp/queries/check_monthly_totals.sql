@@ -0,0 +1,29 @@
+-- Return every month and type whose rollup differs from the transaction rows.
+-- An empty result means public.transaction_monthly_totals is exact.
+WITH expected AS (
+    SELECT
+        date_trunc('month', occurred_on)::date AS month,
+        transaction_type,
+        sum(amount) AS amount,
+        count(*) AS transaction_count
+    FROM public.transactions
+    GROUP BY
+        date_trunc('month', occurred_on)::date,
+        transaction_type
+)
+SELECT
+    coalesce(expected.month, totals.month) AS month,
+    coalesce(expected.transaction_type, totals.transaction_type) AS transaction_type,
+    expected.amount AS expected_amount,
+    totals.amount AS rollup_amount,
+    expected.transaction_count AS expected_count,
+    totals.transaction_count AS rollup_count
+FROM expected
+FULL OUTER JOIN public.transaction_monthly_totals AS totals
+    ON totals.month = expected.month
+   AND totals.transaction_type = expected.transaction_type
+WHERE expected.amount IS DISTINCT FROM totals.amount
+   OR expected.transaction_count IS DISTINCT FROM totals.transaction_count
+ORDER BY
+    month,
+    transaction_type;
@@ -0,0 +1,17 @@
+SELECT
+    id,
+    occurred_on,
+    transaction_type,
+    amount,
+    description
+FROM public.transactions
+WHERE (
+        description ILIKE %(pattern)s
+        OR %(query)s <%% description
+    )
+  AND occurred_on BETWEEN %(start_date)s AND %(end_date)s
+ORDER BY
+    %(query)s <<-> description,
+    occurred_on DESC,
+    id DESC
+LIMIT %(limit)s;
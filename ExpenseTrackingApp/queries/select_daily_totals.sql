@@ -0,0 +1,13 @@
+SELECT
+    occurred_on,
+    transaction_type,
+    sum(amount) AS amount
+FROM public.transactions
+WHERE occurred_on >= %(start_date)s
+  AND occurred_on < %(end_date_exclusive)s
+GROUP BY
+    occurred_on,
+    transaction_type
+ORDER BY
+    occurred_on,
+    transaction_type;
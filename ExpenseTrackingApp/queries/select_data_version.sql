@@ -0,0 +1,2 @@
+SELECT COALESCE(sum(version), 0)::bigint AS version
+FROM public.transaction_data_version;
@@ -0,0 +1,46 @@
+-- Complete months come from the trigger-maintained rollup. Transaction rows
+-- are read only for the partial month at the start of the range, before
+-- %(full_start)s, and the partial month at the end, from %(full_end)s. Each
+-- edge is its own bounded range, so the rows scanned never depend on how
+-- many complete months lie between them.
+WITH complete_months AS (
+    SELECT
+        month,
+        transaction_type,
+        amount
+    FROM public.transaction_monthly_totals
+    WHERE month >= %(full_start)s
+      AND month < %(full_end)s
+),
+partial_months AS (
+    SELECT
+        date_trunc('month', occurred_on)::date AS month,
+        transaction_type,
+        amount
+    FROM public.transactions
+    WHERE occurred_on >= %(start_date)s
+      AND occurred_on < %(full_start)s
+    UNION ALL
+    SELECT
+        date_trunc('month', occurred_on)::date AS month,
+        transaction_type,
+        amount
+    FROM public.transactions
+    WHERE occurred_on >= %(full_end)s
+      AND occurred_on < %(end_date_exclusive)s
+)
+SELECT
+    month,
+    transaction_type,
+    sum(amount) AS amount
+FROM (
+    SELECT month, transaction_type, amount FROM complete_months
+    UNION ALL
+    SELECT month, transaction_type, amount FROM partial_months
+) AS combined
+GROUP BY
+    month,
+    transaction_type
+ORDER BY
+    month,
+    transaction_type;
@@ -0,0 +1,13 @@
+SELECT
+    date_trunc('month', occurred_on)::date AS month,
+    transaction_type,
+    sum(amount) AS amount
+FROM public.transactions
+WHERE occurred_on >= %(start_date)s
+  AND occurred_on < %(end_date_exclusive)s
+GROUP BY
+    date_trunc('month', occurred_on),
+    transaction_type
+ORDER BY
+    month,
+    transaction_type;
@@ -0,0 +1,18 @@
+-- The scalar type equality lets PostgreSQL read the ordering straight from
+-- the (transaction_type, occurred_on, id) index; "= ANY(...)" would not.
+SELECT
+    id,
+    occurred_on,
+    transaction_type,
+    amount,
+    description,
+    created_at
+FROM public.transactions
+WHERE transaction_type = %(transaction_type)s
+  AND occurred_on BETWEEN %(start_date)s AND %(end_date)s
+  AND amount BETWEEN %(min_amount)s AND %(max_amount)s
+  AND (occurred_on, id) < (%(before_occurred_on)s, %(before_id)s)
+ORDER BY
+    occurred_on DESC,
+    id DESC
+LIMIT %(limit)s;
@@ -1,33 +1,45 @@
-"""Add one transaction to the expense tracking database."""
+"""Add transactions to the expense tracking database."""
 
 from __future__ import annotations
 
 import argparse
+import csv
+import json
 import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Mapping, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Sequence, TextIO
 
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from expense_tracking.config import DEFAULT_DATABASE, resolve_database
+from expense_tracking.config import DEFAULT_BATCH_SIZE, DEFAULT_DATABASE, resolve_database
 from expense_tracking.errors import DatabaseError, QueryLoadError, TransactionError, ValidationError
-from expense_tracking.transactions import (
+from expense_tracking.models import (
     ALLOWED_TRANSACTION_TYPES,
     MAX_AMOUNT,
     InsertedTransaction,
     Transaction,
-    add_transaction,
     validate_amount,
     validate_description,
 )
 
 
 ALLOWED_TYPES = ALLOWED_TRANSACTION_TYPES
+REQUIRED_FIELDS = ("amount", "description")
+STDIN = "-"
+
+
+@dataclass
+class BatchCounts:
+    accepted: int = 0
+    rejected: int = 0
 
 
 def parse_amount(value: str) -> Decimal:
@@ -62,6 +74,16 @@ def parse_database(value: str) -> str:
         raise argparse.ArgumentTypeError(str(error)) from error
 
 
+def parse_batch_size(value: str) -> int:
+    try:
+        batch_size = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError("batch size must be an integer") from error
+    if batch_size < 1:
+        raise argparse.ArgumentTypeError("batch size must be greater than zero")
+    return batch_size
+
+
 def parse_args(
     argv: Sequence[str] | None = None,
     *,
@@ -70,7 +92,10 @@ def parse_args(
     default_date = today or date.today()
     default_database = resolve_database()
     parser = argparse.ArgumentParser(
-        description="Add one transaction to the expense tracking database.",
+        description=(
+            "Add one transaction, or a stream of them from CSV or NDJSON, to the "
+            "expense tracking database."
+        ),
         epilog=(
             "Connection settings use PostgreSQL's standard PGHOST, PGPORT, "
             "PGUSER, PGPASSWORD, and PGPASSFILE environment variables or .pgpass."
@@ -78,15 +103,16 @@ def parse_args(
     )
     parser.add_argument(
         "--amount",
-        required=True,
         type=parse_amount,
-        help="Positive transaction amount with at most two decimal places.",
+        help=(
+            "Positive transaction amount with at most two decimal places. "
+            "Required unless reading from a file."
+        ),
     )
     parser.add_argument(
         "--description",
-        required=True,
         type=parse_description,
-        help="Nonblank transaction description.",
+        help="Nonblank transaction description. Required unless reading from a file.",
     )
     parser.add_argument(
         "--date",
@@ -94,14 +120,49 @@ def parse_args(
         type=parse_date,
         default=default_date,
         metavar="YYYY-MM-DD",
-        help=f"Transaction date (default: {default_date.isoformat()}).",
+        help=(
+            f"Transaction date (default: {default_date.isoformat()}). With a "
+            "file, used for rows without a date."
+        ),
     )
     parser.add_argument(
         "--type",
         dest="transaction_type",
         choices=ALLOWED_TYPES,
         default="expense",
-        help="Transaction type (default: expense).",
+        help=(
+            "Transaction type (default: expense). With a file, used for rows "
+            "without a type."
+        ),
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--from-csv",
+        metavar="PATH",
+        help=(
+            "Read transactions from a CSV file with a header row, or '-' for "
+            "standard input. Columns: date, type, amount, description."
+        ),
+    )
+    source.add_argument(
+        "--from-ndjson",
+        metavar="PATH",
+        help=(
+            "Read one JSON object per line from a file, or '-' for standard "
+            "input. Keys: date, type, amount, description."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=parse_batch_size,
+        default=DEFAULT_BATCH_SIZE,
+        help=(
+            "Rows sent per database round trip when reading from a file "
+            f"(default: {DEFAULT_BATCH_SIZE}). All valid rows of a file are "
+            "committed in one database transaction: if any batch fails, no "
+            "rows from the file are stored, so a failed feed can be rerun "
+            "without duplicates."
+        ),
     )
     parser.add_argument(
         "--database",
@@ -117,7 +178,27 @@ def parse_args(
         action="store_true",
         help="Validate and print the transaction without connecting or inserting.",
     )
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if args.from_csv is not None:
+        args.input_format, args.input_path = "csv", args.from_csv
+    elif args.from_ndjson is not None:
+        args.input_format, args.input_path = "ndjson", args.from_ndjson
+    else:
+        args.input_format, args.input_path = None, None
+
+    if args.input_format is not None:
+        given = [
+            f"--{name}" for name in REQUIRED_FIELDS if getattr(args, name) is not None
+        ]
+        if given:
+            parser.error(f"{', '.join(given)} cannot be combined with an input file")
+    else:
+        missing = [
+            f"--{name}" for name in REQUIRED_FIELDS if getattr(args, name) is None
+        ]
+        if missing:
+            parser.error(f"the following arguments are required: {', '.join(missing)}")
+    return args
 
 
 def format_transaction(
@@ -143,14 +224,180 @@ def transaction_from_args(args: argparse.Namespace) -> Transaction:
     )
 
 
+@contextmanager
+def open_input(path: str) -> Iterator[TextIO]:
+    if path == STDIN:
+        yield sys.stdin
+        return
+    with open(path, encoding="utf-8", newline="") as stream:
+        yield stream
+
+
+def csv_records(stream: TextIO) -> Iterator[tuple[int, Mapping[str, Any] | str]]:
+    """Check the header row, then yield each data row by line number."""
+
+    reader = csv.DictReader(stream)
+    fieldnames = reader.fieldnames or ()
+    missing = [name for name in REQUIRED_FIELDS if name not in fieldnames]
+    if fieldnames and missing:
+        raise ValidationError(f"CSV header is missing: {', '.join(missing)}")
+    return ((reader.line_num, row) for row in reader)
+
+
+def ndjson_records(stream: TextIO) -> Iterator[tuple[int, Mapping[str, Any] | str]]:
+    """Yield each object, or the reason a line is not one, by line number.
+
+    Numbers are kept as their source text so amounts are never rounded
+    through a float.
+    """
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line, parse_float=str, parse_int=str)
+        except json.JSONDecodeError as error:
+            yield line_number, f"invalid JSON: {error.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "each line must be a JSON object"
+            continue
+        yield line_number, record
+
+
+def record_text(record: Mapping[str, Any], field: str) -> str | None:
+    value = record.get(field)
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise argparse.ArgumentTypeError(f"{field} must be text or a number")
+    return value.strip() or None
+
+
+def transaction_from_record(
+    record: Mapping[str, Any],
+    *,
+    default_date: date,
+    default_type: str,
+) -> Transaction:
+    values = {
+        field: record_text(record, field)
+        for field in ("date", "type", *REQUIRED_FIELDS)
+    }
+    for field in REQUIRED_FIELDS:
+        if values[field] is None:
+            raise argparse.ArgumentTypeError(f"{field} is required")
+    return Transaction(
+        occurred_on=(
+            parse_date(values["date"]) if values["date"] is not None else default_date
+        ),
+        transaction_type=values["type"] if values["type"] is not None else default_type,
+        amount=parse_amount(values["amount"]),
+        description=parse_description(values["description"]),
+    )
+
+
+def valid_transactions(
+    records: Iterable[tuple[int, Mapping[str, Any] | str]],
+    counts: BatchCounts,
+    *,
+    default_date: date,
+    default_type: str,
+) -> Iterator[Transaction]:
+    """Yield each valid record as it is read, reporting rejected lines."""
+
+    for line_number, record in records:
+        try:
+            if isinstance(record, str):
+                raise argparse.ArgumentTypeError(record)
+            transaction = transaction_from_record(
+                record,
+                default_date=default_date,
+                default_type=default_type,
+            )
+        except (argparse.ArgumentTypeError, ValidationError) as error:
+            counts.rejected += 1
+            print(f"Rejected line {line_number}: {error}", file=sys.stderr)
+            continue
+        counts.accepted += 1
+        yield transaction
+
+
+def format_batch_summary(counts: BatchCounts, elapsed: float, *, dry_run: bool) -> str:
+    processed = counts.accepted + counts.rejected
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    verb = "Dry run: accepted" if dry_run else "Accepted"
+    return (
+        f"{verb} {counts.accepted}, rejected {counts.rejected} "
+        f"in {elapsed:.2f} s ({rate:,.0f} rows/s)"
+    )
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Stream transactions from a file into the database in batches.
+
+    Rows are validated as they are read and the valid ones are stored
+    atomically over one connection without keeping them in memory; rejected
+    rows are reported and skipped.
+    Returns 1 if any row was rejected or nothing could be stored.
+    """
+
+    counts = BatchCounts()
+    records = csv_records if args.input_format == "csv" else ndjson_records
+    started = time.perf_counter()
+    try:
+        with open_input(args.input_path) as stream:
+            transactions = valid_transactions(
+                records(stream),
+                counts,
+                default_date=args.occurred_on,
+                default_type=args.transaction_type,
+            )
+            if args.dry_run:
+                for _ in transactions:
+                    pass
+            else:
+                # Imported here so that validation alone never loads psycopg.
+                from expense_tracking.transactions import add_transaction_stream
+
+                add_transaction_stream(
+                    transactions,
+                    args.database,
+                    batch_size=args.batch_size,
+                )
+    except (OSError, UnicodeDecodeError, csv.Error) as error:
+        print(f"Unable to read input: {error}", file=sys.stderr)
+        return 1
+    except ValidationError as error:
+        print(f"Input error: {error}", file=sys.stderr)
+        return 1
+    except QueryLoadError as error:
+        print(f"Unable to load insert query: {error}", file=sys.stderr)
+        return 1
+    except DatabaseError as error:
+        print(f"Database error: {error}", file=sys.stderr)
+        return 1
+    except TransactionError as error:
+        print(f"Insert error: {error}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - started
+    print(format_batch_summary(counts, elapsed, dry_run=args.dry_run))
+    return 1 if counts.rejected else 0
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
+    if args.input_format is not None:
+        return run_batch(args)
     transaction = transaction_from_args(args)
 
     if args.dry_run:
         print(f"Dry run: {format_transaction(transaction.query_parameters())}")
         return 0
 
+    from expense_tracking.transactions import add_transaction
+
     try:
         inserted = add_transaction(transaction, args.database)
     except QueryLoadError as error:
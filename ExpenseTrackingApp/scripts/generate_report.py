@@ -14,12 +14,23 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from expense_tracking.config import (
+    DEFAULT_BATCH_WORKERS,
     DEFAULT_DATABASE,
+    DEFAULT_RENDER_SOCKET,
     DEFAULT_REPORT_OUTPUT_DIR,
+    REPORT_BACKENDS,
     resolve_database,
 )
 from expense_tracking.errors import ReportGenerationError, ValidationError
-from expense_tracking.reports import ReportPeriod, generate_report
+from expense_tracking.render_server import request_render
+from expense_tracking.report_cache import ReportCache
+from expense_tracking.reports import (
+    ReportJobResult,
+    ReportPeriod,
+    generate_report,
+    generate_reports,
+)
+from expense_tracking.timing import emit_timings, format_phase_table, record_timings
 
 
 DEFAULT_OUTPUT_DIR = DEFAULT_REPORT_OUTPUT_DIR
@@ -51,6 +62,30 @@ def parse_year(value: str) -> int:
     return year
 
 
+def parse_batch_period(value: str) -> ReportPeriod:
+    if ":" in value:
+        start, _, end = value.partition(":")
+        start_date = parse_iso_date(start)
+        end_date = parse_iso_date(end)
+        if end_date < start_date:
+            raise argparse.ArgumentTypeError("range end must be on or after its start")
+        return ReportPeriod.for_range(start_date, end_date)
+    if len(value) == 4:
+        return ReportPeriod.for_year(parse_year(value))
+    year, month = parse_month(value)
+    return ReportPeriod.for_month(year, month)
+
+
+def parse_workers(value: str) -> int:
+    try:
+        workers = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError("workers must be a whole number") from error
+    if workers < 1:
+        raise argparse.ArgumentTypeError("workers must be at least one")
+    return workers
+
+
 def parse_database(value: str) -> str:
     try:
         return resolve_database(value)
@@ -70,6 +105,16 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     period.add_argument("--month", type=parse_month, metavar="YYYY-MM")
     period.add_argument("--year", type=parse_year, metavar="YYYY")
     period.add_argument("--start", type=parse_iso_date, metavar="YYYY-MM-DD")
+    period.add_argument(
+        "--batch",
+        type=parse_batch_period,
+        nargs="+",
+        metavar="PERIOD",
+        help=(
+            "Render several periods concurrently; each PERIOD is YYYY-MM, "
+            "YYYY or YYYY-MM-DD:YYYY-MM-DD."
+        ),
+    )
     parser.add_argument(
         "--end",
         type=parse_iso_date,
@@ -90,6 +135,77 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         type=Path,
         help="Output HTML path (default: reports/output/<period>.html).",
     )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Directory for --batch reports (default: reports/output).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=parse_workers,
+        default=DEFAULT_BATCH_WORKERS,
+        help=f"Concurrent --batch renders (default: {DEFAULT_BATCH_WORKERS}).",
+    )
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help=(
+            "Build the report from monthly totals aggregated in PostgreSQL, "
+            "without transaction tables."
+        ),
+    )
+    parser.add_argument(
+        "--backend",
+        choices=REPORT_BACKENDS,
+        help=(
+            "Render with Quarto or build the same dashboard in-process "
+            "with Python (default: quarto, or python with --shared-assets "
+            "or --server)."
+        ),
+    )
+    parser.add_argument(
+        "--server",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_RENDER_SOCKET,
+        metavar="SOCKET",
+        help=(
+            "Send the job to a running scripts/render_server.py, which "
+            "renders with the python backend unless --backend quarto is "
+            "given and writes only inside "
+            f"reports/output/ (default socket: {DEFAULT_RENDER_SOCKET})."
+        ),
+    )
+    parser.add_argument(
+        "--shared-assets",
+        action="store_true",
+        help=(
+            "Write Plotly.js and DataTables once to a content-hashed assets "
+            "directory beside the report instead of embedding them; implies "
+            "--backend python."
+        ),
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Also write .gz (and .br with brotli installed) copies for static serving.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Render even when an up-to-date cached report exists.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print how long each phase of report generation took.",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        metavar="FILE",
+        help="Append every timed phase to FILE as one JSON object per line.",
+    )
     args = parser.parse_args(argv)
 
     if args.start is not None and args.end is None:
@@ -98,6 +214,20 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         parser.error("--end can only be used with --start")
     if args.start is not None and args.end < args.start:
         parser.error("--end must be on or after --start")
+    if args.batch is not None and (args.output is not None or args.server is not None):
+        parser.error("--batch cannot be combined with --output or --server")
+    if args.batch is None and args.output_dir is not None:
+        parser.error("--output-dir can only be used with --batch")
+    if args.shared_assets and args.backend == "quarto":
+        parser.error("--shared-assets requires the python backend")
+    if args.server is not None and (args.shared_assets or args.precompress):
+        parser.error("--shared-assets and --precompress cannot be used with --server")
+    if args.server is not None and (args.profile or args.profile_json is not None):
+        parser.error("--profile cannot be used with --server; profile the server instead")
+    if args.backend is None:
+        args.backend = (
+            "python" if args.shared_assets or args.server is not None else "quarto"
+        )
     return args
 
 
@@ -112,16 +242,68 @@ def report_period_from_args(args: argparse.Namespace) -> ReportPeriod:
     return ReportPeriod.for_range(args.start, args.end)
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    args = parse_args(argv)
-    period = report_period_from_args(args)
+def print_batch_results(results: Sequence[ReportJobResult]) -> None:
+    print(f"{'status':<7} {'seconds':>8}  {'period':<28} result")
+    for result in results:
+        outcome = result.output_path if result.ok else result.error
+        print(
+            f"{'ok' if result.ok else 'failed':<7} {result.seconds:>8.2f}  "
+            f"{result.period.label:<28} {outcome}"
+        )
+
 
+def run_batch(args: argparse.Namespace) -> int:
     try:
-        output_path = generate_report(
-            period=period,
+        results = generate_reports(
+            args.batch,
             database=args.database,
-            output_path=args.output,
+            output_dir=args.output_dir,
+            summary_only=args.summary_only,
+            cache=ReportCache(),
+            force=args.force,
+            backend=args.backend,
+            max_workers=args.workers,
+            shared_assets=args.shared_assets,
+            precompress=args.precompress,
         )
+    except (ReportGenerationError, ValidationError) as error:
+        print(f"Report error: {error}", file=sys.stderr)
+        return 1
+
+    print_batch_results(results)
+    failed = sum(not result.ok for result in results)
+    if failed:
+        print(f"{failed} of {len(results)} reports failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_single(args: argparse.Namespace) -> int:
+    period = report_period_from_args(args)
+
+    try:
+        if args.server is not None:
+            output_path = request_render(
+                period=period,
+                database=args.database,
+                output_path=args.output,
+                summary_only=args.summary_only,
+                force=args.force,
+                backend=args.backend,
+                socket_path=args.server,
+            )
+        else:
+            output_path = generate_report(
+                period=period,
+                database=args.database,
+                output_path=args.output,
+                summary_only=args.summary_only,
+                cache=ReportCache(),
+                force=args.force,
+                backend=args.backend,
+                shared_assets=args.shared_assets,
+                precompress=args.precompress,
+            )
     except ReportGenerationError as error:
         print(f"Report error: {error}", file=sys.stderr)
         return 1
@@ -130,5 +312,26 @@ def main(argv: Sequence[str] | None = None) -> int:
     return 0
 
 
+def run_report(args: argparse.Namespace) -> int:
+    return run_batch(args) if args.batch is not None else run_single(args)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    if not args.profile and args.profile_json is None:
+        return run_report(args)
+
+    emit_timings(args.profile_json)
+    try:
+        with record_timings() as spans:
+            status = run_report(args)
+    finally:
+        emit_timings(None)
+    if args.profile:
+        print()
+        print(format_phase_table(spans))
+    return status
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
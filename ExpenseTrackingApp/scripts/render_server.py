@@ -0,0 +1,86 @@
+"""Run a warm local render server for cash-flow reports."""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+from typing import Sequence
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from expense_tracking.config import DEFAULT_RENDER_SOCKET
+from expense_tracking.errors import ReportGenerationError
+from expense_tracking.pool import close_pools
+from expense_tracking.quarto_kernel import WarmKernel
+from expense_tracking.render_server import create_server
+from expense_tracking.reports import build_python_environment
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Serve cash-flow report render jobs over a Unix socket.",
+        epilog=(
+            "Submit jobs with scripts/generate_report.py --server. "
+            "PostgreSQL connection settings use the standard PG* environment "
+            "variables or .pgpass."
+        ),
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=DEFAULT_RENDER_SOCKET,
+        help=f"Unix socket path (default: {DEFAULT_RENDER_SOCKET}).",
+    )
+    parser.add_argument(
+        "--quarto",
+        action="store_true",
+        help=(
+            "Also keep a Jupyter kernel alive for --backend quarto jobs, so only "
+            "the first Quarto render pays kernel startup."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    kernel = None
+    if args.quarto:
+        quarto = shutil.which("quarto")
+        if quarto is None:
+            print(
+                "Render server error: Quarto is not installed or is not available "
+                "on PATH.",
+                file=sys.stderr,
+            )
+            return 1
+        kernel = WarmKernel(quarto, environment=build_python_environment())
+    try:
+        server = create_server(args.socket, kernel=kernel)
+    except (ReportGenerationError, OSError) as error:
+        if kernel is not None:
+            kernel.shutdown()
+        print(f"Render server error: {error}", file=sys.stderr)
+        return 1
+
+    print(f"Render server listening on {args.socket}", flush=True)
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        args.socket.unlink(missing_ok=True)
+        if kernel is not None:
+            kernel.shutdown()
+        close_pools()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
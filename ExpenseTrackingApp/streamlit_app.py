@@ -2,7 +2,12 @@
 
 import streamlit as st
 
-from expense_tracking.ui import render_add_transaction_page, render_report_page
+from expense_tracking.ui import (
+    render_add_transaction_page,
+    render_bulk_entry_page,
+    render_report_page,
+    render_transaction_browser_page,
+)
 
 
 st.set_page_config(
@@ -19,6 +24,16 @@ navigation = st.navigation(
             icon=":material/add_card:",
             default=True,
         ),
+        st.Page(
+            render_bulk_entry_page,
+            title="Bulk Entry",
+            icon=":material/table_rows:",
+        ),
+        st.Page(
+            render_transaction_browser_page,
+            title="Browse Transactions",
+            icon=":material/list:",
+        ),
         st.Page(
             render_report_page,
             title="Generate Report",
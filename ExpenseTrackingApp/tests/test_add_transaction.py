@@ -13,22 +13,26 @@ from datetime import date, datetime, timezone
 from decimal import Decimal
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import psycopg
 
-from expense_tracking.config import INSERT_QUERY_PATH
+from expense_tracking.config import INSERT_QUERY_PATH, INSERT_ROWS_QUERY_PATH
 from expense_tracking.errors import (
     DatabaseError,
     QueryLoadError,
     TransactionError,
     ValidationError,
 )
+from expense_tracking.models import MAX_AMOUNT
 from expense_tracking.transactions import (
-    MAX_AMOUNT,
     InsertedTransaction,
     Transaction,
     add_transaction,
+    add_transaction_async,
+    add_transaction_stream,
+    add_transactions,
+    add_transactions_async,
     load_insert_query,
 )
 from scripts.add_transaction import (
@@ -40,6 +44,9 @@ from scripts.add_transaction import (
 )
 
 
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "add_transaction.py"
+
+
 class ValidationTests(unittest.TestCase):
     def test_default_date_type_and_database(self) -> None:
         with patch.dict(os.environ, {}, clear=True):
@@ -188,7 +195,7 @@ class QueryTests(unittest.TestCase):
             with self.assertRaises(QueryLoadError):
                 load_insert_query(missing)
 
-    @patch("expense_tracking.transactions.psycopg.connect")
+    @patch("expense_tracking.transactions.connection")
     def test_insert_uses_named_parameters_and_returns_row(
         self,
         connect_mock: MagicMock,
@@ -215,17 +222,13 @@ class QueryTests(unittest.TestCase):
         )
 
         self.assertEqual(result, InsertedTransaction.from_row(inserted))
-        connect_mock.assert_called_once()
-        self.assertEqual(
-            connect_mock.call_args.kwargs["dbname"],
-            "expense_tracking_app",
-        )
+        connect_mock.assert_called_once_with("expense_tracking_app")
         cursor.execute.assert_called_once_with(
             "INSERT QUERY",
             transaction.query_parameters(),
         )
 
-    @patch("expense_tracking.transactions.psycopg.connect")
+    @patch("expense_tracking.transactions.connection")
     def test_insert_requires_returned_row(self, connect_mock: MagicMock) -> None:
         transaction = Transaction(
             occurred_on=date(2026, 7, 27),
@@ -245,7 +248,7 @@ class QueryTests(unittest.TestCase):
             )
 
     @patch(
-        "expense_tracking.transactions.psycopg.connect",
+        "expense_tracking.transactions.connection",
         side_effect=psycopg.OperationalError("connection failed\nDETAIL: hidden"),
     )
     def test_database_errors_are_wrapped_concisely(
@@ -268,6 +271,285 @@ class QueryTests(unittest.TestCase):
         connect_mock.assert_called_once()
 
 
+class BulkInsertTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transactions = [
+            Transaction(
+                occurred_on=date(2026, 7, day),
+                transaction_type="expense",
+                amount=Decimal(f"{day}.25"),
+                description=f"Purchase {day}",
+            )
+            for day in range(1, 6)
+        ]
+
+    def returned_rows(self) -> list[dict[str, object]]:
+        return [
+            {
+                "id": 100 + index,
+                **transaction.query_parameters(),
+                "created_at": datetime(2026, 7, 27, 12, 0, tzinfo=timezone.utc),
+            }
+            for index, transaction in enumerate(self.transactions)
+        ]
+
+    @patch("expense_tracking.transactions.connection")
+    def test_batches_share_one_connection_and_preserve_order(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        connection = connect_mock.return_value.__enter__.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.side_effect = self.returned_rows()
+
+        result = add_transactions(
+            iter(self.transactions),
+            "expense_tracking_app",
+            batch_size=2,
+            query="INSERT QUERY",
+        )
+
+        connect_mock.assert_called_once_with("expense_tracking_app")
+        self.assertEqual([item.id for item in result], [100, 101, 102, 103, 104])
+        self.assertEqual(
+            [item.description for item in result],
+            [transaction.description for transaction in self.transactions],
+        )
+        self.assertEqual(cursor.executemany.call_count, 3)
+        for call, expected in zip(
+            cursor.executemany.call_args_list,
+            ([0, 1], [2, 3], [4]),
+        ):
+            self.assertEqual(call.args[0], "INSERT QUERY")
+            self.assertEqual(
+                call.args[1],
+                [self.transactions[index].query_parameters() for index in expected],
+            )
+            self.assertTrue(call.kwargs["returning"])
+
+    @patch("expense_tracking.transactions.connection")
+    def test_empty_input_does_not_connect(self, connect_mock: MagicMock) -> None:
+        self.assertEqual(
+            add_transactions([], "expense_tracking_app", query="INSERT QUERY"),
+            (),
+        )
+        connect_mock.assert_not_called()
+
+    @patch("expense_tracking.transactions.connection")
+    def test_invalid_items_and_batch_sizes_are_rejected(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        with self.assertRaisesRegex(ValidationError, "Transaction values"):
+            add_transactions(
+                [self.transactions[0], {"amount": "1.00"}],
+                "expense_tracking_app",
+                query="INSERT QUERY",
+            )
+        for batch_size in (0, -1, 1.5, True):
+            with self.subTest(batch_size=batch_size):
+                with self.assertRaisesRegex(ValidationError, "batch size"):
+                    add_transactions(
+                        self.transactions,
+                        "expense_tracking_app",
+                        batch_size=batch_size,
+                    )
+        connect_mock.assert_not_called()
+
+    @patch("expense_tracking.transactions.connection")
+    def test_missing_returned_row_is_reported(self, connect_mock: MagicMock) -> None:
+        connection = connect_mock.return_value.__enter__.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.side_effect = [self.returned_rows()[0], None]
+
+        with self.assertRaisesRegex(TransactionError, "did not return every"):
+            add_transactions(
+                self.transactions[:2],
+                "expense_tracking_app",
+                query="INSERT QUERY",
+            )
+
+    @patch(
+        "expense_tracking.transactions.connection",
+        side_effect=psycopg.OperationalError("connection failed\nDETAIL: hidden"),
+    )
+    def test_database_errors_are_wrapped_concisely(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        with self.assertRaisesRegex(DatabaseError, "^connection failed$"):
+            add_transactions(
+                self.transactions,
+                "expense_tracking_app",
+                query="INSERT QUERY",
+            )
+        connect_mock.assert_called_once()
+
+    @patch("expense_tracking.transactions.connection")
+    def test_stream_inserts_count_rows_without_returning(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        connection = connect_mock.return_value.__enter__.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+
+        inserted = add_transaction_stream(
+            iter(self.transactions),
+            "expense_tracking_app",
+            batch_size=2,
+            query="INSERT ROWS",
+        )
+
+        self.assertEqual(inserted, 5)
+        connect_mock.assert_called_once_with("expense_tracking_app")
+        self.assertEqual(cursor.executemany.call_count, 3)
+        for call, expected in zip(
+            cursor.executemany.call_args_list,
+            ([0, 1], [2, 3], [4]),
+        ):
+            self.assertEqual(call.args[0], "INSERT ROWS")
+            self.assertEqual(
+                call.args[1],
+                [self.transactions[index].query_parameters() for index in expected],
+            )
+            self.assertNotIn("returning", call.kwargs)
+        cursor.fetchone.assert_not_called()
+
+    @patch("expense_tracking.transactions.connection")
+    def test_stream_uses_the_insert_without_returning_by_default(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        connection = connect_mock.return_value.__enter__.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+
+        add_transaction_stream(self.transactions[:1], "expense_tracking_app")
+
+        query = cursor.executemany.call_args.args[0]
+        self.assertEqual(query, INSERT_ROWS_QUERY_PATH.read_text(encoding="utf-8"))
+        self.assertNotIn("RETURNING", query.upper())
+
+    @patch("expense_tracking.transactions.connection")
+    def test_empty_stream_does_not_connect(self, connect_mock: MagicMock) -> None:
+        self.assertEqual(
+            add_transaction_stream(iter(()), "expense_tracking_app"),
+            0,
+        )
+        connect_mock.assert_not_called()
+
+    @patch(
+        "expense_tracking.transactions.connection",
+        side_effect=psycopg.OperationalError("connection failed\nDETAIL: hidden"),
+    )
+    def test_stream_database_errors_are_wrapped_concisely(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        with self.assertRaisesRegex(DatabaseError, "^connection failed$"):
+            add_transaction_stream(
+                self.transactions,
+                "expense_tracking_app",
+                query="INSERT ROWS",
+            )
+        connect_mock.assert_called_once()
+
+
+def async_cursor(connect_mock: MagicMock) -> AsyncMock:
+    """Wire a patched ``async_connection`` to an awaitable cursor mock."""
+
+    connection = connect_mock.return_value.__aenter__.return_value
+    cursor = AsyncMock()
+    cursor.nextset = MagicMock()
+    connection.cursor = MagicMock()
+    connection.cursor.return_value.__aenter__.return_value = cursor
+    return cursor
+
+
+class AsyncInsertTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.transaction = Transaction(
+            occurred_on=date(2026, 7, 27),
+            transaction_type="expense",
+            amount=Decimal("18.75"),
+            description="Lunch",
+        )
+        self.row = {
+            "id": 453,
+            **self.transaction.query_parameters(),
+            "created_at": datetime(2026, 7, 27, 12, 0, tzinfo=timezone.utc),
+        }
+
+    @patch("expense_tracking.transactions.async_connection")
+    async def test_insert_returns_row(self, connect_mock: MagicMock) -> None:
+        cursor = async_cursor(connect_mock)
+        cursor.fetchone.return_value = self.row
+
+        result = await add_transaction_async(
+            self.transaction,
+            "expense_tracking_app",
+            query="INSERT QUERY",
+        )
+
+        self.assertEqual(result, InsertedTransaction.from_row(self.row))
+        connect_mock.assert_called_once_with("expense_tracking_app")
+        cursor.execute.assert_awaited_once_with(
+            "INSERT QUERY",
+            self.transaction.query_parameters(),
+        )
+
+    @patch("expense_tracking.transactions.async_connection")
+    async def test_validation_and_missing_rows_match_sync_service(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        cursor = async_cursor(connect_mock)
+        cursor.fetchone.return_value = None
+
+        with self.assertRaisesRegex(ValidationError, "must be a Transaction"):
+            await add_transaction_async({"amount": "1.00"}, query="INSERT QUERY")
+        with self.assertRaisesRegex(TransactionError, "did not return"):
+            await add_transaction_async(
+                self.transaction,
+                "expense_tracking_app",
+                query="INSERT QUERY",
+            )
+
+    @patch(
+        "expense_tracking.transactions.async_connection",
+        side_effect=psycopg.OperationalError("connection failed\nDETAIL: hidden"),
+    )
+    async def test_database_errors_are_wrapped_concisely(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        with self.assertRaisesRegex(DatabaseError, "^connection failed$"):
+            await add_transaction_async(
+                self.transaction,
+                "expense_tracking_app",
+                query="INSERT QUERY",
+            )
+
+    @patch("expense_tracking.transactions.async_connection")
+    async def test_bulk_insert_preserves_order(self, connect_mock: MagicMock) -> None:
+        cursor = async_cursor(connect_mock)
+        cursor.fetchone.side_effect = [
+            {**self.row, "id": 1},
+            {**self.row, "id": 2},
+            {**self.row, "id": 3},
+        ]
+
+        result = await add_transactions_async(
+            [self.transaction] * 3,
+            "expense_tracking_app",
+            batch_size=2,
+            query="INSERT QUERY",
+        )
+
+        self.assertEqual([item.id for item in result], [1, 2, 3])
+        self.assertEqual(cursor.executemany.await_count, 2)
+        connect_mock.assert_called_once_with("expense_tracking_app")
+
+
 class CommandTests(unittest.TestCase):
     def test_direct_script_invocation_remains_supported(self) -> None:
         result = subprocess.run(
@@ -297,7 +579,7 @@ class CommandTests(unittest.TestCase):
             "Dry run: 2026-07-27 | expense | $18.75 | Lunch\n",
         )
 
-    @patch("scripts.add_transaction.add_transaction")
+    @patch("expense_tracking.transactions.add_transaction")
     def test_dry_run_prints_without_connecting(
         self,
         connect_mock: MagicMock,
@@ -323,7 +605,7 @@ class CommandTests(unittest.TestCase):
         )
         connect_mock.assert_not_called()
 
-    @patch("scripts.add_transaction.add_transaction")
+    @patch("expense_tracking.transactions.add_transaction")
     def test_success_prints_inserted_transaction(
         self,
         insert_mock: MagicMock,
@@ -359,7 +641,7 @@ class CommandTests(unittest.TestCase):
         insert_mock.assert_called_once()
 
     @patch(
-        "scripts.add_transaction.add_transaction",
+        "expense_tracking.transactions.add_transaction",
         side_effect=QueryLoadError("missing query"),
     )
     def test_query_error_preserves_cli_message(self, insert_mock: MagicMock) -> None:
@@ -384,7 +666,7 @@ class CommandTests(unittest.TestCase):
         insert_mock.assert_called_once()
 
     @patch(
-        "scripts.add_transaction.add_transaction",
+        "expense_tracking.transactions.add_transaction",
         side_effect=DatabaseError("connection failed"),
     )
     def test_database_error_is_concise(
@@ -410,5 +692,173 @@ class CommandTests(unittest.TestCase):
         insert_mock.assert_called_once()
 
 
+class BatchCommandTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+
+    def write_input(self, name: str, content: str) -> str:
+        path = self.temp_path / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def run_main(self, argv: list[str]) -> tuple[int, str, str]:
+        output = io.StringIO()
+        errors = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(errors):
+            exit_code = main(argv)
+        return exit_code, output.getvalue(), errors.getvalue()
+
+    def test_single_and_batch_arguments_are_exclusive(self) -> None:
+        for argv in (
+            ["--description", "Lunch"],
+            ["--from-csv", "rows.csv", "--amount", "1.00"],
+            ["--from-csv", "rows.csv", "--from-ndjson", "rows.ndjson"],
+            ["--from-csv", "rows.csv", "--batch-size", "0"],
+        ):
+            with self.subTest(argv=argv):
+                with redirect_stderr(io.StringIO()):
+                    with self.assertRaises(SystemExit) as raised:
+                        parse_args(argv)
+                self.assertEqual(raised.exception.code, 2)
+
+        args = parse_args(["--from-ndjson", "-", "--batch-size", "100"])
+        self.assertEqual((args.input_format, args.input_path), ("ndjson", "-"))
+        self.assertEqual(args.batch_size, 100)
+
+    @patch("expense_tracking.transactions.add_transaction_stream")
+    def test_csv_dry_run_validates_every_row_without_connecting(
+        self,
+        insert_mock: MagicMock,
+    ) -> None:
+        path = self.write_input(
+            "rows.csv",
+            "date,type,amount,description\n"
+            "2026-07-01,income,2500.00,Paycheck\n"
+            ",,18.5, Lunch \n"
+            "07/02/2026,expense,4.00,Coffee\n"
+            "2026-07-03,expense,-1,Refund\n",
+        )
+
+        exit_code, output, errors = self.run_main(
+            ["--from-csv", path, "--dry-run", "--date", "2026-07-27"]
+        )
+
+        self.assertEqual(exit_code, 1)
+        self.assertRegex(
+            output,
+            r"^Dry run: accepted 2, rejected 2 in \d+\.\d\d s \([\d,]+ rows/s\)\n$",
+        )
+        self.assertEqual(
+            errors,
+            "Rejected line 4: date must use YYYY-MM-DD format\n"
+            "Rejected line 5: amount must be greater than zero\n",
+        )
+        insert_mock.assert_not_called()
+
+    @patch("expense_tracking.transactions.add_transaction_stream")
+    def test_ndjson_rows_stream_into_batched_insert(
+        self,
+        insert_mock: MagicMock,
+    ) -> None:
+        inserted: list[Transaction] = []
+        insert_mock.side_effect = (
+            lambda transactions, database, batch_size: inserted.extend(transactions)
+        )
+        path = self.write_input(
+            "rows.ndjson",
+            '{"date": "2026-07-01", "type": "income", "amount": 2500, '
+            '"description": "Paycheck"}\n'
+            "\n"
+            '{"amount": 0.1, "description": "Rounding check"}\n'
+            "not json\n"
+            '["2026-07-02", "expense", "1.00", "List"]\n'
+            '{"amount": true, "description": "Flag"}\n'
+            '{"amount": "3.00"}\n',
+        )
+
+        exit_code, output, errors = self.run_main(
+            [
+                "--from-ndjson",
+                path,
+                "--batch-size",
+                "2",
+                "--type",
+                "investment",
+                "--date",
+                "2026-07-27",
+                "--database",
+                "other_database",
+            ]
+        )
+
+        self.assertEqual(exit_code, 1)
+        self.assertTrue(output.startswith("Accepted 2, rejected 4 in "))
+        self.assertEqual(
+            errors.splitlines(),
+            [
+                "Rejected line 4: invalid JSON: Expecting value",
+                "Rejected line 5: each line must be a JSON object",
+                "Rejected line 6: amount must be text or a number",
+                "Rejected line 7: description is required",
+            ],
+        )
+        self.assertEqual(
+            inserted,
+            [
+                Transaction(date(2026, 7, 1), "income", Decimal("2500"), "Paycheck"),
+                Transaction(
+                    date(2026, 7, 27),
+                    "investment",
+                    Decimal("0.10"),
+                    "Rounding check",
+                ),
+            ],
+        )
+        self.assertEqual(insert_mock.call_args.args[1], "other_database")
+        self.assertEqual(insert_mock.call_args.kwargs, {"batch_size": 2})
+
+    @patch("expense_tracking.transactions.add_transaction_stream")
+    def test_input_and_database_errors_exit_with_status_one(
+        self,
+        insert_mock: MagicMock,
+    ) -> None:
+        missing_column = self.write_input("bad.csv", "date,amount\n2026-07-01,1.00\n")
+        exit_code, _, errors = self.run_main(["--from-csv", missing_column])
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(errors, "Input error: CSV header is missing: description\n")
+
+        exit_code, _, errors = self.run_main(
+            ["--from-csv", str(self.temp_path / "missing.csv")]
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertTrue(errors.startswith("Unable to read input: "))
+
+        def fail(transactions, database, batch_size):
+            list(transactions)
+            raise DatabaseError("connection failed")
+
+        insert_mock.side_effect = fail
+        valid = self.write_input("rows.csv", "amount,description\n1.00,Test\n")
+        exit_code, output, errors = self.run_main(["--from-csv", valid])
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(output, "")
+        self.assertEqual(errors, "Database error: connection failed\n")
+
+    def test_standard_input_is_read_by_the_script(self) -> None:
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT_PATH), "--from-csv", "-", "--dry-run"],
+            input="amount,description\n18.75,Lunch\n5.00,Coffee\n",
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertTrue(result.stdout.startswith("Dry run: accepted 2, rejected 0 in "))
+        self.assertEqual(result.stderr, "")
+
+
 if __name__ == "__main__":
     unittest.main()
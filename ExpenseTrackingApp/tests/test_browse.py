@@ -0,0 +1,138 @@
+"""Tests for keyset-paginated transaction browsing."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import psycopg
+
+from expense_tracking.browse import (
+    MAX_TRANSACTION_ID,
+    PageCursor,
+    TransactionFilter,
+    browse_transactions,
+)
+from expense_tracking.config import (
+    TRANSACTION_PAGE_BY_TYPE_QUERY_PATH,
+    TRANSACTION_PAGE_QUERY_PATH,
+)
+from expense_tracking.errors import DatabaseError, ValidationError
+from expense_tracking.models import MAX_AMOUNT
+
+
+def transaction_row(transaction_id: int, occurred_on: date) -> dict[str, object]:
+    return {
+        "id": transaction_id,
+        "occurred_on": occurred_on,
+        "transaction_type": "expense",
+        "amount": Decimal("12.50"),
+        "description": f"Row {transaction_id}",
+        "created_at": datetime(2026, 8, 1, tzinfo=timezone.utc),
+    }
+
+
+class TransactionFilterTests(unittest.TestCase):
+    def test_open_bounds_become_full_ranges(self) -> None:
+        self.assertEqual(
+            TransactionFilter().query_parameters(),
+            {
+                "start_date": date.min,
+                "end_date": date.max,
+                "min_amount": Decimal(0),
+                "max_amount": MAX_AMOUNT,
+            },
+        )
+        parameters = TransactionFilter(
+            transaction_type="income",
+            start_date=date(2026, 1, 1),
+            max_amount=Decimal("100"),
+        ).query_parameters()
+        self.assertEqual(parameters["transaction_type"], "income")
+        self.assertEqual(parameters["start_date"], date(2026, 1, 1))
+        self.assertEqual(parameters["max_amount"], Decimal("100"))
+
+    def test_invalid_filters_are_rejected(self) -> None:
+        invalid = [
+            {"transaction_type": "transfer"},
+            {"start_date": "2026-01-01"},
+            {"start_date": date(2026, 2, 1), "end_date": date(2026, 1, 1)},
+            {"min_amount": Decimal("-1")},
+            {"max_amount": Decimal("NaN")},
+            {"min_amount": 5},
+            {"min_amount": Decimal("10"), "max_amount": Decimal("5")},
+        ]
+        for kwargs in invalid:
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValidationError):
+                TransactionFilter(**kwargs)
+
+
+@patch("expense_tracking.browse.connection")
+class BrowseTransactionsTests(unittest.TestCase):
+    def cursor(self, connect_mock: MagicMock) -> MagicMock:
+        connection = connect_mock.return_value.__enter__.return_value
+        return connection.cursor.return_value.__enter__.return_value
+
+    def test_first_page_fetches_one_lookahead_row(self, connect_mock) -> None:
+        cursor = self.cursor(connect_mock)
+        cursor.fetchall.return_value = [
+            transaction_row(9, date(2026, 8, 3)),
+            transaction_row(7, date(2026, 8, 2)),
+            transaction_row(8, date(2026, 8, 1)),
+        ]
+
+        page = browse_transactions(page_size=2, database="expense_tracking_app")
+
+        connect_mock.assert_called_once_with("expense_tracking_app", read_only=True)
+        query, parameters = cursor.execute.call_args.args
+        self.assertEqual(query, TRANSACTION_PAGE_QUERY_PATH.read_text(encoding="utf-8"))
+        self.assertIn("(occurred_on, id) <", query)
+        self.assertNotIn("transaction_type =", query)
+        self.assertIn("ORDER BY\n    occurred_on DESC,\n    id DESC", query)
+        self.assertEqual(parameters["limit"], 3)
+        self.assertEqual(parameters["before_occurred_on"], date.max)
+        self.assertEqual(parameters["before_id"], MAX_TRANSACTION_ID)
+        self.assertEqual([row.id for row in page.transactions], [9, 7])
+        self.assertEqual(page.next_cursor, PageCursor(date(2026, 8, 2), 7))
+        self.assertTrue(page.has_more)
+
+    def test_later_page_starts_after_the_cursor(self, connect_mock) -> None:
+        cursor = self.cursor(connect_mock)
+        cursor.fetchall.return_value = [transaction_row(8, date(2026, 8, 1))]
+
+        page = browse_transactions(
+            TransactionFilter(transaction_type="expense"),
+            after=PageCursor(date(2026, 8, 2), 7),
+            page_size=2,
+            database="expense_tracking_app",
+        )
+
+        query, parameters = cursor.execute.call_args.args
+        self.assertEqual(
+            query,
+            TRANSACTION_PAGE_BY_TYPE_QUERY_PATH.read_text(encoding="utf-8"),
+        )
+        self.assertIn("WHERE transaction_type = %(transaction_type)s", query)
+        self.assertEqual(parameters["before_occurred_on"], date(2026, 8, 2))
+        self.assertEqual(parameters["before_id"], 7)
+        self.assertEqual(parameters["transaction_type"], "expense")
+        self.assertEqual([row.id for row in page.transactions], [8])
+        self.assertIsNone(page.next_cursor)
+        self.assertFalse(page.has_more)
+
+    def test_page_size_and_database_errors(self, connect_mock) -> None:
+        for page_size in (0, 501, True, "10"):
+            with self.subTest(page_size=page_size):
+                with self.assertRaises(ValidationError):
+                    browse_transactions(page_size=page_size, database="db")
+        connect_mock.assert_not_called()
+
+        connect_mock.side_effect = psycopg.OperationalError("no server\ndetails")
+        with self.assertRaisesRegex(DatabaseError, "^no server$"):
+            browse_transactions(database="db")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import pickle
 import unittest
-from datetime import date
+from dataclasses import replace
+from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
 from unittest.mock import patch
 
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
 from expense_tracking.reporting.cash_flow import (
+    ALLOWED_TRANSACTION_TYPES,
     CashFlowReport,
+    CashFlowSummary,
+    MonthlySummary,
     ReportTransaction,
+    apply_transaction_changes,
     build_cash_flow_report,
+    build_cash_flow_reports,
+    build_summary_report,
 )
 from expense_tracking.reporting.charts import (
     NEGATIVE_NET_COLOR,
@@ -20,6 +31,7 @@ from expense_tracking.reporting.charts import (
     create_cash_flow_waterfall,
     create_monthly_net_cash_flow_chart,
 )
+from expense_tracking.reports import ReportPeriod
 from expense_tracking.reporting.tables import (
     initialize_transaction_tables,
     show_transaction_table,
@@ -104,6 +116,129 @@ class CalculationTests(unittest.TestCase):
         self.assertEqual(report.subtotal_for("expense"), Decimal("125.00"))
         self.assertEqual(len(report.transactions_for("income")), 1)
 
+    def test_type_partitions_are_built_with_the_report(self) -> None:
+        report = build_cash_flow_report(
+            [
+                transaction(3, date(2026, 7, 3), "expense", "25.00"),
+                transaction(1, date(2026, 7, 1), "expense", "100.00"),
+                transaction(2, date(2026, 7, 2), "income", "40.00"),
+            ],
+            date(2026, 7, 1),
+            date(2026, 7, 31),
+        )
+
+        with patch(
+            "expense_tracking.reporting.cash_flow.partition_by_type",
+            side_effect=AssertionError("partitions were rebuilt"),
+        ):
+            expenses = report.transactions_for("expense")
+            replace(report, monthly=())
+        self.assertEqual([item.id for item in expenses], [1, 3])
+        self.assertIsInstance(expenses, tuple)
+        restored = pickle.loads(pickle.dumps(report))
+        self.assertEqual(restored, report)
+        self.assertEqual(restored.transactions_for("expense"), expenses)
+        self.assertIs(report.transactions_for("expense"), expenses)
+        self.assertEqual(report.transactions_for("investment"), ())
+        self.assertEqual(report.subtotal_for("investment"), Decimal("0.00"))
+        for transaction_type, field in (
+            ("income", "income"),
+            ("expense", "expenses"),
+            ("investment", "investments"),
+        ):
+            self.assertEqual(
+                report.subtotal_for(transaction_type),
+                getattr(report.summary, field),
+            )
+        for lookup in (report.transactions_for, report.subtotal_for):
+            with self.assertRaisesRegex(ValueError, "invalid transaction type"):
+                lookup("transfer")
+
+    def test_subtotals_always_match_the_partitioned_transactions(self) -> None:
+        rows = [
+            transaction(1, date(2026, 7, 1), "expense", "100.00"),
+            transaction(2, date(2026, 7, 2), "income", "40.00"),
+        ]
+        reports = [
+            build_cash_flow_report(rows, date(2026, 7, 1), date(2026, 7, 31)),
+            CashFlowReport(
+                summary=CashFlowSummary(
+                    start_date=date(2026, 7, 1),
+                    end_date=date(2026, 7, 31),
+                    income=Decimal("999.00"),
+                    expenses=Decimal("999.00"),
+                    investments=Decimal("999.00"),
+                ),
+                monthly=(),
+                transactions=tuple(rows),
+            ),
+            build_summary_report(
+                [MonthlySummary(month=date(2026, 7, 1), income=Decimal("40.00"))],
+                date(2026, 7, 1),
+                date(2026, 7, 31),
+            ),
+        ]
+        for report in reports:
+            for transaction_type in ALLOWED_TRANSACTION_TYPES:
+                with self.subTest(report=report.summary, type=transaction_type):
+                    self.assertEqual(
+                        report.subtotal_for(transaction_type),
+                        sum(
+                            (
+                                item.amount
+                                for item in report.transactions_for(transaction_type)
+                            ),
+                            Decimal("0.00"),
+                        ),
+                    )
+
+    def test_streamed_ordered_input_is_consumed_once(self) -> None:
+        ordered = [
+            transaction(1, date(2026, 1, 5), "income", "1000.00"),
+            transaction(2, date(2026, 1, 5), "expense", "20.00"),
+            transaction(3, date(2026, 2, 1), "investment", "300.00"),
+        ]
+        consumed: list[int] = []
+
+        def stream():
+            for item in ordered:
+                consumed.append(item.id)
+                yield item
+
+        streamed = build_cash_flow_report(stream(), date(2026, 1, 1), date(2026, 2, 28))
+        shuffled = build_cash_flow_report(
+            reversed(ordered),
+            date(2026, 1, 1),
+            date(2026, 2, 28),
+        )
+
+        self.assertEqual(consumed, [1, 2, 3])
+        self.assertEqual(streamed, shuffled)
+        self.assertEqual([item.id for item in streamed.transactions], [1, 2, 3])
+
+    def test_summary_report_matches_transaction_totals(self) -> None:
+        full = build_cash_flow_report(
+            [
+                transaction(1, date(2026, 1, 5), "income", "1000.00"),
+                transaction(2, date(2026, 1, 9), "expense", "20.00"),
+                transaction(3, date(2026, 3, 1), "investment", "300.00"),
+            ],
+            date(2026, 1, 1),
+            date(2026, 3, 31),
+        )
+
+        summary = build_summary_report(full.monthly, date(2026, 1, 1), date(2026, 3, 31))
+
+        self.assertEqual(summary.summary, full.summary)
+        self.assertEqual(summary.monthly, full.monthly)
+        self.assertEqual(summary.transactions, ())
+        with self.assertRaisesRegex(ValueError, "end date"):
+            build_summary_report(
+                [MonthlySummary(month=date(2026, 1, 1))],
+                date(2026, 2, 1),
+                date(2026, 1, 1),
+            )
+
     def test_invalid_period_and_transaction_values_are_rejected(self) -> None:
         with self.assertRaisesRegex(ValueError, "end date"):
             build_cash_flow_report([], date(2026, 2, 1), date(2026, 1, 1))
@@ -115,6 +250,234 @@ class CalculationTests(unittest.TestCase):
             transaction(1, date(2026, 1, 1), "expense", "1.00", "  ")
 
 
+class MultiPeriodTests(unittest.TestCase):
+    @settings(max_examples=60, deadline=None)
+    @given(details=st.lists(
+        st.tuples(
+            st.integers(min_value=-40, max_value=420).map(
+                lambda offset: date(2026, 1, 1) + timedelta(days=offset)
+            ),
+            st.sampled_from(ALLOWED_TRANSACTION_TYPES),
+            st.integers(min_value=1, max_value=500_000).map(
+                lambda cents: Decimal(cents).scaleb(-2)
+            ),
+        ),
+        max_size=40,
+    ))
+    def test_year_end_close_matches_individual_reports(self, details) -> None:
+        transactions = [
+            ReportTransaction(
+                id=id,
+                occurred_on=occurred_on,
+                transaction_type=transaction_type,
+                amount=amount,
+                description=f"Transaction {id}",
+            )
+            for id, (occurred_on, transaction_type, amount) in enumerate(details)
+        ]
+        periods = [
+            *(ReportPeriod.for_month(2026, month) for month in range(1, 13)),
+            *(
+                ReportPeriod.for_range(
+                    date(2026, month, 1),
+                    ReportPeriod.for_month(2026, month + 2).end_date,
+                )
+                for month in (1, 4, 7, 10)
+            ),
+            ReportPeriod.for_year(2026),
+            ReportPeriod.for_range(date(2026, 1, 15), date(2026, 1, 20)),
+            ReportPeriod.for_range(date(2025, 12, 20), date(2026, 2, 10)),
+        ]
+
+        reports = build_cash_flow_reports(reversed(transactions), periods)
+        expected = tuple(
+            build_cash_flow_report(transactions, period.start_date, period.end_date)
+            for period in periods
+        )
+
+        self.assertEqual(reports, expected)
+        self.assertEqual(
+            [report.partitions for report in reports],
+            [report.partitions for report in expected],
+        )
+
+    def test_periods_with_the_same_transactions_share_one_tuple(self) -> None:
+        transactions = [
+            transaction(1, date(2026, 3, 5), "income", "100.00"),
+            transaction(2, date(2026, 3, 9), "expense", "30.00"),
+        ]
+
+        march, first_half, year = build_cash_flow_reports(
+            transactions,
+            [
+                ReportPeriod.for_month(2026, 3),
+                ReportPeriod.for_range(date(2026, 3, 1), date(2026, 3, 15)),
+                ReportPeriod.for_year(2026),
+            ],
+        )
+
+        self.assertIs(march.transactions, first_half.transactions)
+        self.assertIs(march.transactions, year.transactions)
+        self.assertIs(march.partitions, year.partitions)
+        self.assertIs(march.transactions[0], transactions[0])
+        self.assertEqual(build_cash_flow_reports(transactions, []), ())
+
+
+INCREMENTAL_START = date(2026, 1, 10)
+INCREMENTAL_END = date(2026, 4, 20)
+
+transaction_details = st.tuples(
+    st.integers(min_value=-20, max_value=120).map(
+        lambda offset: INCREMENTAL_START + timedelta(days=offset)
+    ),
+    st.sampled_from(ALLOWED_TRANSACTION_TYPES),
+    st.integers(min_value=1, max_value=500_000).map(
+        lambda cents: Decimal(cents).scaleb(-2)
+    ),
+)
+
+
+def detailed_transaction(id: int, details: tuple[date, str, Decimal]) -> ReportTransaction:
+    occurred_on, transaction_type, amount = details
+    return ReportTransaction(
+        id=id,
+        occurred_on=occurred_on,
+        transaction_type=transaction_type,
+        amount=amount,
+        description=f"Transaction {id}",
+    )
+
+
+class IncrementalReportTests(unittest.TestCase):
+    def test_summaries_merge_and_adjust(self) -> None:
+        january = MonthlySummary(month=date(2026, 1, 1), income=Decimal("10.00"))
+        merged = january.merge(
+            MonthlySummary(month=date(2026, 1, 1), expenses=Decimal("4.00"))
+        )
+        self.assertEqual(merged.net_cash_flow, Decimal("6.00"))
+        self.assertEqual(
+            merged.adjusted("investment", Decimal("1.50")).investments,
+            Decimal("1.50"),
+        )
+        with self.assertRaisesRegex(ValueError, "same month"):
+            january.merge(MonthlySummary(month=date(2026, 2, 1)))
+
+        first = CashFlowSummary(
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 31),
+            income=Decimal("10.00"),
+            expenses=Decimal("1.00"),
+            investments=Decimal("0.00"),
+        )
+        second = CashFlowSummary(
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+            income=Decimal("5.00"),
+            expenses=Decimal("2.00"),
+            investments=Decimal("3.00"),
+        )
+        spanning = second.merge(first)
+        self.assertEqual(spanning.start_date, date(2026, 1, 1))
+        self.assertEqual(spanning.end_date, date(2026, 2, 28))
+        self.assertEqual(spanning.net_cash_flow, Decimal("9.00"))
+        with self.assertRaisesRegex(ValueError, "adjacent"):
+            first.merge(first)
+
+    def test_unknown_and_duplicate_transactions_are_rejected(self) -> None:
+        existing = transaction(1, date(2026, 2, 1), "expense", "5.00")
+        report = build_cash_flow_report([existing], INCREMENTAL_START, INCREMENTAL_END)
+
+        with self.assertRaisesRegex(ValueError, "not part of the report"):
+            apply_transaction_changes(
+                report,
+                deleted=[transaction(2, date(2026, 2, 1), "expense", "5.00")],
+            )
+        with self.assertRaisesRegex(ValueError, "already in the report"):
+            apply_transaction_changes(report, inserted=[existing])
+
+    def test_reused_ids_on_other_dates_are_rejected(self) -> None:
+        existing = transaction(1, date(2026, 2, 1), "expense", "5.00")
+        report = build_cash_flow_report([existing], INCREMENTAL_START, INCREMENTAL_END)
+        moved = transaction(1, date(2026, 3, 9), "expense", "5.00")
+
+        with self.assertRaisesRegex(ValueError, "transaction 1 is already"):
+            apply_transaction_changes(report, inserted=[moved])
+        with self.assertRaisesRegex(ValueError, "transaction 2 is already"):
+            apply_transaction_changes(
+                report,
+                inserted=[
+                    transaction(2, date(2026, 2, 3), "income", "9.00"),
+                    transaction(2, date(2026, 3, 4), "income", "9.00"),
+                ],
+            )
+
+        updated = apply_transaction_changes(report, updated=[(existing, moved)])
+        self.assertEqual(updated.transactions, (moved,))
+        self.assertEqual(updated.summary, report.summary)
+        self.assertEqual(updated.transaction_ids, frozenset({1}))
+
+    def test_duplicate_checks_use_the_report_id_index(self) -> None:
+        existing = transaction(1, date(2026, 2, 1), "expense", "5.00")
+        report = build_cash_flow_report([existing], INCREMENTAL_START, INCREMENTAL_END)
+        indexed = replace(report, transaction_ids=frozenset({1, 7}))
+
+        with self.assertRaisesRegex(ValueError, "transaction 7 is already"):
+            apply_transaction_changes(
+                indexed,
+                inserted=[transaction(7, date(2026, 3, 1), "income", "1.00")],
+            )
+
+    @settings(max_examples=150, deadline=None)
+    @given(
+        initial=st.lists(transaction_details, max_size=25),
+        inserted=st.lists(transaction_details, max_size=10),
+        data=st.data(),
+    )
+    def test_changes_match_a_full_rebuild(self, initial, inserted, data) -> None:
+        current = {
+            id: detailed_transaction(id, details)
+            for id, details in enumerate(initial, start=1)
+        }
+        report = build_cash_flow_report(
+            current.values(),
+            INCREMENTAL_START,
+            INCREMENTAL_END,
+        )
+
+        changed_ids = data.draw(
+            st.lists(st.sampled_from(sorted(current)), unique=True)
+            if current
+            else st.just([])
+        )
+        split = data.draw(st.integers(min_value=0, max_value=len(changed_ids)))
+        deleted = [current.pop(id) for id in changed_ids[:split]]
+        updated = []
+        for id in changed_ids[split:]:
+            replacement = detailed_transaction(id, data.draw(transaction_details))
+            updated.append((current[id], replacement))
+            current[id] = replacement
+        added = [
+            detailed_transaction(id, details)
+            for id, details in enumerate(inserted, start=len(initial) + 1)
+        ]
+        current.update((item.id, item) for item in added)
+
+        changed = apply_transaction_changes(
+            report,
+            inserted=added,
+            updated=updated,
+            deleted=deleted,
+        )
+        rebuilt = build_cash_flow_report(
+            current.values(),
+            INCREMENTAL_START,
+            INCREMENTAL_END,
+        )
+        self.assertEqual(changed, rebuilt)
+        self.assertEqual(changed.partitions, rebuilt.partitions)
+        self.assertEqual(changed.transaction_ids, rebuilt.transaction_ids)
+
+
 class ChartTests(unittest.TestCase):
     def setUp(self) -> None:
         self.report = build_cash_flow_report(
@@ -247,7 +610,7 @@ class ReportSourceTests(unittest.TestCase):
         self.assertEqual(source.count("initialize_transaction_tables()"), 1)
         self.assertLess(
             source.index("initialize_transaction_tables()"),
-            source.index('show_transaction_table(report, "income")'),
+            source.index('show_transactions("income")'),
         )
 
 
@@ -0,0 +1,97 @@
+"""Tests for the columnar NumPy cash-flow engine."""
+
+from __future__ import annotations
+
+import random
+import unittest
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+
+from expense_tracking.reporting.cash_flow import (
+    ALLOWED_TRANSACTION_TYPES,
+    ReportTransaction,
+    build_cash_flow_report,
+)
+from expense_tracking.reporting.columnar import (
+    TransactionColumns,
+    build_cash_flow_report_columnar,
+)
+
+
+def random_transactions(count: int, seed: int) -> list[ReportTransaction]:
+    generator = random.Random(seed)
+    start = date(2024, 11, 1)
+    return [
+        ReportTransaction(
+            id=index,
+            occurred_on=start + timedelta(days=generator.randrange(600)),
+            transaction_type=generator.choice(ALLOWED_TRANSACTION_TYPES),
+            amount=Decimal(generator.randrange(1, 1_000_000)).scaleb(-2),
+            description=f"Transaction {index}",
+        )
+        for index in generator.sample(range(1, count * 3), count)
+    ]
+
+
+class ColumnarEngineTests(unittest.TestCase):
+    def test_reports_match_object_engine_exactly(self) -> None:
+        periods = [
+            (date(2025, 1, 1), date(2025, 12, 31)),
+            (date(2025, 2, 14), date(2025, 2, 14)),
+            (date(2024, 12, 15), date(2026, 1, 20)),
+            (date(2020, 1, 1), date(2020, 3, 31)),
+        ]
+        for seed in range(3):
+            transactions = random_transactions(400, seed)
+            columns = TransactionColumns.from_transactions(transactions)
+            for start, end in periods:
+                with self.subTest(seed=seed, start=start, end=end):
+                    columnar = build_cash_flow_report_columnar(columns, start, end)
+                    expected = build_cash_flow_report(transactions, start, end)
+                    self.assertEqual(columnar, expected)
+                    self.assertEqual(columnar.partitions, expected.partitions)
+                    self.assertEqual(
+                        columnar.transaction_ids,
+                        expected.transaction_ids,
+                    )
+
+    def test_empty_columns_are_zero_filled(self) -> None:
+        columns = TransactionColumns.from_transactions([])
+
+        report = build_cash_flow_report_columnar(
+            columns,
+            date(2025, 12, 15),
+            date(2026, 2, 2),
+        )
+
+        self.assertEqual(
+            report,
+            build_cash_flow_report([], date(2025, 12, 15), date(2026, 2, 2)),
+        )
+
+    def test_invalid_inputs_are_rejected(self) -> None:
+        columns = TransactionColumns.from_transactions(random_transactions(3, 0))
+        with self.assertRaisesRegex(ValueError, "end date"):
+            build_cash_flow_report_columnar(columns, date(2026, 2, 1), date(2026, 1, 1))
+        with self.assertRaisesRegex(ValueError, "aligned"):
+            TransactionColumns(
+                ids=columns.ids,
+                occurred_on=columns.occurred_on[:2],
+                type_codes=columns.type_codes,
+                amount_cents=columns.amount_cents,
+                transactions=columns.transactions,
+            )
+        with self.assertRaisesRegex(ValueError, "type codes"):
+            TransactionColumns(
+                ids=columns.ids,
+                occurred_on=columns.occurred_on,
+                type_codes=np.array([0, 1, 7]),
+                amount_cents=columns.amount_cents,
+                transactions=columns.transactions,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,21 +4,32 @@ from __future__ import annotations
 
 import argparse
 import io
+import os
 import subprocess
+import time
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from datetime import date
+from decimal import Decimal
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
 from expense_tracking.config import PROJECT_ROOT
 from expense_tracking.errors import ReportGenerationError, ValidationError
+from expense_tracking.report_cache import ReportCache
+from expense_tracking.reporting.cash_flow import ReportTransaction
+from expense_tracking.reporting.data import read_report_data
+from expense_tracking.timing import Span, record_timings, span
 from expense_tracking.reports import (
+    ReportJobResult,
     ReportPeriod,
     build_quarto_command,
     build_render_environment,
     generate_report,
+    generate_reports,
+    overlapping_groups,
+    prune_report_outputs,
 )
 from scripts.generate_report import (
     main,
@@ -130,6 +141,15 @@ class RenderingTests(unittest.TestCase):
             "expense_tracking_app",
         )
         self.assertEqual(environment["EXPENSE_REPORT_PERIOD_LABEL"], "July 2026")
+        self.assertEqual(environment["EXPENSE_REPORT_SUMMARY_ONLY"], "0")
+        self.assertEqual(
+            build_render_environment(
+                period=self.period,
+                database="expense_tracking_app",
+                summary_only=True,
+            )["EXPENSE_REPORT_SUMMARY_ONLY"],
+            "1",
+        )
         self.assertIn(str(PROJECT_ROOT), environment["PYTHONPATH"])
 
     @patch("expense_tracking.reports.subprocess.run")
@@ -169,6 +189,99 @@ class RenderingTests(unittest.TestCase):
                 "expense_tracking_app",
             )
 
+    @patch("expense_tracking.reports.subprocess.run")
+    def test_quarto_kernel_timings_are_nested_under_the_render(
+        self,
+        run_mock,
+    ) -> None:
+        timing_files = []
+
+        def create_rendered(command, **kwargs):
+            timings_file = Path(kwargs["env"]["EXPENSE_REPORT_TIMINGS_FILE"])
+            timing_files.append(timings_file)
+            timings_file.write_text(
+                Span("charts.waterfall", 0.25).to_json() + "\n",
+                encoding="utf-8",
+            )
+            filename = command[command.index("--output") + 1]
+            generated = PROJECT_ROOT / "reports" / "output" / filename
+            generated.parent.mkdir(parents=True, exist_ok=True)
+            generated.write_text("new", encoding="utf-8")
+
+        run_mock.side_effect = create_rendered
+        with TemporaryDirectory() as temp_dir, record_timings() as spans:
+            generate_report(
+                period=self.period,
+                database="expense_tracking_app",
+                output_path=Path(temp_dir) / "report.html",
+                quarto="/usr/local/bin/quarto",
+            )
+
+        by_name = {recorded.name: recorded for recorded in spans}
+        self.assertEqual(
+            by_name["charts.waterfall"],
+            Span("charts.waterfall", 0.25, parent="report.quarto", depth=2),
+        )
+        self.assertEqual(by_name["report.quarto"].parent, "report.generate")
+        self.assertEqual(spans[-1].name, "report.generate")
+        self.assertFalse(timing_files[0].exists())
+
+    @patch("expense_tracking.reports.subprocess.run")
+    def test_warm_kernel_executes_and_quarto_renders_the_notebook(
+        self,
+        run_mock,
+    ) -> None:
+        executed = []
+
+        class FakeKernel:
+            def execute(self, *, environment, output_path):
+                executed.append((environment, output_path))
+                output_path.write_text("{}", encoding="utf-8")
+
+        def create_rendered(command, **kwargs):
+            filename = command[command.index("--output") + 1]
+            generated = PROJECT_ROOT / "reports" / "output" / filename
+            generated.parent.mkdir(parents=True, exist_ok=True)
+            generated.write_text("new", encoding="utf-8")
+
+        run_mock.side_effect = create_rendered
+        with TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "report.html"
+            generate_report(
+                period=self.period,
+                database="expense_tracking_app",
+                output_path=output,
+                quarto="/usr/local/bin/quarto",
+                kernel=FakeKernel(),
+            )
+            self.assertEqual(output.read_text(encoding="utf-8"), "new")
+
+        environment, notebook = executed[0]
+        command = run_mock.call_args.args[0]
+        self.assertEqual(environment["EXPENSE_REPORT_START_DATE"], "2026-07-01")
+        self.assertEqual(command[2], str(notebook))
+        self.assertIn("--no-execute", command)
+        self.assertNotIn("--execute", command)
+        self.assertFalse(notebook.exists())
+        with self.assertRaisesRegex(ValidationError, "quarto backend"):
+            generate_report(period=self.period, backend="python", kernel=FakeKernel())
+
+    @patch("expense_tracking.reports.subprocess.run")
+    def test_quarto_gets_no_timings_file_unless_recording(self, run_mock) -> None:
+        run_mock.side_effect = subprocess.CalledProcessError(1, ["quarto"])
+
+        with self.assertRaises(ReportGenerationError):
+            generate_report(
+                period=self.period,
+                database="expense_tracking_app",
+                quarto="/usr/local/bin/quarto",
+            )
+
+        self.assertNotIn(
+            "EXPENSE_REPORT_TIMINGS_FILE",
+            run_mock.call_args.kwargs["env"],
+        )
+
     @patch("expense_tracking.reports.subprocess.run")
     @patch("expense_tracking.reports.uuid.uuid4")
     def test_failed_render_preserves_existing_output(
@@ -220,6 +333,66 @@ class RenderingTests(unittest.TestCase):
         self.assertEqual(exit_code, 0)
         self.assertIn("Created cash-flow report:", stdout.getvalue())
         generate_mock.assert_called_once()
+        self.assertFalse(generate_mock.call_args.kwargs["summary_only"])
+        self.assertIsInstance(generate_mock.call_args.kwargs["cache"], ReportCache)
+        self.assertFalse(generate_mock.call_args.kwargs["force"])
+
+    @patch("scripts.generate_report.generate_report")
+    def test_main_profile_prints_phase_breakdown(self, generate_mock) -> None:
+        def render(**kwargs):
+            with span("report.generate"):
+                with span("report.quarto"):
+                    pass
+            return Path("report.html")
+
+        generate_mock.side_effect = render
+        with TemporaryDirectory() as temp_dir:
+            timings_file = Path(temp_dir) / "timings.jsonl"
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                exit_code = main(
+                    [
+                        "--year",
+                        "2026",
+                        "--profile",
+                        "--profile-json",
+                        str(timings_file),
+                    ]
+                )
+            lines = timings_file.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(exit_code, 0)
+        output = stdout.getvalue()
+        self.assertIn("Phase", output)
+        self.assertIn("report.generate", output)
+        self.assertIn("  report.quarto", output)
+        self.assertEqual(len(lines), 2)
+        self.assertIn('"parent": "report.generate"', lines[0])
+
+    @patch("scripts.generate_report.generate_report")
+    def test_main_passes_force_to_bypass_the_cache(self, generate_mock) -> None:
+        with redirect_stdout(io.StringIO()):
+            exit_code = main(["--year", "2026", "--force"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(generate_mock.call_args.kwargs["force"])
+        self.assertEqual(generate_mock.call_args.kwargs["backend"], "quarto")
+
+    @patch("scripts.generate_report.generate_report")
+    def test_main_passes_the_selected_backend(self, generate_mock) -> None:
+        with redirect_stdout(io.StringIO()):
+            exit_code = main(["--year", "2026", "--backend", "python"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(generate_mock.call_args.kwargs["backend"], "python")
+
+    @patch("scripts.generate_report.generate_report")
+    def test_main_passes_summary_only_mode(self, generate_mock) -> None:
+        with redirect_stdout(io.StringIO()):
+            exit_code = main(["--year", "2026", "--summary-only"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(generate_mock.call_args.kwargs["summary_only"])
 
     @patch(
         "scripts.generate_report.generate_report",
@@ -246,5 +419,201 @@ class RenderingTests(unittest.TestCase):
         which_mock.assert_called_once_with("quarto")
 
 
+class OutputCleanupTests(unittest.TestCase):
+    def test_expired_and_least_recent_reports_are_removed(self) -> None:
+        now = time.time()
+        with TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            ages = {"expired": 10_000, "oldest": 300, "older": 200, "newest": 100}
+            for name, age in ages.items():
+                path = directory / f"{name}.html"
+                path.write_bytes(b"x" * 10)
+                os.utime(path, (now - age, now - age))
+            (directory / "expired.html.gz").write_bytes(b"gz")
+            (directory / "assets").mkdir()
+            kept = directory / "oldest.html"
+
+            removed = prune_report_outputs(
+                directory,
+                max_age=1_000,
+                max_bytes=20,
+                keep=kept,
+            )
+
+            self.assertEqual(
+                [path.name for path in removed],
+                ["expired.html", "older.html"],
+            )
+            self.assertEqual(
+                sorted(path.name for path in directory.iterdir()),
+                ["assets", "newest.html", "oldest.html"],
+            )
+
+    def test_staging_files_and_reports_of_running_jobs_are_not_size_pruned(
+        self,
+    ) -> None:
+        now = time.time()
+        with TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir)
+            ages = {
+                "cash-flow-render-inflight": 500,
+                "expired-render": 10_000,
+                "before-job": 400,
+                "other-session": 100,
+                "newest": 50,
+            }
+            for name, age in ages.items():
+                path = directory / f"{name}.html"
+                path.write_bytes(b"x" * 10)
+                os.utime(path, (now - age, now - age))
+
+            removed = prune_report_outputs(
+                directory,
+                max_age=1_000,
+                max_bytes=0,
+                running_since=now - 200,
+            )
+
+            self.assertEqual(
+                [path.name for path in removed],
+                ["expired-render.html", "before-job.html"],
+            )
+            self.assertEqual(
+                sorted(path.name for path in directory.iterdir()),
+                [
+                    "cash-flow-render-inflight.html",
+                    "newest.html",
+                    "other-session.html",
+                ],
+            )
+
+
+class BatchGenerationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.output_dir = Path(temp_dir.name)
+        self.transactions = tuple(
+            ReportTransaction(
+                id=day,
+                occurred_on=date(2026, 1, day),
+                transaction_type="income",
+                amount=Decimal("10.00"),
+                description=f"Transaction {day}",
+            )
+            for day in range(1, 29)
+        )
+
+    def test_overlapping_and_adjacent_periods_are_grouped(self) -> None:
+        january = ReportPeriod.for_month(2026, 1)
+        february = ReportPeriod.for_month(2026, 2)
+        quarter = ReportPeriod.for_range(date(2026, 1, 15), date(2026, 3, 31))
+        june = ReportPeriod.for_month(2026, 6)
+
+        self.assertEqual(
+            overlapping_groups([june, quarter, february, january]),
+            [[january, quarter, february], [june]],
+        )
+
+    @patch("expense_tracking.reports.subprocess.run")
+    @patch("expense_tracking.reports.load_transactions")
+    def test_jobs_render_in_isolated_workspaces_from_shared_fetches(
+        self,
+        load_mock,
+        run_mock,
+    ) -> None:
+        load_mock.return_value = self.transactions
+        january = ReportPeriod.for_month(2026, 1)
+        first_half = ReportPeriod.for_range(date(2026, 1, 1), date(2026, 1, 15))
+        june = ReportPeriod.for_month(2026, 6)
+        workspaces = []
+
+        def render(command, *, cwd, env, check):
+            workspaces.append(cwd)
+            self.assertTrue((cwd / "cash_flow.qmd").is_file())
+            self.assertEqual(command[2], str(cwd / "cash_flow.qmd"))
+            if env["EXPENSE_REPORT_PERIOD_LABEL"] == june.label:
+                raise subprocess.CalledProcessError(returncode=1, cmd=command)
+            report = read_report_data(Path(env["EXPENSE_REPORT_DATA_FILE"]))
+            output = cwd / "output" / command[command.index("--output") + 1]
+            output.write_text(str(report.summary.income), encoding="utf-8")
+
+        run_mock.side_effect = render
+        results = generate_reports(
+            [january, first_half, june, january],
+            database="expense_tracking_app",
+            output_dir=self.output_dir,
+            quarto="/usr/local/bin/quarto",
+            max_workers=3,
+        )
+
+        self.assertEqual(load_mock.call_count, 2)
+        self.assertEqual(len(set(workspaces)), 3)
+        self.assertEqual([result.ok for result in results], [True, True, False, True])
+        self.assertIs(results[0], results[3])
+        self.assertEqual(
+            (self.output_dir / january.default_filename).read_text(encoding="utf-8"),
+            "280.00",
+        )
+        self.assertEqual(results[1].output_path.read_text(encoding="utf-8"), "150.00")
+        self.assertIn("Quarto exited with status 1", results[2].error)
+        self.assertEqual(
+            sorted(path.name for path in self.output_dir.iterdir()),
+            sorted([january.default_filename, first_half.default_filename]),
+        )
+
+    @patch("expense_tracking.reports.load_transactions")
+    def test_invalid_batch_settings_are_rejected_before_fetching(self, load_mock) -> None:
+        periods = [ReportPeriod.for_month(2026, 1)]
+        for kwargs in ({"max_workers": 0}, {"backend": "latex"}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValidationError):
+                    generate_reports(periods, output_dir=self.output_dir, **kwargs)
+        load_mock.assert_not_called()
+
+    @patch("scripts.generate_report.generate_reports")
+    def test_main_runs_batches_and_reports_failures(self, generate_mock) -> None:
+        january = ReportPeriod.for_month(2026, 1)
+        generate_mock.return_value = (
+            ReportJobResult(january, Path("/tmp/january.html"), 1.5),
+            ReportJobResult(ReportPeriod.for_year(2026), None, 0.5, "Quarto failed."),
+        )
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            exit_code = main(
+                [
+                    "--batch",
+                    "2026-01",
+                    "2026",
+                    "2026-01-01:2026-01-15",
+                    "--workers",
+                    "2",
+                ]
+            )
+
+        self.assertEqual(exit_code, 1)
+        periods = generate_mock.call_args.args[0]
+        self.assertEqual(periods[0], january)
+        self.assertEqual(periods[1], ReportPeriod.for_year(2026))
+        self.assertEqual(periods[2].end_date, date(2026, 1, 15))
+        self.assertEqual(generate_mock.call_args.kwargs["max_workers"], 2)
+        self.assertIn("Quarto failed.", stdout.getvalue())
+        self.assertIn("1 of 2 reports failed", stderr.getvalue())
+
+    def test_batch_argument_combinations(self) -> None:
+        invalid = [
+            ["--batch", "2026-13"],
+            ["--batch", "2026-02-01:2026-01-01"],
+            ["--batch", "2026", "--output", "report.html"],
+            ["--year", "2026", "--output-dir", "reports"],
+            ["--batch", "2026", "--workers", "0"],
+        ]
+        for argv in invalid:
+            with self.subTest(argv=argv):
+                with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                    parse_args(argv)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,25 +2,33 @@
 
 from __future__ import annotations
 
+import threading
 import unittest
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import patch
+from unittest.mock import call, patch
 
+import psycopg
 from streamlit.testing.v1 import AppTest
 
+from expense_tracking.browse import PageCursor, TransactionPage
 from expense_tracking.errors import (
     DatabaseError,
     ReportGenerationError,
     ValidationError,
 )
+from expense_tracking.jobs import get_report_queue
+from expense_tracking.reporting.cash_flow import CashFlowReport, CashFlowSummary
 from expense_tracking.transactions import InsertedTransaction
 from expense_tracking.ui.reports import (
     build_gui_report_period,
     load_report_download,
+    report_download_data,
 )
+from expense_tracking.ui.bulk_entry import validate_bulk_rows
+from expense_tracking.ui.data import cached_cash_flow_report, period_report
 from expense_tracking.ui.transactions import parse_gui_amount
 
 
@@ -29,12 +37,31 @@ from expense_tracking.ui.transactions import render_add_transaction_page
 render_add_transaction_page()
 """
 
+BULK_ENTRY_APP = """
+from expense_tracking.ui.bulk_entry import render_bulk_entry_page
+render_bulk_entry_page()
+"""
+
+BROWSER_APP = """
+from expense_tracking.ui.browser import render_transaction_browser_page
+render_transaction_browser_page()
+"""
+
 REPORT_APP = """
 from expense_tracking.ui.reports import render_report_page
 render_report_page()
 """
 
 
+MONTH_SUMMARY = CashFlowSummary(
+    start_date=date(2026, 8, 1),
+    end_date=date(2026, 8, 15),
+    income=Decimal("2500.00"),
+    expenses=Decimal("400.25"),
+    investments=Decimal("300.00"),
+)
+
+
 class LauncherTests(unittest.TestCase):
     def test_launcher_renders_default_page(self) -> None:
         launcher = Path(__file__).resolve().parent.parent / "streamlit_app.py"
@@ -78,15 +105,36 @@ class GuiHelperTests(unittest.TestCase):
                 end_date=date(2026, 3, 1),
             )
 
-    def test_report_download_uses_generated_name_and_bytes(self) -> None:
+    def test_report_download_keeps_a_reference_and_reads_on_demand(self) -> None:
         with TemporaryDirectory() as temp_dir:
             output = Path(temp_dir) / "cash-flow-2026.html"
             output.write_bytes(b"<html>report</html>")
 
             download = load_report_download(output)
+            read_report = report_download_data(download)
+            output.write_bytes(b"<html>regenerated</html>")
+
+            self.assertEqual(read_report(), b"<html>regenerated</html>")
+            self.assertEqual(download["filename"], "cash-flow-2026.html")
+            self.assertEqual(download["path"], str(output.resolve()))
+            self.assertNotIn("data", download)
+            with self.assertRaises(FileNotFoundError):
+                load_report_download(Path(temp_dir) / "missing.html")
+
+    def test_report_download_of_a_removed_file_explains_instead_of_raising(
+        self,
+    ) -> None:
+        with TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "cash-flow-2026.html"
+            output.write_bytes(b"<html>report</html>")
+            read_report = report_download_data(load_report_download(output))
 
-        self.assertEqual(download["filename"], "cash-flow-2026.html")
-        self.assertEqual(download["data"], b"<html>report</html>")
+            output.unlink()
+
+            self.assertIn(
+                b"cash-flow-2026.html is no longer available",
+                read_report(),
+            )
 
 
 class TransactionPageTests(unittest.TestCase):
@@ -154,7 +202,319 @@ class TransactionPageTests(unittest.TestCase):
         self.assertEqual(len(app.exception), 0)
 
 
+class BulkEntryTests(unittest.TestCase):
+    ROWS = [
+        {
+            "Date": date(2026, 8, 1),
+            "Type": "expense",
+            "Amount": "12.50",
+            "Description": "Lunch",
+        },
+        {
+            "Date": date(2026, 8, 2),
+            "Type": "income",
+            "Amount": "abc",
+            "Description": "Paycheck",
+        },
+        {"Date": date(2026, 8, 3), "Type": "expense", "Amount": None, "Description": ""},
+        {
+            "Date": date(2026, 8, 4),
+            "Type": "investment",
+            "Amount": "300",
+            "Description": "  Index fund ",
+        },
+    ]
+
+    def bulk_app(self) -> AppTest:
+        app = AppTest.from_string(BULK_ENTRY_APP)
+        app.session_state["bulk_entry_rows"] = self.ROWS
+        return app.run()
+
+    def test_rows_are_validated_individually_and_blank_rows_skipped(self) -> None:
+        results = validate_bulk_rows(
+            [
+                *self.ROWS,
+                {"Date": None, "Type": "expense", "Amount": "5", "Description": "x"},
+                {"Date": "2026-08-05", "Type": "expense", "Amount": "5", "Description": "x"},
+                {"Date": date(2026, 8, 5), "Type": None, "Amount": "5", "Description": "x"},
+            ]
+        )
+
+        self.assertEqual(
+            [row.error for row in results],
+            [
+                None,
+                "amount must be a valid decimal number",
+                None,
+                "date is required",
+                None,
+                "transaction type must be one of: expense, income, investment",
+            ],
+        )
+        self.assertEqual(results[4].transaction.occurred_on, date(2026, 8, 5))
+        self.assertEqual(results[0].transaction.amount, Decimal("12.50"))
+        self.assertEqual(results[2].transaction.occurred_on, date(2026, 8, 4))
+        self.assertEqual(results[2].transaction.description, "Index fund")
+
+    def test_valid_rows_are_added_in_one_batch_and_errors_stay(self) -> None:
+        with patch(
+            "expense_tracking.ui.bulk_entry.add_transactions",
+            side_effect=lambda transactions: tuple(transactions),
+        ) as add_mock:
+            app = self.bulk_app()
+            app.button[0].click().run()
+
+        add_mock.assert_called_once()
+        self.assertEqual(
+            [transaction.description for transaction in add_mock.call_args.args[0]],
+            ["Lunch", "Index fund"],
+        )
+        self.assertIn("Added 2 transactions.", app.success[0].value)
+        self.assertIn("1 row could not be added", app.error[0].value)
+        remaining = app.session_state["bulk_entry_rows"]
+        self.assertEqual(len(remaining), 1)
+        self.assertEqual(remaining[0]["Description"], "Paycheck")
+        self.assertEqual(remaining[0]["Error"], "amount must be a valid decimal number")
+        self.assertEqual(len(app.exception), 0)
+
+    def test_database_error_adds_nothing_and_keeps_rows(self) -> None:
+        with patch(
+            "expense_tracking.ui.bulk_entry.add_transactions",
+            side_effect=DatabaseError("connection failed"),
+        ):
+            app = self.bulk_app()
+            app.button[0].click().run()
+
+        self.assertIn("Nothing was added: connection failed", app.error[0].value)
+        self.assertEqual(len(app.success), 0)
+        self.assertEqual(app.session_state["bulk_entry_rows"], self.ROWS)
+        self.assertEqual(len(app.exception), 0)
+
+    def test_empty_grid_submits_nothing(self) -> None:
+        with patch("expense_tracking.ui.bulk_entry.add_transactions") as add_mock:
+            app = AppTest.from_string(BULK_ENTRY_APP).run()
+            app.button[0].click().run()
+
+        self.assertIn("Enter at least one transaction", app.warning[0].value)
+        add_mock.assert_not_called()
+        self.assertEqual(len(app.exception), 0)
+
+
+class TransactionBrowserTests(unittest.TestCase):
+    def stored(self, transaction_id: int) -> InsertedTransaction:
+        return InsertedTransaction(
+            id=transaction_id,
+            occurred_on=date(2026, 8, transaction_id),
+            transaction_type="expense",
+            amount=Decimal("1234.50"),
+            description=f"Receipt {transaction_id}",
+            created_at=datetime(2026, 8, 1, tzinfo=timezone.utc),
+        )
+
+    def test_pages_move_by_keyset_cursor(self) -> None:
+        cursor = PageCursor(date(2026, 8, 2), 2)
+        pages = {
+            None: TransactionPage((self.stored(3), self.stored(2)), cursor),
+            cursor: TransactionPage((self.stored(1),), None),
+        }
+        with patch(
+            "expense_tracking.ui.browser.browse_transactions",
+            side_effect=lambda filters, *, after, page_size: pages[after],
+        ) as browse_mock:
+            app = AppTest.from_string(BROWSER_APP).run()
+            first_page = app.dataframe[0].value
+            newer, older = app.button[1], app.button[2]
+            self.assertTrue(newer.disabled)
+            self.assertFalse(older.disabled)
+
+            older.click().run()
+            second_page = app.dataframe[0].value
+            self.assertTrue(app.button[2].disabled)
+            app.button[1].click().run()
+
+        self.assertEqual(list(first_page["ID"]), [3, 2])
+        self.assertEqual(first_page["Amount"][0], "$1,234.50")
+        self.assertEqual(list(second_page["ID"]), [1])
+        self.assertEqual(
+            [call.kwargs["after"] for call in browse_mock.call_args_list],
+            [None, cursor, None],
+        )
+        self.assertEqual(browse_mock.call_args.kwargs["page_size"], 50)
+        self.assertEqual(list(app.dataframe[0].value["ID"]), [3, 2])
+        self.assertEqual(len(app.exception), 0)
+
+    def test_invalid_filters_do_not_query(self) -> None:
+        with patch("expense_tracking.ui.browser.browse_transactions") as browse_mock:
+            app = AppTest.from_string(BROWSER_APP).run()
+            app.text_input[0].input("ten")
+            app.button[0].click().run()
+
+        self.assertIn("minimum amount must be a valid decimal", app.error[0].value)
+        self.assertEqual(browse_mock.call_count, 1)
+        self.assertEqual(len(app.exception), 0)
+
+    def test_empty_result_and_database_error(self) -> None:
+        with patch(
+            "expense_tracking.ui.browser.browse_transactions",
+            return_value=TransactionPage((), None),
+        ):
+            app = AppTest.from_string(BROWSER_APP).run()
+        self.assertIn("No transactions match", app.info[0].value)
+
+        with patch(
+            "expense_tracking.ui.browser.browse_transactions",
+            side_effect=DatabaseError("connection failed"),
+        ):
+            app = AppTest.from_string(BROWSER_APP).run()
+        self.assertIn("connection failed", app.error[0].value)
+        self.assertEqual(len(app.exception), 0)
+
+
+@patch("expense_tracking.ui.data.load_data_version")
+@patch("expense_tracking.ui.data.load_cash_flow_report")
+class CachedDataTests(unittest.TestCase):
+    def setUp(self) -> None:
+        cached_cash_flow_report.clear()
+        self.addCleanup(cached_cash_flow_report.clear)
+
+    def report(self) -> CashFlowReport:
+        return CashFlowReport(summary=MONTH_SUMMARY, monthly=(), transactions=())
+
+    def test_reruns_reuse_data_until_the_version_changes(
+        self,
+        load_mock,
+        version_mock,
+    ) -> None:
+        load_mock.side_effect = lambda **_: self.report()
+        version_mock.return_value = 7
+
+        first = period_report(date(2026, 8, 1), date(2026, 8, 15), database="db")
+        second = period_report(date(2026, 8, 1), date(2026, 8, 15), database="db")
+        self.assertEqual(load_mock.call_count, 1)
+        self.assertEqual(first, second)
+
+        period_report(
+            date(2026, 8, 1),
+            date(2026, 8, 15),
+            database="db",
+            summary_only=True,
+        )
+        self.assertEqual(load_mock.call_count, 2)
+
+        version_mock.return_value = 8
+        period_report(date(2026, 8, 1), date(2026, 8, 15), database="db")
+
+        self.assertEqual(load_mock.call_count, 3)
+        self.assertEqual(version_mock.call_count, 4)
+        version_mock.assert_called_with("db")
+        self.assertEqual(
+            load_mock.call_args.kwargs,
+            {
+                "start_date": date(2026, 8, 1),
+                "end_date": date(2026, 8, 15),
+                "database": "db",
+                "summary_only": False,
+            },
+        )
+
+    def test_database_failures_are_application_errors(
+        self,
+        load_mock,
+        version_mock,
+    ) -> None:
+        version_mock.side_effect = psycopg.OperationalError("server closed\nmore")
+
+        with self.assertRaisesRegex(DatabaseError, "^server closed$"):
+            period_report(date(2026, 8, 1), date(2026, 8, 15), database="db")
+        load_mock.assert_not_called()
+
+
+def finish_report_job(app: AppTest) -> AppTest:
+    if "report_job_id" not in app.session_state:
+        return app
+    get_report_queue().wait(app.session_state["report_job_id"], timeout=10)
+    return app.run()
+
+
 class ReportPageTests(unittest.TestCase):
+    def setUp(self) -> None:
+        prune = patch("expense_tracking.ui.reports.prune_report_outputs")
+        self.prune_mock = prune.start()
+        self.addCleanup(prune.stop)
+        preview = patch(
+            "expense_tracking.ui.reports.period_report",
+            return_value=CashFlowReport(
+                summary=MONTH_SUMMARY,
+                monthly=(),
+                transactions=(),
+            ),
+        )
+        self.preview_mock = preview.start()
+        self.addCleanup(preview.stop)
+
+    def test_period_preview_shows_summary_totals(self) -> None:
+        with patch("expense_tracking.ui.reports.generate_report"):
+            app = AppTest.from_string(REPORT_APP).run()
+            app.radio[0].set_value("Custom range").run()
+            app.date_input[0].set_value(date(2026, 8, 1))
+            app.date_input[1].set_value(date(2026, 8, 15))
+            finish_report_job(app.button[0].click().run())
+
+        self.assertEqual(
+            self.preview_mock.call_args,
+            call(date(2026, 8, 1), date(2026, 8, 15), summary_only=True),
+        )
+        self.assertEqual(
+            [(metric.label, metric.value) for metric in app.metric],
+            [
+                ("Income", "$2,500.00"),
+                ("Expenses", "$400.25"),
+                ("Investments", "$300.00"),
+                ("Net cash flow", "$1,799.75"),
+            ],
+        )
+        self.assertEqual(len(app.exception), 0)
+
+    def test_period_preview_reuses_cached_data_across_reruns(self) -> None:
+        self.preview_mock.side_effect = period_report
+        cached_cash_flow_report.clear()
+        self.addCleanup(cached_cash_flow_report.clear)
+        with (
+            patch(
+                "expense_tracking.ui.data.load_data_version",
+                return_value=5,
+            ) as version_mock,
+            patch(
+                "expense_tracking.ui.data.load_cash_flow_report",
+                return_value=CashFlowReport(
+                    summary=MONTH_SUMMARY,
+                    monthly=(),
+                    transactions=(),
+                ),
+            ) as load_mock,
+        ):
+            app = AppTest.from_string(REPORT_APP).run()
+            app.run()
+            self.assertEqual(load_mock.call_count, 1)
+            self.assertEqual(version_mock.call_count, 2)
+
+            version_mock.return_value = 6
+            app.run()
+
+        self.assertEqual(load_mock.call_count, 2)
+        self.assertTrue(load_mock.call_args.kwargs["summary_only"])
+        self.assertEqual(len(app.metric), 4)
+
+    def test_period_preview_failure_does_not_block_the_page(self) -> None:
+        self.preview_mock.side_effect = DatabaseError("connection failed")
+
+        app = AppTest.from_string(REPORT_APP).run()
+
+        self.assertIn("connection failed", app.caption[-1].value)
+        self.assertEqual(len(app.metric), 0)
+        self.assertEqual(len(app.button), 1)
+        self.assertEqual(len(app.exception), 0)
+
     def test_success_creates_download_and_calls_service(self) -> None:
         with TemporaryDirectory() as temp_dir:
             output = Path(temp_dir) / "cash-flow-2024-02.html"
@@ -167,6 +527,7 @@ class ReportPageTests(unittest.TestCase):
                 app.selectbox[0].select("February")
                 app.number_input[0].set_value(2024)
                 app.button[0].click().run()
+                finish_report_job(app)
 
         period = generate_mock.call_args.kwargs["period"]
         self.assertEqual(period.start_date, date(2024, 2, 1))
@@ -174,6 +535,30 @@ class ReportPageTests(unittest.TestCase):
         self.assertEqual(len(app.download_button), 1)
         self.assertEqual(app.download_button[0].label, "Download report")
         self.assertIn("cash-flow-2024-02.html", app.success[0].value)
+        self.assertEqual(
+            self.prune_mock.call_args.kwargs["keep"],
+            output.resolve(),
+        )
+        self.assertIsNone(self.prune_mock.call_args.kwargs["running_since"])
+        self.assertEqual(len(app.exception), 0)
+
+    def test_cleaned_up_report_is_dropped_from_session(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "cash-flow-2026.html"
+            output.write_bytes(b"<html>report</html>")
+            with patch(
+                "expense_tracking.ui.reports.generate_report",
+                return_value=output,
+            ):
+                app = AppTest.from_string(REPORT_APP).run()
+                finish_report_job(app.button[0].click().run())
+            self.assertEqual(len(app.download_button), 1)
+
+        app.run()
+
+        self.assertEqual(len(app.download_button), 0)
+        self.assertIn("cleaned up", app.warning[0].value)
+        self.assertNotIn("latest_report_download", app.session_state)
         self.assertEqual(len(app.exception), 0)
 
     def test_failed_generation_preserves_previous_download(self) -> None:
@@ -188,13 +573,40 @@ class ReportPageTests(unittest.TestCase):
                 ],
             ):
                 app = AppTest.from_string(REPORT_APP).run()
-                app.button[0].click().run()
-                app.button[0].click().run()
+                finish_report_job(app.button[0].click().run())
+                finish_report_job(app.button[0].click().run())
 
         self.assertIn("Quarto failed.", app.error[0].value)
         self.assertEqual(len(app.download_button), 1)
         self.assertEqual(len(app.exception), 0)
 
+    def test_page_stays_responsive_while_report_runs(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_report(**_: object) -> Path:
+            started.set()
+            release.wait(timeout=10)
+            raise ReportGenerationError("Quarto failed.")
+
+        with patch("expense_tracking.ui.reports.generate_report", slow_report):
+            app = AppTest.from_string(REPORT_APP).run()
+            app.button[0].click().run()
+            self.assertTrue(started.wait(timeout=10))
+            app.run()
+            self.assertIn("Generating report", app.info[0].value)
+            self.assertEqual(len(app.error), 0)
+            app.radio[0].set_value("Year").run()
+            self.assertIn("report_job_id", app.session_state)
+
+            release.set()
+            finish_report_job(app)
+
+        self.assertIn("Quarto failed.", app.error[0].value)
+        self.assertNotIn("report_job_id", app.session_state)
+        self.assertEqual(len(app.info), 0)
+        self.assertEqual(len(app.exception), 0)
+
     def test_custom_range_validation_does_not_generate(self) -> None:
         with patch("expense_tracking.ui.reports.generate_report") as generate_mock:
             app = AppTest.from_string(REPORT_APP).run()
@@ -205,6 +617,7 @@ class ReportPageTests(unittest.TestCase):
 
         self.assertIn("end date must be on or after start date", app.error[0].value)
         generate_mock.assert_not_called()
+        self.assertEqual(len(app.metric), 0)
         self.assertEqual(len(app.exception), 0)
 
 
@@ -0,0 +1,211 @@
+"""Tests for the in-process HTML report renderer."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import re
+import unittest
+from contextlib import redirect_stderr
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from expense_tracking.errors import ValidationError
+from expense_tracking.reporting.cash_flow import (
+    MonthlySummary,
+    ReportTransaction,
+    build_cash_flow_report,
+    build_summary_report,
+)
+from itables import options
+
+from expense_tracking.reporting.assets import (
+    asset_files,
+    shared_dt_url,
+    write_shared_assets,
+)
+from expense_tracking.reporting.html import render_cash_flow_html
+from expense_tracking.reports import ReportPeriod, generate_report
+from scripts.generate_report import parse_args
+
+
+def sample_report():
+    return build_cash_flow_report(
+        [
+            ReportTransaction(
+                id=1,
+                occurred_on=date(2026, 7, 1),
+                transaction_type="income",
+                amount=Decimal("2500.00"),
+                description="Paycheck",
+            ),
+            ReportTransaction(
+                id=2,
+                occurred_on=date(2026, 7, 3),
+                transaction_type="expense",
+                amount=Decimal("3000.00"),
+                description="<b>Rent</b>",
+            ),
+        ],
+        date(2026, 7, 1),
+        date(2026, 7, 31),
+    )
+
+
+class HtmlRendererTests(unittest.TestCase):
+    def test_dashboard_sections_are_rendered_self_contained(self) -> None:
+        html = render_cash_flow_html(sample_report(), period_label="July <2026>")
+
+        self.assertIn("July &lt;2026&gt; · 2 transactions", html)
+        self.assertIn('<div class="value">$2,500.00</div>', html)
+        self.assertIn('<div class="valuebox danger"><div class="title">Net Cash Flow', html)
+        self.assertEqual(html.count('class="plotly-graph-div"'), 2)
+        self.assertEqual(len(re.findall(r"<table id=\"itables_", html)), 2)
+        self.assertIn("No investment transactions occurred in this period.", html)
+        self.assertNotIn("<b>Rent</b>", html)
+        self.assertEqual(re.findall(r"<(?:script|link)[^>]*(?:src|href)=\"http", html), [])
+
+    def test_summary_only_reports_omit_tables_and_their_assets(self) -> None:
+        report = build_summary_report(
+            [MonthlySummary(month=date(2026, 7, 1), income=Decimal("10.00"))],
+            date(2026, 7, 1),
+            date(2026, 7, 31),
+        )
+
+        html = render_cash_flow_html(report, period_label="July", summary_only=True)
+
+        self.assertIn("July · Summary only", html)
+        self.assertEqual(
+            html.count("Transactions are omitted from summary-only reports."),
+            3,
+        )
+        self.assertNotIn("itables", html)
+
+
+class PythonBackendTests(unittest.TestCase):
+    @patch("expense_tracking.reports.subprocess.run")
+    @patch("expense_tracking.reports.load_cash_flow_report")
+    def test_python_backend_renders_without_quarto(
+        self,
+        load_mock,
+        run_mock,
+    ) -> None:
+        load_mock.return_value = sample_report()
+        with TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "report.html"
+
+            with patch("expense_tracking.reports.shutil.which", return_value=None):
+                result = generate_report(
+                    period=ReportPeriod.for_month(2026, 7),
+                    database="expense_tracking_app",
+                    output_path=output,
+                    backend="python",
+                )
+
+            self.assertIn("July 2026 · 2 transactions", result.read_text(encoding="utf-8"))
+        run_mock.assert_not_called()
+        self.assertEqual(load_mock.call_args.kwargs["end_date"], date(2026, 7, 31))
+        self.assertFalse(load_mock.call_args.kwargs["summary_only"])
+
+    def test_unknown_backend_is_rejected(self) -> None:
+        with self.assertRaisesRegex(ValidationError, "backend"):
+            generate_report(period=ReportPeriod.for_year(2026), backend="latex")
+
+
+class SharedAssetTests(unittest.TestCase):
+    def test_assets_are_written_once_per_content_hash(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            report_dir = Path(temp_dir)
+
+            href = write_shared_assets(report_dir)
+            self.assertEqual(write_shared_assets(report_dir, precompress=True), href)
+
+            self.assertRegex(href, r"^assets/[0-9a-f]{16}$")
+            self.assertEqual(len(list((report_dir / "assets").iterdir())), 1)
+            plotly = report_dir / href / "plotly.min.js"
+            self.assertEqual(plotly.read_bytes(), asset_files()["plotly.min.js"])
+            self.assertEqual(
+                gzip.decompress((report_dir / href / "dt_bundle.css.gz").read_bytes()),
+                (report_dir / href / "dt_bundle.css").read_bytes(),
+            )
+
+    def test_datatables_bundle_is_shared_unchanged(self) -> None:
+        self.assertEqual(
+            asset_files()["dt_bundle.js"],
+            Path(options.dt_bundle).read_bytes(),
+        )
+        self.assertEqual(
+            shared_dt_url("assets/0123456789abcdef/"),
+            "./assets/0123456789abcdef/dt_bundle.js",
+        )
+        for href in ("/static/assets", "../assets", "https://cdn.example/assets"):
+            with self.subTest(href=href):
+                self.assertEqual(shared_dt_url(href), f"{href}/dt_bundle.js")
+
+    def test_shared_asset_pages_hold_only_markup_and_data(self) -> None:
+        embedded = render_cash_flow_html(sample_report(), period_label="July")
+        shared = render_cash_flow_html(
+            sample_report(),
+            period_label="July",
+            asset_href="assets/0123456789abcdef",
+        )
+
+        self.assertLess(len(shared) * 20, len(embedded))
+        self.assertIn('<script src="assets/0123456789abcdef/plotly.min.js">', shared)
+        self.assertEqual(
+            shared.count("from './assets/0123456789abcdef/dt_bundle.js'"),
+            2,
+        )
+        self.assertIn('href="./assets/0123456789abcdef/dt_bundle.css"', shared)
+        self.assertNotIn("_itables_", shared)
+        self.assertEqual(len(re.findall(r"<table id=\"itables_", shared)), 2)
+
+    @patch("expense_tracking.reports.load_cash_flow_report")
+    def test_generate_report_links_assets_and_manages_compressed_copies(
+        self,
+        load_mock,
+    ) -> None:
+        load_mock.return_value = sample_report()
+        with TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "report.html"
+            options = {
+                "period": ReportPeriod.for_month(2026, 7),
+                "database": "expense_tracking_app",
+                "output_path": output,
+                "backend": "python",
+                "shared_assets": True,
+            }
+
+            generate_report(**options, precompress=True)
+            html = output.read_text(encoding="utf-8")
+            self.assertRegex(html, r'src="assets/[0-9a-f]{16}/plotly.min.js"')
+            self.assertEqual(
+                gzip.decompress(Path(f"{output}.gz").read_bytes()).decode("utf-8"),
+                html,
+            )
+
+            generate_report(**options)
+            self.assertFalse(Path(f"{output}.gz").exists())
+
+        with self.assertRaisesRegex(ValidationError, "python backend"):
+            generate_report(
+                period=ReportPeriod.for_month(2026, 7),
+                backend="quarto",
+                shared_assets=True,
+            )
+
+    def test_shared_assets_select_the_python_backend(self) -> None:
+        self.assertEqual(
+            parse_args(["--year", "2026", "--shared-assets"]).backend,
+            "python",
+        )
+        self.assertEqual(parse_args(["--year", "2026"]).backend, "quarto")
+        with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+            parse_args(["--year", "2026", "--shared-assets", "--backend", "quarto"])
+
+
+if __name__ == "__main__":
+    unittest.main()
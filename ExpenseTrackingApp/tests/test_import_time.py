@@ -0,0 +1,106 @@
+"""Import-time regression tests for lazy package exports."""
+
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPT_PATH = REPO_ROOT / "scripts" / "add_transaction.py"
+HEAVY_MODULES = frozenset({"itables", "numpy", "pandas", "plotly", "psycopg", "streamlit"})
+LAZY_PACKAGES = ("expense_tracking", "expense_tracking.reporting", "expense_tracking.ui")
+
+
+def imported_modules(arguments: list[str], *, stdin: str = "") -> set[str]:
+    """Run Python with ``-X importtime`` and return every module it imported."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        input=stdin,
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    } - {"imported package"}
+
+
+def heavy_modules(modules: set[str]) -> set[str]:
+    return {module.split(".")[0] for module in modules} & HEAVY_MODULES
+
+
+class ImportTimeTests(unittest.TestCase):
+    def test_dry_runs_never_import_heavy_dependencies(self) -> None:
+        runs = {
+            "single": (
+                [
+                    str(SCRIPT_PATH),
+                    "--amount",
+                    "18.75",
+                    "--description",
+                    "Lunch",
+                    "--dry-run",
+                ],
+                "",
+            ),
+            "csv": (
+                [str(SCRIPT_PATH), "--from-csv", "-", "--dry-run"],
+                "amount,description\n18.75,Lunch\n",
+            ),
+            "ndjson": (
+                [str(SCRIPT_PATH), "--from-ndjson", "-", "--dry-run"],
+                '{"amount": 18.75, "description": "Lunch"}\n',
+            ),
+            "help": ([str(SCRIPT_PATH), "--help"], ""),
+        }
+        for name, (arguments, stdin) in runs.items():
+            with self.subTest(run=name):
+                modules = imported_modules(arguments, stdin=stdin)
+                self.assertIn("expense_tracking.models", modules)
+                self.assertEqual(heavy_modules(modules), set())
+
+    def test_importing_packages_defers_their_exports(self) -> None:
+        for package in LAZY_PACKAGES:
+            with self.subTest(package=package):
+                modules = imported_modules(["-c", f"import {package}"])
+                self.assertEqual(heavy_modules(modules), set())
+
+        modules = imported_modules(
+            ["-c", "import expense_tracking; expense_tracking.add_transaction"]
+        )
+        self.assertIn("psycopg", heavy_modules(modules))
+
+
+class LazyExportTests(unittest.TestCase):
+    def test_every_public_name_resolves_from_its_module(self) -> None:
+        for package_name in LAZY_PACKAGES:
+            package = importlib.import_module(package_name)
+            with self.subTest(package=package_name):
+                self.assertEqual(sorted(package.__all__), sorted(package._EXPORTS))
+                for name in package.__all__:
+                    module = importlib.import_module(package._EXPORTS[name])
+                    self.assertIs(getattr(package, name), getattr(module, name))
+                    self.assertIn(name, dir(package))
+                with self.assertRaisesRegex(AttributeError, "no attribute 'missing'"):
+                    package.missing
+
+    def test_star_import_and_submodule_import_still_work(self) -> None:
+        namespace: dict[str, object] = {}
+        exec("from expense_tracking import *", namespace)
+        self.assertIn("add_transactions", namespace)
+
+        from expense_tracking import pool
+
+        self.assertEqual(pool.__name__, "expense_tracking.pool")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for the bounded background report job queue."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from expense_tracking.config import resolve_report_workers
+from expense_tracking.errors import ReportGenerationError, ValidationError
+from expense_tracking.jobs import JobQueue
+
+
+class ReportWorkerSettingTests(unittest.TestCase):
+    def test_defaults_environment_and_explicit_values(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(resolve_report_workers(), 2)
+        with patch.dict(os.environ, {"EXPENSE_REPORT_WORKERS": "5"}, clear=True):
+            self.assertEqual(resolve_report_workers(), 5)
+            self.assertEqual(resolve_report_workers(1), 1)
+
+    def test_invalid_values_are_rejected(self) -> None:
+        for value in (0, -1, "many"):
+            with self.subTest(value=value), self.assertRaises(ValidationError):
+                resolve_report_workers(value)
+
+
+class JobQueueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.queue = JobQueue(1)
+        self.release = threading.Event()
+        self.addCleanup(self.queue.shutdown)
+        self.addCleanup(self.release.set)
+
+    def blocking_job(self, *, value: str) -> str:
+        self.release.wait(timeout=10)
+        return value
+
+    def wait_for_state(self, job_id: str, state: str) -> None:
+        deadline = time.monotonic() + 10
+        while self.queue.status(job_id).state != state:
+            if time.monotonic() > deadline:
+                self.fail(f"job never reached {state}")
+            time.sleep(0.01)
+
+    def test_jobs_beyond_the_cap_wait_in_order(self) -> None:
+        first = self.queue.submit(self.blocking_job, value="first")
+        second = self.queue.submit(self.blocking_job, value="second")
+        third = self.queue.submit(self.blocking_job, value="third")
+        self.wait_for_state(first, "running")
+
+        self.assertEqual(self.queue.status(second).state, "queued")
+        self.assertEqual(self.queue.status(second).position, 1)
+        self.assertEqual(self.queue.status(third).position, 2)
+
+        self.release.set()
+        self.assertEqual(self.queue.wait(third, timeout=10).result, "third")
+        self.assertEqual(self.queue.status(first).result, "first")
+        self.assertTrue(self.queue.status(first).done)
+
+    def test_oldest_running_start_tracks_running_jobs(self) -> None:
+        self.assertIsNone(self.queue.oldest_running_start())
+        first = self.queue.submit(self.blocking_job, value="first")
+        second = self.queue.submit(self.blocking_job, value="second")
+        self.wait_for_state(first, "running")
+
+        self.assertEqual(
+            self.queue.oldest_running_start(),
+            self.queue.status(first).started_at,
+        )
+
+        self.release.set()
+        self.queue.wait(second, timeout=10)
+        self.assertIsNone(self.queue.oldest_running_start())
+
+    def test_failure_is_captured_on_the_job(self) -> None:
+        def failing_job() -> None:
+            raise ReportGenerationError("Quarto failed.")
+
+        job = self.queue.wait(self.queue.submit(failing_job), timeout=10)
+
+        self.assertEqual(job.state, "failed")
+        self.assertIsInstance(job.error, ReportGenerationError)
+        self.assertIsNone(job.result)
+        self.assertGreaterEqual(job.elapsed, 0)
+
+    def test_finished_jobs_are_pruned_after_retention(self) -> None:
+        queue = JobQueue(1, retention=0)
+        self.addCleanup(queue.shutdown)
+        finished = queue.submit(str)
+        queue.wait(finished, timeout=10)
+        time.sleep(0.01)
+
+        pending = queue.submit(self.blocking_job, value="pending")
+
+        self.assertIsNone(queue.status(finished))
+        self.assertIsNone(queue.status("unknown"))
+        self.assertIsNotNone(queue.status(pending))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Tests for the Fenwick-tree daily ledger index."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date, timedelta
+from decimal import Decimal
+
+from hypothesis import given, settings, strategies as st
+
+from expense_tracking.reporting.cash_flow import (
+    ALLOWED_TRANSACTION_TYPES,
+    ReportTransaction,
+    build_cash_flow_report,
+)
+from expense_tracking.reporting.ledger import DailyLedgerIndex
+
+
+LEDGER_START = date(2026, 1, 1)
+LEDGER_END = date(2026, 12, 31)
+LEDGER_DAYS = (LEDGER_END - LEDGER_START).days
+
+
+def transaction(
+    id: int,
+    occurred_on: date,
+    transaction_type: str,
+    amount: str,
+) -> ReportTransaction:
+    return ReportTransaction(
+        id=id,
+        occurred_on=occurred_on,
+        transaction_type=transaction_type,
+        amount=Decimal(amount),
+        description=f"Transaction {id}",
+    )
+
+
+ledger_days = st.integers(min_value=0, max_value=LEDGER_DAYS).map(
+    lambda offset: LEDGER_START + timedelta(days=offset)
+)
+ledger_transactions = st.lists(
+    st.tuples(
+        st.integers(min_value=-30, max_value=LEDGER_DAYS + 30).map(
+            lambda offset: LEDGER_START + timedelta(days=offset)
+        ),
+        st.sampled_from(ALLOWED_TRANSACTION_TYPES),
+        st.integers(min_value=1, max_value=500_000).map(
+            lambda cents: Decimal(cents).scaleb(-2)
+        ),
+    ),
+    max_size=40,
+).map(
+    lambda details: [
+        ReportTransaction(
+            id=id,
+            occurred_on=occurred_on,
+            transaction_type=transaction_type,
+            amount=amount,
+            description=f"Transaction {id}",
+        )
+        for id, (occurred_on, transaction_type, amount) in enumerate(details)
+    ]
+)
+
+
+class DailyLedgerIndexTests(unittest.TestCase):
+    @settings(max_examples=80, deadline=None)
+    @given(
+        transactions=ledger_transactions,
+        split=st.integers(min_value=0, max_value=40),
+        bounds=st.tuples(ledger_days, ledger_days).map(sorted),
+    )
+    def test_range_summaries_match_a_full_rebuild(
+        self,
+        transactions,
+        split,
+        bounds,
+    ) -> None:
+        start_date, end_date = bounds
+        ledger = DailyLedgerIndex.from_transactions(
+            transactions[:split],
+            LEDGER_START,
+            LEDGER_END,
+        )
+        for added in transactions[split:]:
+            ledger.add(added)
+
+        self.assertEqual(
+            ledger.summary(start_date, end_date),
+            build_cash_flow_report(transactions, start_date, end_date).summary,
+        )
+
+    def test_removed_transactions_leave_the_totals(self) -> None:
+        kept = transaction(1, date(2026, 3, 5), "income", "100.00")
+        removed = transaction(2, date(2026, 3, 6), "expense", "30.25")
+        ledger = DailyLedgerIndex.from_transactions(
+            [kept, removed],
+            LEDGER_START,
+            LEDGER_END,
+        )
+
+        ledger.remove(removed)
+        ledger.add(transaction(3, date(2025, 12, 31), "income", "5.00"))
+
+        summary = ledger.summary(date(2026, 3, 1), date(2026, 3, 31))
+        self.assertEqual(summary.income, Decimal("100.00"))
+        self.assertEqual(summary.expenses, Decimal("0.00"))
+        self.assertEqual(ledger.summary(LEDGER_START, LEDGER_START).income, Decimal("0"))
+
+    def test_invalid_ranges_types_and_amounts_are_rejected(self) -> None:
+        ledger = DailyLedgerIndex(LEDGER_START, LEDGER_END)
+
+        with self.assertRaisesRegex(ValueError, "within"):
+            ledger.summary(date(2025, 12, 31), LEDGER_END)
+        with self.assertRaisesRegex(ValueError, "on or after"):
+            ledger.summary(LEDGER_END, LEDGER_START)
+        with self.assertRaisesRegex(ValueError, "invalid transaction type"):
+            ledger.adjust(LEDGER_START, "transfer", Decimal("1.00"))
+        with self.assertRaisesRegex(ValueError, "two decimal places"):
+            ledger.adjust(LEDGER_START, "income", Decimal("1.005"))
+        with self.assertRaisesRegex(ValueError, "on or after"):
+            DailyLedgerIndex(LEDGER_END, LEDGER_START)
+
+
+if __name__ == "__main__":
+    unittest.main()
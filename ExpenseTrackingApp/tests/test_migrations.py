@@ -13,6 +13,12 @@ from tempfile import TemporaryDirectory
 REPO_ROOT = Path(__file__).resolve().parent.parent
 MIGRATION_001 = REPO_ROOT / "migrations" / "001_create_transactions.sql"
 MIGRATION_002 = REPO_ROOT / "migrations" / "002_reject_nan_amounts.sql"
+MIGRATION_003 = REPO_ROOT / "migrations" / "003_create_monthly_totals.sql"
+MIGRATION_004 = REPO_ROOT / "migrations" / "004_create_data_version.sql"
+MIGRATION_005 = REPO_ROOT / "migrations" / "005_create_keyset_indexes.sql"
+MIGRATION_006 = REPO_ROOT / "migrations" / "006_create_description_search.sql"
+SEARCH_QUERY = REPO_ROOT / "queries" / "search_transactions.sql"
+CHECK_MONTHLY_TOTALS = REPO_ROOT / "queries" / "check_monthly_totals.sql"
 IMPORT_SCRIPT = REPO_ROOT / "data_curation" / "import_transactions.sql"
 
 
@@ -32,8 +38,69 @@ class MigrationSourceTests(unittest.TestCase):
             ),
         )
 
+    def test_monthly_rollup_triggers_cover_every_write(self) -> None:
+        source = MIGRATION_003.read_text(encoding="utf-8")
+
+        self.assertRegex(
+            source,
+            re.compile(
+                r"AFTER\s+INSERT\s+OR\s+UPDATE\s+OF\s+occurred_on,\s*"
+                r"transaction_type,\s*amount\s+OR\s+DELETE",
+                re.IGNORECASE,
+            ),
+        )
+        self.assertRegex(source, re.compile(r"AFTER\s+TRUNCATE", re.IGNORECASE))
+        self.assertLess(
+            source.index("LOCK TABLE public.transactions"),
+            source.index("CREATE TRIGGER"),
+        )
+
+    def test_data_version_trigger_covers_every_statement(self) -> None:
+        source = MIGRATION_004.read_text(encoding="utf-8")
+
+        self.assertRegex(
+            source,
+            re.compile(
+                r"AFTER\s+INSERT\s+OR\s+UPDATE\s+OR\s+DELETE\s+OR\s+TRUNCATE"
+                r"\s+ON\s+public\.transactions\s+FOR\s+EACH\s+STATEMENT",
+                re.IGNORECASE,
+            ),
+        )
+
+    def test_data_version_advances_once_per_transaction(self) -> None:
+        source = MIGRATION_004.read_text(encoding="utf-8")
+
+        self.assertIn("txid_current()", source)
+        self.assertIn(
+            "last_transaction_id IS DISTINCT FROM current_transaction_id",
+            source,
+        )
+        self.assertIn("WHERE slot = current_transaction_id % 16", source)
+
+    def test_keyset_indexes_end_in_the_primary_key(self) -> None:
+        source = MIGRATION_005.read_text(encoding="utf-8")
+
+        self.assertIn("ON public.transactions (occurred_on, id)", source)
+        self.assertIn(
+            "ON public.transactions (transaction_type, occurred_on, id)",
+            source,
+        )
+        self.assertIn("DROP INDEX IF EXISTS public.transactions_occurred_on_idx", source)
+        self.assertIn(
+            "DROP INDEX IF EXISTS public.transactions_type_occurred_on_idx",
+            source,
+        )
+
+    def test_description_search_uses_a_trigram_index(self) -> None:
+        source = MIGRATION_006.read_text(encoding="utf-8")
+
+        self.assertIn("CREATE EXTENSION IF NOT EXISTS pg_trgm", source)
+        self.assertIn("USING gist (description gist_trgm_ops)", source)
+
+
+class PostgresClusterTestCase(unittest.TestCase):
+    """Start a throwaway PostgreSQL cluster for the tests in a subclass."""
 
-class RejectNanMigrationIntegrationTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         required_commands = ("initdb", "pg_ctl", "psql")
@@ -143,6 +210,8 @@ class RejectNanMigrationIntegrationTests(unittest.TestCase):
             cwd=REPO_ROOT,
         )
 
+
+class RejectNanMigrationIntegrationTests(PostgresClusterTestCase):
     def insert_amount(self, amount: str) -> subprocess.CompletedProcess[str]:
         return self.psql(
             command=(
@@ -217,5 +286,247 @@ class RejectNanMigrationIntegrationTests(unittest.TestCase):
         self.assertEqual(after_rerun, before_rerun)
 
 
+class MonthlyRollupMigrationIntegrationTests(PostgresClusterTestCase):
+    def rollup(self) -> str:
+        return self.psql(
+            command=(
+                "SELECT month::text || '|' || transaction_type || '|' "
+                "|| amount::text || '|' || transaction_count::text "
+                "FROM public.transaction_monthly_totals "
+                "ORDER BY month, transaction_type;"
+            ),
+            tuples_only=True,
+        ).stdout.strip()
+
+    def assert_rollup_is_exact(self) -> None:
+        mismatches = self.psql(file=CHECK_MONTHLY_TOTALS, tuples_only=True)
+        self.assertEqual(mismatches.stdout.strip(), "")
+
+    def test_rollup_is_backfilled_and_maintained_by_triggers(self) -> None:
+        self.psql(file=MIGRATION_001)
+        self.psql(file=MIGRATION_002)
+        self.psql(
+            command=(
+                "INSERT INTO public.transactions "
+                "(occurred_on, transaction_type, amount, description) VALUES "
+                "(DATE '2026-01-05', 'income', 1000.00, 'Paycheck'), "
+                "(DATE '2026-01-20', 'expense', 25.50, 'Groceries');"
+            )
+        )
+
+        self.psql(file=MIGRATION_003)
+        self.assertEqual(
+            self.rollup().splitlines(),
+            [
+                "2026-01-01|expense|25.50|1",
+                "2026-01-01|income|1000.00|1",
+            ],
+        )
+
+        self.psql(
+            command=(
+                "INSERT INTO public.transactions "
+                "(occurred_on, transaction_type, amount, description) VALUES "
+                "(DATE '2026-02-03', 'investment', 300.00, 'Index fund'), "
+                "(DATE '2026-01-21', 'expense', 4.50, 'Coffee');"
+                "UPDATE public.transactions SET occurred_on = DATE '2026-02-01' "
+                "WHERE description = 'Groceries';"
+                "DELETE FROM public.transactions WHERE description = 'Paycheck';"
+            )
+        )
+        self.assertEqual(
+            self.rollup().splitlines(),
+            [
+                "2026-01-01|expense|4.50|1",
+                "2026-02-01|expense|25.50|1",
+                "2026-02-01|investment|300.00|1",
+            ],
+        )
+        self.assert_rollup_is_exact()
+
+        self.psql(file=MIGRATION_003)
+        self.assert_rollup_is_exact()
+        self.psql(command="TRUNCATE public.transactions;")
+        self.assertEqual(self.rollup(), "")
+
+
+class DataVersionMigrationIntegrationTests(PostgresClusterTestCase):
+    def version(self) -> int:
+        return int(
+            self.psql(
+                command="SELECT sum(version) FROM public.transaction_data_version;",
+                tuples_only=True,
+            ).stdout.strip()
+        )
+
+    def test_every_committed_write_transaction_advances_the_version(self) -> None:
+        self.psql(file=MIGRATION_001)
+        self.psql(file=MIGRATION_004)
+        self.psql(file=MIGRATION_004)
+        self.assertEqual(self.version(), 0)
+
+        self.psql(
+            command=(
+                "INSERT INTO public.transactions "
+                "(occurred_on, transaction_type, amount, description) VALUES "
+                "(DATE '2026-01-05', 'income', 1000.00, 'Paycheck'), "
+                "(DATE '2026-01-20', 'expense', 25.50, 'Groceries');"
+            )
+        )
+        self.assertEqual(self.version(), 1)
+
+        self.psql(
+            command=(
+                "BEGIN;"
+                "DELETE FROM public.transactions WHERE description = 'Paycheck';"
+                "ROLLBACK;"
+            )
+        )
+        self.assertEqual(self.version(), 1)
+
+        self.psql(
+            command=(
+                "BEGIN;"
+                "INSERT INTO public.transactions "
+                "(occurred_on, transaction_type, amount, description) VALUES "
+                "(DATE '2026-01-21', 'expense', 4.50, 'Coffee');"
+                "INSERT INTO public.transactions "
+                "(occurred_on, transaction_type, amount, description) VALUES "
+                "(DATE '2026-01-22', 'expense', 3.75, 'Tea');"
+                "UPDATE public.transactions SET amount = 26.00 "
+                "WHERE description = 'Groceries';"
+                "COMMIT;"
+            )
+        )
+        self.assertEqual(self.version(), 2)
+
+        self.psql(command="TRUNCATE public.transactions;")
+        self.assertEqual(self.version(), 3)
+
+
+class KeysetIndexMigrationIntegrationTests(PostgresClusterTestCase):
+    def test_keyset_page_is_read_from_the_new_index(self) -> None:
+        self.psql(file=MIGRATION_001)
+        self.psql(file=MIGRATION_005)
+        self.psql(file=MIGRATION_005)
+
+        indexes = self.psql(
+            command=(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename = 'transactions' ORDER BY indexname;"
+            ),
+            tuples_only=True,
+        ).stdout.split()
+        self.assertEqual(
+            indexes,
+            [
+                "transactions_occurred_on_id_idx",
+                "transactions_pkey",
+                "transactions_type_occurred_on_id_idx",
+            ],
+        )
+
+        self.psql(
+            command=(
+                "INSERT INTO public.transactions "
+                "(occurred_on, transaction_type, amount, description) "
+                "SELECT DATE '2026-01-01' + (n % 365), 'expense', 1.00, 'Row' "
+                "FROM generate_series(1, 2000) AS n;"
+                "ANALYZE public.transactions;"
+            )
+        )
+        plan = self.psql(
+            command=(
+                "EXPLAIN SELECT id FROM public.transactions "
+                "WHERE (occurred_on, id) < (DATE '2026-06-01', 1000) "
+                "ORDER BY occurred_on DESC, id DESC LIMIT 51;"
+            ),
+            tuples_only=True,
+        ).stdout
+        self.assertIn("Index Scan Backward using transactions_occurred_on_id_idx", plan)
+        self.assertNotIn("Sort", plan)
+
+        typed_plan = self.psql(
+            command=(
+                "EXPLAIN SELECT id FROM public.transactions "
+                "WHERE transaction_type = 'expense' "
+                "AND (occurred_on, id) < (DATE '2026-06-01', 1000) "
+                "ORDER BY occurred_on DESC, id DESC LIMIT 51;"
+            ),
+            tuples_only=True,
+        ).stdout
+        self.assertIn(
+            "Index Scan Backward using transactions_type_occurred_on_id_idx",
+            typed_plan,
+        )
+        self.assertNotIn("Sort", typed_plan)
+
+
+class DescriptionSearchMigrationIntegrationTests(PostgresClusterTestCase):
+    def search(self, text: str) -> list[str]:
+        query = SEARCH_QUERY.read_text(encoding="utf-8").replace("%%", "%")
+        for name, value in {
+            "query": f"'{text}'",
+            "pattern": f"'%{text}%'",
+            "start_date": "DATE '2000-01-01'",
+            "end_date": "DATE '2099-12-31'",
+            "limit": "10",
+        }.items():
+            query = query.replace(f"%({name})s", value)
+        return self.psql(command=query, tuples_only=True).stdout.splitlines()
+
+    def test_search_matches_substrings_and_typos_through_the_index(self) -> None:
+        self.psql(file=MIGRATION_001)
+        available = self.psql(
+            command=(
+                "SELECT count(*) FROM pg_available_extensions "
+                "WHERE name = 'pg_trgm';"
+            ),
+            tuples_only=True,
+        ).stdout.strip()
+        if available != "1":
+            self.skipTest("pg_trgm is not installed in this PostgreSQL build")
+        self.psql(file=MIGRATION_006)
+        self.psql(file=MIGRATION_006)
+
+        self.psql(
+            command=(
+                "INSERT INTO public.transactions "
+                "(occurred_on, transaction_type, amount, description) VALUES "
+                "(DATE '2026-01-05', 'expense', 84.10, 'COSTCO WHOLESALE #412'), "
+                "(DATE '2026-02-05', 'expense', 12.00, 'Corner Bakery'), "
+                "(DATE '2026-03-05', 'expense', 40.00, 'Costco gas');"
+            )
+        )
+
+        exact = self.search("costco")
+        self.assertEqual(len(exact), 2)
+        self.assertTrue(all("Costco" in row or "COSTCO" in row for row in exact))
+        self.assertEqual(len(self.search("cosco")), 2)
+        self.assertEqual(self.search("plumber"), [])
+
+        plan = self.psql(
+            command=(
+                "SET enable_seqscan = off;"
+                "EXPLAIN SELECT id FROM public.transactions "
+                "WHERE description ILIKE '%costco%';"
+            ),
+            tuples_only=True,
+        ).stdout
+        self.assertIn("transactions_description_trgm_idx", plan)
+
+        ranked = self.psql(
+            command=(
+                "SET enable_seqscan = off;"
+                "EXPLAIN SELECT id FROM public.transactions "
+                "ORDER BY 'cosco' <<-> description LIMIT 5;"
+            ),
+            tuples_only=True,
+        ).stdout
+        self.assertIn("Index Scan using transactions_description_trgm_idx", ranked)
+        self.assertIn("Order By", ranked)
+        self.assertNotIn("Sort", ranked)
+
+
 if __name__ == "__main__":
     unittest.main()
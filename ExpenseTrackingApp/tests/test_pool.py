@@ -0,0 +1,148 @@
+"""Tests for the shared PostgreSQL connection pools."""
+
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from expense_tracking import pool
+from expense_tracking.config import PoolSettings, resolve_pool_settings
+from expense_tracking.errors import ValidationError
+
+
+class PoolSettingsTests(unittest.TestCase):
+    def test_defaults_environment_and_explicit_values(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(
+                resolve_pool_settings(),
+                PoolSettings(min_size=1, max_size=5, max_idle=300.0),
+            )
+        with patch.dict(
+            os.environ,
+            {
+                "EXPENSE_POOL_MIN_SIZE": "2",
+                "EXPENSE_POOL_MAX_SIZE": "8",
+                "EXPENSE_POOL_MAX_IDLE": "60",
+                "EXPENSE_POOL_TIMEOUT": "2.5",
+            },
+            clear=True,
+        ):
+            self.assertEqual(
+                resolve_pool_settings(),
+                PoolSettings(min_size=2, max_size=8, max_idle=60.0, timeout=2.5),
+            )
+            self.assertEqual(resolve_pool_settings(max_size=3).max_size, 3)
+
+    def test_invalid_settings_are_rejected(self) -> None:
+        invalid = [
+            {"min_size": -1},
+            {"max_size": 0},
+            {"min_size": 4, "max_size": 2},
+            {"max_idle": 0},
+            {"timeout": 0},
+        ]
+        with patch.dict(os.environ, {}, clear=True):
+            for settings in invalid:
+                with self.subTest(settings=settings):
+                    with self.assertRaises(ValidationError):
+                        resolve_pool_settings(**settings)
+        with patch.dict(os.environ, {"EXPENSE_POOL_MAX_SIZE": "many"}, clear=True):
+            with self.assertRaisesRegex(ValidationError, "numbers"):
+                resolve_pool_settings()
+
+
+@patch("expense_tracking.pool.ConnectionPool")
+class SharedPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        pool.close_pools()
+        self.addCleanup(pool.close_pools)
+
+    def test_pools_are_created_lazily_and_reused(self, pool_class: MagicMock) -> None:
+        pool_class.side_effect = lambda **kwargs: MagicMock()
+
+        first = pool.get_pool("expense_tracking_app")
+        second = pool.get_pool(" expense_tracking_app ")
+
+        self.assertIs(first, second)
+        pool_class.assert_called_once()
+        kwargs = pool_class.call_args.kwargs
+        self.assertEqual(kwargs["kwargs"]["dbname"], "expense_tracking_app")
+        self.assertNotIn("options", kwargs["kwargs"])
+        self.assertEqual(kwargs["timeout"], resolve_pool_settings().timeout)
+
+    def test_read_only_and_databases_use_separate_pools(
+        self,
+        pool_class: MagicMock,
+    ) -> None:
+        pool_class.side_effect = lambda **kwargs: MagicMock()
+
+        writer = pool.get_pool("expense_tracking_app")
+        reader = pool.get_pool("expense_tracking_app", read_only=True)
+        other = pool.get_pool("other_database")
+
+        self.assertEqual(len({id(writer), id(reader), id(other)}), 3)
+        read_only_kwargs = pool_class.call_args_list[1].kwargs["kwargs"]
+        self.assertEqual(read_only_kwargs["options"], pool.READ_ONLY_OPTIONS)
+
+    def test_connection_borrows_from_pool(self, pool_class: MagicMock) -> None:
+        shared = pool_class.return_value
+        borrowed = shared.connection.return_value.__enter__.return_value
+
+        with pool.connection("expense_tracking_app") as connection:
+            self.assertIs(connection, borrowed)
+        shared.connection.return_value.__exit__.assert_called_once()
+
+    def test_close_pools_closes_and_forgets_pools(self, pool_class: MagicMock) -> None:
+        shared = pool.get_pool("expense_tracking_app")
+
+        pool.close_pools()
+        pool.get_pool("expense_tracking_app")
+
+        shared.close.assert_called_once()
+        self.assertEqual(pool_class.call_count, 2)
+
+
+@patch("expense_tracking.pool.AsyncConnectionPool")
+class SharedAsyncPoolTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await pool.close_async_pools()
+
+    async def asyncTearDown(self) -> None:
+        await pool.close_async_pools()
+
+    async def test_async_pools_are_opened_and_reused(
+        self,
+        pool_class: MagicMock,
+    ) -> None:
+        pool_class.side_effect = lambda **kwargs: MagicMock(
+            open=AsyncMock(),
+            close=AsyncMock(),
+        )
+
+        first = await pool.get_async_pool("expense_tracking_app", read_only=True)
+        second = await pool.get_async_pool("expense_tracking_app", read_only=True)
+        writer = await pool.get_async_pool("expense_tracking_app")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, writer)
+        self.assertEqual(pool_class.call_count, 2)
+        self.assertFalse(pool_class.call_args.kwargs["open"])
+        self.assertEqual(
+            pool_class.call_args.kwargs["timeout"],
+            resolve_pool_settings().timeout,
+        )
+        self.assertEqual(first.open.await_count, 2)
+
+    async def test_close_async_pools_awaits_close(self, pool_class: MagicMock) -> None:
+        shared = MagicMock(open=AsyncMock(), close=AsyncMock())
+        pool_class.return_value = shared
+        await pool.get_async_pool("expense_tracking_app")
+
+        await pool.close_async_pools()
+
+        shared.close.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
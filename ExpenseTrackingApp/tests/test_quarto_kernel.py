@@ -0,0 +1,161 @@
+"""Tests for the Jupyter kernel kept alive across Quarto renders."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import shutil
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from expense_tracking.errors import ReportGenerationError
+from expense_tracking.quarto_kernel import (
+    WarmKernel,
+    cell_result,
+    environment_code,
+    inline_expressions,
+    inline_values_code,
+    substitute_inline_values,
+)
+from expense_tracking.reporting.cash_flow import (
+    ReportTransaction,
+    build_cash_flow_report,
+)
+from expense_tracking.reporting.data import write_report_data
+from expense_tracking.reports import (
+    ReportPeriod,
+    build_python_environment,
+    build_render_environment,
+)
+from expense_tracking.timing import emit_timings
+
+
+def markdown(source: str) -> SimpleNamespace:
+    return SimpleNamespace(cell_type="markdown", source=source)
+
+
+class NotebookPreparationTests(unittest.TestCase):
+    def test_environment_code_replaces_the_previous_render_settings(self) -> None:
+        code = environment_code(
+            {
+                "EXPENSE_REPORT_START_DATE": "2026-07-01",
+                "EXPENSE_REPORT_PERIOD_LABEL": "July's report",
+                "HOME": "/home/someone",
+            }
+        )
+        stale = {
+            "EXPENSE_REPORT_DATA_FILE": "/tmp/old.pickle",
+            "EXPENSE_REPORT_START_DATE": "2025-01-01",
+        }
+
+        with patch.dict(os.environ, stale), TemporaryDirectory() as temp_dir:
+            emit_timings(Path(temp_dir) / "old.jsonl")
+            self.addCleanup(emit_timings, None)
+            exec(code, {})
+            self.assertEqual(os.environ["EXPENSE_REPORT_START_DATE"], "2026-07-01")
+            self.assertEqual(os.environ["EXPENSE_REPORT_PERIOD_LABEL"], "July's report")
+            self.assertNotIn("EXPENSE_REPORT_DATA_FILE", os.environ)
+        self.assertNotIn("HOME", code)
+
+    def test_inline_expressions_are_evaluated_in_order(self) -> None:
+        notebook = SimpleNamespace(
+            cells=[
+                markdown("`{python} display_period` · `{python} transaction_count`"),
+                SimpleNamespace(cell_type="code", source="`{python} ignored`"),
+                markdown("No expressions"),
+            ]
+        )
+
+        expressions = inline_expressions(notebook)
+        namespace = {"display_period": "July 2026", "transaction_count": 3}
+        *statements, result = inline_values_code(expressions).splitlines()
+        exec("\n".join(statements), namespace)
+        substitute_inline_values(notebook, json.loads(eval(result, namespace)))
+
+        self.assertEqual(expressions, ["display_period", "transaction_count"])
+        self.assertEqual(notebook.cells[0].source, "July 2026 · 3")
+        self.assertEqual(notebook.cells[1].source, "`{python} ignored`")
+
+    def test_cell_result_reads_the_execute_result(self) -> None:
+        cell = {
+            "outputs": [
+                {"output_type": "stream", "text": "noise"},
+                {
+                    "output_type": "execute_result",
+                    "data": {"text/plain": "'[\"a\"]'"},
+                },
+            ]
+        }
+
+        self.assertEqual(cell_result(cell), '["a"]')
+        with self.assertRaisesRegex(ReportGenerationError, "no inline values"):
+            cell_result({"outputs": []})
+
+    def test_unstarted_kernel_cannot_execute(self) -> None:
+        with self.assertRaisesRegex(ReportGenerationError, "not been started"):
+            WarmKernel("quarto").execute(
+                environment={},
+                output_path=Path("report.ipynb"),
+            )
+
+
+@unittest.skipUnless(
+    shutil.which("quarto") and importlib.util.find_spec("nbclient"),
+    "Quarto and the Jupyter packages are required",
+)
+class WarmKernelTests(unittest.TestCase):
+    def test_consecutive_renders_share_one_kernel(self) -> None:
+        kernel = WarmKernel(
+            shutil.which("quarto"),
+            environment=build_python_environment(),
+        )
+        kernel.start()
+        self.addCleanup(kernel.shutdown)
+        process = kernel._manager.provisioner.process
+
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for month in (7, 8):
+                period = ReportPeriod.for_month(2026, month)
+                data_file = root / f"{month}.pickle"
+                write_report_data(
+                    build_cash_flow_report(
+                        [
+                            ReportTransaction(
+                                id=month,
+                                occurred_on=period.start_date,
+                                transaction_type="income",
+                                amount=Decimal("10.00"),
+                                description="Salary",
+                            )
+                        ],
+                        period.start_date,
+                        period.end_date,
+                    ),
+                    data_file,
+                )
+                notebook = root / f"{month}.ipynb"
+                kernel.execute(
+                    environment=build_render_environment(
+                        period=period,
+                        database="expense_tracking_app",
+                        data_file=data_file,
+                    ),
+                    output_path=notebook,
+                )
+                with self.subTest(month=month):
+                    text = notebook.read_text(encoding="utf-8")
+                    self.assertIn(period.label, text)
+                    self.assertNotIn("{python}", text)
+                    self.assertNotIn("emit_timings(None)", text)
+
+        self.assertIs(kernel._manager.provisioner.process, process)
+
+
+if __name__ == "__main__":
+    unittest.main()
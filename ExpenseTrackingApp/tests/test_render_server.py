@@ -0,0 +1,198 @@
+"""Tests for the warm Unix-socket render server."""
+
+from __future__ import annotations
+
+import io
+import socket
+import threading
+import unittest
+from contextlib import redirect_stdout
+from datetime import date
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from expense_tracking.errors import ReportGenerationError
+from expense_tracking.render_server import create_server, request_render
+from expense_tracking.report_cache import ReportCache
+from expense_tracking.reports import ReportPeriod
+from scripts.generate_report import main
+
+
+class RenderServerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.socket_path = self.root / "render.sock"
+        self.output_dir = self.root / "output"
+        self.server = create_server(self.socket_path, output_dir=self.output_dir)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    @patch("expense_tracking.render_server.generate_report")
+    def test_jobs_render_with_the_python_backend(self, generate_mock) -> None:
+        output = self.output_dir / "report.html"
+        generate_mock.return_value = output
+
+        result = request_render(
+            period=ReportPeriod.for_month(2026, 7),
+            database="expense_tracking_app",
+            output_path=output,
+            summary_only=True,
+            socket_path=self.socket_path,
+        )
+
+        self.assertEqual(result, output)
+        kwargs = generate_mock.call_args.kwargs
+        self.assertEqual(kwargs["period"], ReportPeriod.for_month(2026, 7))
+        self.assertEqual(kwargs["output_path"], output.resolve())
+        self.assertEqual(kwargs["backend"], "python")
+        self.assertTrue(kwargs["summary_only"])
+        self.assertIsInstance(kwargs["cache"], ReportCache)
+
+    @patch(
+        "expense_tracking.render_server.generate_report",
+        side_effect=ReportGenerationError("Report data could not be loaded."),
+    )
+    def test_render_failures_are_returned_to_the_client(self, generate_mock) -> None:
+        with self.assertRaisesRegex(ReportGenerationError, "could not be loaded"):
+            request_render(
+                period=ReportPeriod.for_year(2026),
+                socket_path=self.socket_path,
+            )
+
+        self.assertEqual(
+            generate_mock.call_args.kwargs["output_path"],
+            (self.output_dir / ReportPeriod.for_year(2026).default_filename).resolve(),
+        )
+
+    @patch("expense_tracking.render_server.generate_report")
+    def test_outputs_outside_the_output_directory_are_refused(
+        self,
+        generate_mock,
+    ) -> None:
+        escaping = ReportPeriod(
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 31),
+            label="January 2026",
+            default_filename="../escaped.html",
+        )
+        requests = [
+            {"period": ReportPeriod.for_year(2026), "output_path": self.root / "x.html"},
+            {"period": ReportPeriod.for_year(2026), "output_path": Path("/tmp/x.html")},
+            {"period": ReportPeriod.for_year(2026), "output_path": self.output_dir},
+            {"period": escaping},
+        ]
+        for kwargs in requests:
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaisesRegex(ReportGenerationError, "must be inside"):
+                    request_render(socket_path=self.socket_path, **kwargs)
+        generate_mock.assert_not_called()
+
+    def test_malformed_requests_do_not_stop_the_server(self) -> None:
+        for payload in (b"not json\n", b"[]\n", b'{"label": "July"}\n'):
+            with self.subTest(payload=payload):
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                    client.connect(str(self.socket_path))
+                    client.sendall(payload)
+                    response = client.makefile("rb").readline()
+                self.assertIn(b'"ok": false', response)
+
+    @patch("expense_tracking.render_server.generate_report")
+    def test_quarto_jobs_need_a_warm_kernel(self, generate_mock) -> None:
+        with self.assertRaisesRegex(ReportGenerationError, "--quarto"):
+            request_render(
+                period=ReportPeriod.for_year(2026),
+                backend="quarto",
+                socket_path=self.socket_path,
+            )
+        generate_mock.assert_not_called()
+
+    def test_second_server_on_the_same_socket_is_refused(self) -> None:
+        with self.assertRaisesRegex(ReportGenerationError, "already listening"):
+            create_server(self.socket_path)
+
+    def test_unavailable_server_is_a_report_error(self) -> None:
+        with self.assertRaisesRegex(ReportGenerationError, "unavailable"):
+            request_render(
+                period=ReportPeriod.for_range(date(2026, 1, 1), date(2026, 1, 2)),
+                socket_path=self.root / "missing.sock",
+            )
+
+
+class FakeKernel:
+    started = False
+
+    def start(self) -> None:
+        self.started = True
+
+
+class WarmKernelServerTests(unittest.TestCase):
+    @patch("expense_tracking.render_server.generate_report")
+    def test_quarto_jobs_run_in_the_servers_kernel(self, generate_mock) -> None:
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        root = Path(temp_dir.name)
+        kernel = FakeKernel()
+        server = create_server(
+            root / "render.sock",
+            output_dir=root / "output",
+            kernel=kernel,
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        generate_mock.return_value = root / "output" / "report.html"
+
+        self.assertTrue(kernel.started)
+        for backend in ("quarto", "python"):
+            with self.subTest(backend=backend):
+                request_render(
+                    period=ReportPeriod.for_month(2026, 7),
+                    backend=backend,
+                    socket_path=root / "render.sock",
+                )
+                kwargs = generate_mock.call_args.kwargs
+                self.assertEqual(kwargs["backend"], backend)
+                self.assertIs(
+                    kwargs["kernel"],
+                    kernel if backend == "quarto" else None,
+                )
+
+
+class ServerArgumentTests(unittest.TestCase):
+    @patch("scripts.generate_report.generate_report")
+    @patch("scripts.generate_report.request_render")
+    def test_main_submits_jobs_to_the_server(self, request_mock, generate_mock) -> None:
+        request_mock.return_value = Path("/tmp/report.html")
+        with redirect_stdout(io.StringIO()):
+            exit_code = main(["--year", "2026", "--server", "/tmp/render.sock"])
+
+        self.assertEqual(exit_code, 0)
+        generate_mock.assert_not_called()
+        self.assertEqual(
+            request_mock.call_args.kwargs["socket_path"],
+            Path("/tmp/render.sock"),
+        )
+        self.assertEqual(request_mock.call_args.kwargs["backend"], "python")
+
+    @patch("scripts.generate_report.request_render")
+    def test_server_jobs_can_render_with_quarto(self, request_mock) -> None:
+        request_mock.return_value = Path("/tmp/report.html")
+        with redirect_stdout(io.StringIO()):
+            main(["--year", "2026", "--server", "--backend", "quarto"])
+
+        self.assertEqual(request_mock.call_args.kwargs["backend"], "quarto")
+
+    def test_server_jobs_cannot_be_profiled_locally(self) -> None:
+        with self.assertRaises(SystemExit), redirect_stdout(io.StringIO()):
+            with patch("sys.stderr", io.StringIO()):
+                main(["--year", "2026", "--server", "--profile"])
+
+
+if __name__ == "__main__":
+    unittest.main()
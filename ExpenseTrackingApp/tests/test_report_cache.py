@@ -0,0 +1,198 @@
+"""Tests for the rendered report cache."""
+
+from __future__ import annotations
+
+import os
+import unittest
+from datetime import date
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import psycopg
+
+from expense_tracking.errors import ReportGenerationError, ValidationError
+from expense_tracking.report_cache import (
+    ReportCache,
+    report_cache_key,
+    template_digest,
+    template_files,
+)
+from expense_tracking.reports import ReportPeriod, cache_key_for, generate_report
+
+
+def cache_key(**overrides) -> str:
+    values = {
+        "start_date": "2026-07-01",
+        "end_date": "2026-07-31",
+        "label": "July 2026",
+        "database": "expense_tracking_app",
+        "summary_only": False,
+        "backend": "quarto",
+        "template": "template",
+        "data_version": 3,
+    }
+    values.update(overrides)
+    return report_cache_key(**values)
+
+
+class ReportCacheTests(unittest.TestCase):
+    def test_key_changes_with_every_input(self) -> None:
+        self.assertEqual(cache_key(), cache_key())
+        variants = [
+            {"end_date": "2026-07-30"},
+            {"label": "2026-07-01 through 2026-07-31"},
+            {"database": "other_database"},
+            {"summary_only": True},
+            {"backend": "python"},
+            {"template": "edited"},
+            {"data_version": 4},
+        ]
+        for overrides in variants:
+            with self.subTest(overrides=overrides):
+                self.assertNotEqual(cache_key(**overrides), cache_key())
+
+    @patch("expense_tracking.reports.template_digest", return_value="template")
+    @patch("expense_tracking.reports.load_data_version", return_value=3)
+    def test_periods_with_the_same_dates_but_different_titles_differ(
+        self,
+        version_mock,
+        template_mock,
+    ) -> None:
+        month = ReportPeriod.for_month(2026, 3)
+        custom = ReportPeriod.for_range(date(2026, 3, 1), date(2026, 3, 31))
+        options = {"database": "db", "summary_only": False, "backend": "quarto"}
+
+        self.assertEqual(
+            (month.start_date, month.end_date),
+            (custom.start_date, custom.end_date),
+        )
+        self.assertNotEqual(
+            cache_key_for(period=month, **options),
+            cache_key_for(period=custom, **options),
+        )
+
+    def test_template_digest_covers_the_report_sources(self) -> None:
+        names = {path.name for path in template_files()}
+
+        self.assertTrue({"cash_flow.qmd", "_quarto.yml", "cash_flow.html", "charts.py"} <= names)
+        with TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "cash_flow.qmd"
+            source.write_text("first", encoding="utf-8")
+            first = template_digest([source])
+            source.write_text("second", encoding="utf-8")
+            self.assertNotEqual(template_digest([source]), first)
+
+    def test_hits_refresh_recency_and_oldest_entries_are_evicted(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "report.html"
+            source.write_bytes(b"x" * 10)
+            cache = ReportCache(directory=Path(temp_dir) / "cache", max_bytes=25)
+
+            self.assertIsNone(cache.get("first"))
+            first = cache.put("first", source)
+            second = cache.put("second", source)
+            os.utime(first, (1, 1))
+            os.utime(second, (2, 2))
+            self.assertEqual(cache.get("first"), first)
+            cache.put("third", source)
+
+            self.assertTrue(first.is_file())
+            self.assertFalse(second.exists())
+            self.assertEqual(cache.get("third").read_bytes(), b"x" * 10)
+            self.assertEqual(list(cache.directory.glob("*.tmp")), [])
+
+    def test_oversized_new_entry_is_kept(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "report.html"
+            source.write_bytes(b"x" * 10)
+            cache = ReportCache(directory=Path(temp_dir) / "cache", max_bytes=5)
+
+            self.assertTrue(cache.put("large", source).is_file())
+
+    def test_invalid_size_is_rejected(self) -> None:
+        for max_bytes in (0, -1, True, 1.5):
+            with self.subTest(max_bytes=max_bytes):
+                with self.assertRaises(ValidationError):
+                    ReportCache(max_bytes=max_bytes)
+
+
+@patch("expense_tracking.reports.load_data_version")
+@patch("expense_tracking.reports.subprocess.run")
+class CachedGenerationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.period = ReportPeriod.for_month(2026, 7)
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.cache = ReportCache(directory=self.root / "cache")
+
+    def render(self, run_mock, content: str) -> None:
+        def create_rendered(command, **kwargs):
+            filename = command[command.index("--output") + 1]
+            generated = kwargs["cwd"] / "output" / filename
+            generated.parent.mkdir(parents=True, exist_ok=True)
+            generated.write_text(content, encoding="utf-8")
+
+        run_mock.side_effect = create_rendered
+
+    def generate(self, **kwargs) -> Path:
+        return generate_report(
+            period=self.period,
+            database="expense_tracking_app",
+            output_path=self.root / "report.html",
+            quarto="/usr/local/bin/quarto",
+            cache=self.cache,
+            **kwargs,
+        )
+
+    def test_unchanged_data_is_served_from_the_cache(
+        self,
+        run_mock,
+        version_mock,
+    ) -> None:
+        version_mock.return_value = 2
+        self.render(run_mock, "first")
+        self.generate()
+        self.render(run_mock, "second")
+
+        output = self.generate()
+
+        run_mock.assert_called_once()
+        self.assertEqual(output.read_text(encoding="utf-8"), "first")
+        version_mock.assert_called_with("expense_tracking_app")
+
+    def test_changed_data_or_force_renders_again(
+        self,
+        run_mock,
+        version_mock,
+    ) -> None:
+        version_mock.return_value = 2
+        self.render(run_mock, "first")
+        self.generate()
+        version_mock.return_value = 3
+        self.render(run_mock, "second")
+        self.assertEqual(self.generate().read_text(encoding="utf-8"), "second")
+        self.render(run_mock, "third")
+
+        output = self.generate(force=True)
+
+        self.assertEqual(run_mock.call_count, 3)
+        self.assertEqual(output.read_text(encoding="utf-8"), "third")
+        self.render(run_mock, "fourth")
+        self.assertEqual(self.generate().read_text(encoding="utf-8"), "third")
+
+    def test_data_version_failures_are_report_errors(
+        self,
+        run_mock,
+        version_mock,
+    ) -> None:
+        version_mock.side_effect = psycopg.OperationalError("connection refused")
+
+        with self.assertRaisesRegex(ReportGenerationError, "data version"):
+            self.generate()
+        run_mock.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
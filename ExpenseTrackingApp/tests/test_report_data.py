@@ -7,12 +7,21 @@ from datetime import date
 from decimal import Decimal
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from expense_tracking.errors import QueryLoadError
 from expense_tracking.reporting.data import (
+    MONTHLY_TOTALS_QUERY_PATH,
     REPORT_QUERY_PATH,
+    iter_transactions,
+    load_daily_ledger,
+    load_data_version,
+    load_monthly_summaries,
+    load_monthly_totals_query,
     load_report_query,
     load_transactions,
+    load_transactions_async,
+    rollup_parameters,
     transaction_from_row,
 )
 
@@ -32,10 +41,40 @@ class ReportDataTests(unittest.TestCase):
         self.assertIn("%(end_date_exclusive)s", query)
         self.assertIn("ORDER BY", query)
 
-    def test_missing_query_raises_os_error(self) -> None:
+    def test_missing_queries_raise_query_load_error(self) -> None:
         with TemporaryDirectory() as temp_dir:
-            with self.assertRaises(OSError):
-                load_report_query(Path(temp_dir) / "missing.sql")
+            missing = Path(temp_dir) / "missing.sql"
+            for load in (load_report_query, load_monthly_totals_query):
+                with self.subTest(loader=load.__name__):
+                    with self.assertRaises(QueryLoadError):
+                        load(missing)
+
+    @patch("expense_tracking.reporting.data.connection")
+    def test_unreadable_auxiliary_queries_raise_query_load_error(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        with TemporaryDirectory() as temp_dir:
+            missing = Path(temp_dir) / "missing.sql"
+            for name, load in (
+                (
+                    "DAILY_TOTALS_QUERY_PATH",
+                    lambda: load_daily_ledger(
+                        start_date=date(2026, 7, 1),
+                        end_date_exclusive=date(2026, 8, 1),
+                        database="expense_tracking_app",
+                    ),
+                ),
+                (
+                    "DATA_VERSION_QUERY_PATH",
+                    lambda: load_data_version("expense_tracking_app"),
+                ),
+            ):
+                with self.subTest(query=name):
+                    with patch(f"expense_tracking.reporting.data.{name}", missing):
+                        with self.assertRaises(QueryLoadError):
+                            load()
+        connect_mock.assert_not_called()
 
     def test_row_is_converted_to_typed_transaction(self) -> None:
         converted = transaction_from_row(
@@ -51,7 +90,7 @@ class ReportDataTests(unittest.TestCase):
         self.assertEqual(converted.id, 10)
         self.assertEqual(converted.amount, Decimal("18.75"))
 
-    @patch("expense_tracking.reporting.data.psycopg.connect")
+    @patch("expense_tracking.reporting.data.connection")
     def test_load_uses_read_only_connection_and_named_dates(
         self,
         connect_mock: MagicMock,
@@ -76,11 +115,7 @@ class ReportDataTests(unittest.TestCase):
         )
 
         self.assertEqual(len(result), 1)
-        connect_mock.assert_called_once_with(
-            dbname="expense_tracking_app",
-            row_factory=connect_mock.call_args.kwargs["row_factory"],
-            options="-c default_transaction_read_only=on",
-        )
+        connect_mock.assert_called_once_with("expense_tracking_app", read_only=True)
         cursor.execute.assert_called_once_with(
             "SELECT REPORT",
             {
@@ -98,6 +133,243 @@ class ReportDataTests(unittest.TestCase):
                 query="SELECT REPORT",
             )
 
+    @patch("expense_tracking.reporting.data.connection")
+    def test_stream_uses_named_cursor_and_yields_lazily(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        connection = connect_mock.return_value.__enter__.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.__iter__.return_value = iter(
+            [
+                {
+                    "id": index,
+                    "occurred_on": date(2026, 7, index),
+                    "transaction_type": "expense",
+                    "amount": Decimal("18.75"),
+                    "description": "Lunch",
+                }
+                for index in (1, 2)
+            ]
+        )
+
+        stream = iter_transactions(
+            start_date=date(2026, 7, 1),
+            end_date_exclusive=date(2026, 8, 1),
+            database="expense_tracking_app",
+            query="SELECT REPORT",
+            itersize=50,
+        )
+        connect_mock.assert_not_called()
+
+        self.assertEqual(next(stream).id, 1)
+        connect_mock.assert_called_once_with("expense_tracking_app", read_only=True)
+        connection.cursor.assert_called_once_with(name="report_transactions")
+        self.assertEqual(cursor.itersize, 50)
+        self.assertEqual([item.id for item in stream], [2])
+
+    def test_stream_validates_arguments_before_iteration(self) -> None:
+        with self.assertRaisesRegex(ValueError, "exclusive end"):
+            iter_transactions(
+                start_date=date(2026, 7, 1),
+                end_date_exclusive=date(2026, 7, 1),
+                database="expense_tracking_app",
+                query="SELECT REPORT",
+            )
+        for itersize in (0, -5, True, 2.5):
+            with self.subTest(itersize=itersize):
+                with self.assertRaisesRegex(ValueError, "itersize"):
+                    iter_transactions(
+                        start_date=date(2026, 7, 1),
+                        end_date_exclusive=date(2026, 8, 1),
+                        database="expense_tracking_app",
+                        query="SELECT REPORT",
+                        itersize=itersize,
+                    )
+
+    def test_monthly_totals_query_groups_in_postgresql(self) -> None:
+        query = load_monthly_totals_query()
+
+        self.assertEqual(MONTHLY_TOTALS_QUERY_PATH.name, "select_monthly_totals.sql")
+        self.assertIn("date_trunc('month', occurred_on)", query)
+        self.assertIn("GROUP BY", query)
+        self.assertIn("%(end_date_exclusive)s", query)
+
+    @patch("expense_tracking.reporting.data.connection")
+    def test_monthly_summaries_are_zero_filled_from_aggregates(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        connection = connect_mock.return_value.__enter__.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [
+            {
+                "month": date(2026, 1, 1),
+                "transaction_type": "expense",
+                "amount": Decimal("18.75"),
+            },
+            {
+                "month": date(2026, 3, 1),
+                "transaction_type": "income",
+                "amount": Decimal("2500.00"),
+            },
+        ]
+
+        monthly = load_monthly_summaries(
+            start_date=date(2026, 1, 15),
+            end_date_exclusive=date(2026, 4, 1),
+            database="expense_tracking_app",
+            query="SELECT TOTALS",
+        )
+
+        connect_mock.assert_called_once_with("expense_tracking_app", read_only=True)
+        self.assertEqual(
+            [item.month for item in monthly],
+            [date(2026, 1, 1), date(2026, 2, 1), date(2026, 3, 1)],
+        )
+        self.assertEqual(monthly[0].expenses, Decimal("18.75"))
+        self.assertEqual(monthly[1].net_cash_flow, Decimal("0.00"))
+        self.assertEqual(monthly[2].income, Decimal("2500.00"))
+
+    @patch("expense_tracking.reporting.data.connection")
+    def test_monthly_summaries_can_read_the_rollup_table(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        connection = connect_mock.return_value.__enter__.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = []
+
+        load_monthly_summaries(
+            start_date=date(2026, 1, 1),
+            end_date_exclusive=date(2027, 1, 1),
+            database="expense_tracking_app",
+            use_rollup=True,
+        )
+
+        executed_query, parameters = cursor.execute.call_args.args
+        self.assertIn("public.transaction_monthly_totals", executed_query)
+        self.assertIn("occurred_on < %(full_start)s", executed_query)
+        self.assertIn("occurred_on >= %(full_end)s", executed_query)
+        self.assertNotIn("NOT (", executed_query)
+        self.assertEqual(
+            (parameters["full_start"], parameters["full_end"]),
+            (date(2026, 1, 1), date(2027, 1, 1)),
+        )
+
+    def test_rollup_parameters_bound_only_the_partial_edges(self) -> None:
+        cases = [
+            (date(2026, 1, 15), date(2026, 4, 10), date(2026, 2, 1), date(2026, 4, 1)),
+            (date(2026, 12, 31), date(2027, 3, 1), date(2027, 1, 1), date(2027, 3, 1)),
+            (date(2026, 1, 15), date(2026, 2, 10), date(2026, 2, 10), date(2026, 2, 10)),
+            (date(2026, 1, 1), date(2026, 1, 20), date(2026, 1, 20), date(2026, 1, 20)),
+        ]
+        for start, end_exclusive, full_start, full_end in cases:
+            with self.subTest(start=start, end_exclusive=end_exclusive):
+                parameters = rollup_parameters(
+                    start_date=start,
+                    end_date_exclusive=end_exclusive,
+                )
+                self.assertEqual(parameters["full_start"], full_start)
+                self.assertEqual(parameters["full_end"], full_end)
+
+    @patch("expense_tracking.reporting.data.connection")
+    def test_daily_ledger_is_built_from_daily_aggregates(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        connection = connect_mock.return_value.__enter__.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [
+            {
+                "occurred_on": date(2026, 1, 3),
+                "transaction_type": "expense",
+                "amount": Decimal("18.75"),
+            },
+            {
+                "occurred_on": date(2026, 1, 20),
+                "transaction_type": "income",
+                "amount": Decimal("2500.00"),
+            },
+        ]
+
+        ledger = load_daily_ledger(
+            start_date=date(2026, 1, 1),
+            end_date_exclusive=date(2026, 2, 1),
+            database="expense_tracking_app",
+        )
+
+        connect_mock.assert_called_once_with("expense_tracking_app", read_only=True)
+        executed_query = cursor.execute.call_args.args[0]
+        self.assertIn("GROUP BY", executed_query)
+        self.assertEqual(ledger.end_date, date(2026, 1, 31))
+        summary = ledger.summary(date(2026, 1, 4), date(2026, 1, 31))
+        self.assertEqual(summary.income, Decimal("2500.00"))
+        self.assertEqual(summary.expenses, Decimal("0.00"))
+
+    @patch("expense_tracking.reporting.data.connection")
+    def test_data_version_is_one_row_lookup(self, connect_mock: MagicMock) -> None:
+        connection = connect_mock.return_value.__enter__.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = {"version": 12}
+
+        self.assertEqual(load_data_version("expense_tracking_app"), 12)
+        connect_mock.assert_called_once_with("expense_tracking_app", read_only=True)
+        self.assertIn(
+            "FROM public.transaction_data_version",
+            cursor.execute.call_args.args[0],
+        )
+
+        cursor.fetchone.return_value = None
+        self.assertEqual(load_data_version("expense_tracking_app"), 0)
+
+
+class AsyncReportDataTests(unittest.IsolatedAsyncioTestCase):
+    @patch("expense_tracking.reporting.data.async_connection")
+    async def test_async_load_uses_read_only_connection(
+        self,
+        connect_mock: MagicMock,
+    ) -> None:
+        connection = connect_mock.return_value.__aenter__.return_value
+        cursor = AsyncMock()
+        connection.cursor = MagicMock()
+        connection.cursor.return_value.__aenter__.return_value = cursor
+        cursor.fetchall.return_value = [
+            {
+                "id": 10,
+                "occurred_on": date(2026, 7, 1),
+                "transaction_type": "expense",
+                "amount": Decimal("18.75"),
+                "description": "Lunch",
+            }
+        ]
+
+        result = await load_transactions_async(
+            start_date=date(2026, 7, 1),
+            end_date_exclusive=date(2026, 8, 1),
+            database="expense_tracking_app",
+            query="SELECT REPORT",
+        )
+
+        self.assertEqual([item.id for item in result], [10])
+        connect_mock.assert_called_once_with("expense_tracking_app", read_only=True)
+        cursor.execute.assert_awaited_once_with(
+            "SELECT REPORT",
+            {
+                "start_date": date(2026, 7, 1),
+                "end_date_exclusive": date(2026, 8, 1),
+            },
+        )
+
+    async def test_async_load_rejects_invalid_range(self) -> None:
+        with self.assertRaisesRegex(ValueError, "exclusive end"):
+            await load_transactions_async(
+                start_date=date(2026, 7, 1),
+                end_date_exclusive=date(2026, 6, 1),
+                database="expense_tracking_app",
+                query="SELECT REPORT",
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+"""Tests for ranked transaction description search."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import psycopg
+
+from expense_tracking.config import SEARCH_QUERY_PATH
+from expense_tracking.errors import DatabaseError, ValidationError
+from expense_tracking.reporting.cash_flow import ReportTransaction
+from expense_tracking.reports import ReportPeriod
+from expense_tracking.search import like_pattern, search_transactions
+
+
+def search_row(transaction_id: int, description: str) -> dict[str, object]:
+    return {
+        "id": transaction_id,
+        "occurred_on": date(2026, 3, transaction_id),
+        "transaction_type": "expense",
+        "amount": Decimal("84.10"),
+        "description": description,
+    }
+
+
+class LikePatternTests(unittest.TestCase):
+    def test_wildcards_in_the_search_text_are_literal(self) -> None:
+        self.assertEqual(like_pattern("costco"), "%costco%")
+        self.assertEqual(like_pattern("50% off_sale"), "%50\\% off\\_sale%")
+        self.assertEqual(like_pattern("a\\b"), "%a\\\\b%")
+
+
+@patch("expense_tracking.search.connection")
+class SearchTransactionsTests(unittest.TestCase):
+    def cursor(self, connect_mock: MagicMock) -> MagicMock:
+        connection = connect_mock.return_value.__enter__.return_value
+        return connection.cursor.return_value.__enter__.return_value
+
+    def test_returns_ranked_report_transactions(self, connect_mock) -> None:
+        cursor = self.cursor(connect_mock)
+        cursor.fetchall.return_value = [
+            search_row(4, "Costco Wholesale"),
+            search_row(2, "Cosco gas"),
+        ]
+
+        results = search_transactions(
+            "  Costco   Wholesale ",
+            limit=10,
+            database="expense_tracking_app",
+        )
+
+        connect_mock.assert_called_once_with("expense_tracking_app", read_only=True)
+        query, parameters = cursor.execute.call_args.args
+        self.assertEqual(query, SEARCH_QUERY_PATH.read_text(encoding="utf-8"))
+        self.assertIn("ORDER BY\n    %(query)s <<-> description,", query)
+        self.assertEqual(
+            parameters,
+            {
+                "query": "Costco Wholesale",
+                "pattern": "%Costco Wholesale%",
+                "start_date": date.min,
+                "end_date": date.max,
+                "limit": 10,
+            },
+        )
+        self.assertEqual(
+            results[0],
+            ReportTransaction(
+                id=4,
+                occurred_on=date(2026, 3, 4),
+                transaction_type="expense",
+                amount=Decimal("84.10"),
+                description="Costco Wholesale",
+            ),
+        )
+        self.assertEqual([result.id for result in results], [4, 2])
+
+    def test_period_bounds_the_dates(self, connect_mock) -> None:
+        cursor = self.cursor(connect_mock)
+        cursor.fetchall.return_value = []
+
+        results = search_transactions(
+            "costco",
+            ReportPeriod.for_month(2026, 2),
+            database="expense_tracking_app",
+        )
+
+        parameters = cursor.execute.call_args.args[1]
+        self.assertEqual(parameters["start_date"], date(2026, 2, 1))
+        self.assertEqual(parameters["end_date"], date(2026, 2, 28))
+        self.assertEqual(parameters["limit"], 50)
+        self.assertEqual(results, ())
+
+    def test_invalid_arguments_and_database_errors(self, connect_mock) -> None:
+        invalid = [
+            {"query": "   "},
+            {"query": None},
+            {"query": "x" * 201},
+            {"query": "costco", "limit": 0},
+            {"query": "costco", "limit": 501},
+            {"query": "costco", "limit": True},
+        ]
+        for kwargs in invalid:
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValidationError):
+                search_transactions(database="db", **kwargs)
+        connect_mock.assert_not_called()
+
+        connect_mock.side_effect = psycopg.OperationalError("no server\ndetails")
+        with self.assertRaisesRegex(DatabaseError, "^no server$"):
+            search_transactions("costco", database="db")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""Tests for report timing spans."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from expense_tracking.timing import (
+    Span,
+    adopt_spans,
+    emit_timings,
+    format_phase_table,
+    read_spans,
+    record_timings,
+    span,
+    summarize_spans,
+    timed,
+    timings_enabled,
+)
+
+
+@timed("double")
+def double(value: int) -> int:
+    return value * 2
+
+
+class SpanTests(unittest.TestCase):
+    def test_spans_are_not_recorded_without_a_recorder(self) -> None:
+        self.assertFalse(timings_enabled())
+        with span("outer"):
+            self.assertEqual(double(2), 4)
+        with record_timings() as spans:
+            pass
+        self.assertEqual(spans, [])
+
+    def test_nested_spans_record_parent_and_depth(self) -> None:
+        with record_timings() as spans:
+            with span("outer"):
+                double(1)
+                with span("inner"):
+                    double(2)
+
+        self.assertEqual(
+            [(item.name, item.parent, item.depth) for item in spans],
+            [
+                ("double", "outer", 1),
+                ("double", "inner", 2),
+                ("inner", "outer", 1),
+                ("outer", None, 0),
+            ],
+        )
+        self.assertTrue(all(item.seconds >= 0 for item in spans))
+
+    def test_span_is_recorded_when_the_block_raises(self) -> None:
+        with record_timings() as spans:
+            with self.assertRaises(ValueError), span("failing"):
+                raise ValueError("boom")
+
+        self.assertEqual([item.name for item in spans], ["failing"])
+
+    def test_copied_contexts_report_from_worker_threads(self) -> None:
+        with record_timings() as spans, span("batch"):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(copy_context().run, double, value)
+                    for value in range(3)
+                ]
+                self.assertEqual([future.result() for future in futures], [0, 2, 4])
+
+        self.assertEqual(
+            sorted((item.name, item.parent) for item in spans),
+            [("batch", None), *[("double", "batch")] * 3],
+        )
+
+    def test_json_sink_round_trips_and_nests_under_current_span(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "timings.jsonl"
+            emit_timings(path)
+            try:
+                with span("kernel"):
+                    double(3)
+            finally:
+                emit_timings(None)
+
+            lines = path.read_text(encoding="utf-8").splitlines()
+            emitted = read_spans(path)
+
+        self.assertEqual(json.loads(lines[0])["name"], "double")
+        self.assertEqual(
+            [(item.name, item.parent, item.depth) for item in emitted],
+            [("double", "kernel", 1), ("kernel", None, 0)],
+        )
+        with record_timings() as spans, span("render"):
+            adopt_spans(emitted)
+
+        self.assertEqual(
+            [(item.name, item.parent, item.depth) for item in spans],
+            [("double", "kernel", 2), ("kernel", "render", 1), ("render", None, 0)],
+        )
+
+
+class PhaseTableTests(unittest.TestCase):
+    def test_phases_are_aggregated_into_a_tree(self) -> None:
+        spans = [
+            Span("charts", 0.5, parent="render", depth=1),
+            Span("tables", 1.0, parent="render", depth=1),
+            Span("charts", 0.25, parent="render", depth=1),
+            Span("render", 2.0),
+            Span("fingerprint", 0.5),
+        ]
+
+        phases = summarize_spans(spans)
+        table = format_phase_table(spans)
+
+        self.assertEqual(
+            [(phase.name, phase.calls, phase.seconds, phase.depth) for phase in phases],
+            [
+                ("render", 1, 2.0, 0),
+                ("tables", 1, 1.0, 1),
+                ("charts", 2, 0.75, 1),
+                ("fingerprint", 1, 0.5, 0),
+            ],
+        )
+        lines = table.splitlines()
+        self.assertTrue(lines[0].startswith("Phase"))
+        self.assertTrue(lines[1].startswith("render"))
+        self.assertIn("80.0%", lines[1])
+        self.assertTrue(lines[3].startswith("  charts"))
+        self.assertIn("    2", lines[3])
+
+
+if __name__ == "__main__":
+    unittest.main()